@@ -5,7 +5,6 @@ Main application entry point for the Bribery game server
 
 import os
 import sys
-import threading
 from pathlib import Path
 
 # Add src to path so we can import our modules
@@ -13,7 +12,7 @@ src_path = Path(__file__).parent / 'src'
 sys.path.insert(0, str(src_path))
 
 from web import create_app
-from web.socket_handlers import get_game_manager
+from web.socket_handlers import get_game_manager, get_scheduler
 
 
 def cleanup_games():
@@ -21,8 +20,8 @@ def cleanup_games():
     game_manager = get_game_manager()
     if game_manager:
         game_manager.cleanup_empty_games()
-    # Schedule next cleanup
-    threading.Timer(300.0, cleanup_games).start()  # Every 5 minutes
+    # Schedule next cleanup on the shared deadline scheduler
+    get_scheduler().call_later(300.0, cleanup_games)  # Every 5 minutes
 
 
 def start_cleanup_timer():
@@ -35,8 +35,7 @@ if web_init_file.exists():
     try:
         # Import from our refactored structure
         from web import create_app
-        from web.socket_handlers import get_game_manager
-        import threading
+        from web.socket_handlers import get_game_manager, get_scheduler
         print("✅ Successfully imported web modules")
         
     except ImportError as e:
@@ -71,8 +70,8 @@ def cleanup_games():
     game_manager = get_game_manager()
     if game_manager:
         game_manager.cleanup_empty_games()
-    # Schedule next cleanup
-    threading.Timer(300.0, cleanup_games).start()  # Every 5 minutes
+    # Schedule next cleanup on the shared deadline scheduler
+    get_scheduler().call_later(300.0, cleanup_games)  # Every 5 minutes
 
 
 def start_cleanup_timer():
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark round pairing generation for large lobbies.
+
+Runs Game.generate_round_pairings for a range of player counts, checks that
+every pairing is valid (2 bribes out, 2 in, no self-targets) and prints the
+average time per round.
+
+Usage:
+    py scripts\\benchmark_pairings.py
+    py scripts\\benchmark_pairings.py --rounds 20 --sizes 10 100 1000 5000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from game import Game  # noqa: E402
+
+
+def check_pairings(pairings, player_ids):
+    """Raise if any player does not bribe 2 others and receive 2 bribes"""
+    received = dict.fromkeys(player_ids, 0)
+    for player_id, targets in pairings.items():
+        if len(set(targets)) != 2 or player_id in targets:
+            raise AssertionError(f"Invalid targets for {player_id}: {targets}")
+        for target in targets:
+            received[target] += 1
+    if any(count != 2 for count in received.values()):
+        raise AssertionError("Some players do not receive exactly 2 bribes")
+
+
+def benchmark(player_count, rounds):
+    """Return the average seconds per round for one game of this size"""
+    game = Game("BENCH", "p0", {'rounds': rounds})
+    for i in range(player_count):
+        game.add_player(f"p{i}", f"Player {i}")
+    player_ids = list(game.players)
+
+    elapsed = 0.0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        pairings = game.generate_round_pairings()
+        elapsed += time.perf_counter() - start
+        check_pairings(pairings, player_ids)
+    return elapsed / rounds
+
+
+def main():
+    """Main function to run the benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark round pairing generation")
+    parser.add_argument('--rounds', type=int, default=10, help="rounds per game")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[3, 10, 100, 1000, 2500, 5000, 10000],
+                        help="player counts to benchmark")
+    args = parser.parse_args()
+
+    print(f"{'players':>8}  {'ms/round':>10}  {'us/player':>10}")
+    for player_count in args.sizes:
+        per_round = benchmark(player_count, args.rounds)
+        print(f"{player_count:>8}  {per_round * 1000:>10.3f}  {per_round * 1e6 / player_count:>10.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,8 +2,22 @@
 Game logic package for the Bribery game
 """
 
+from .actor import GameActor
+from .ballot import Ballot
+from .code_allocator import CodeAllocator
 from .game import Game
 from .game_manager import GameManager
+from .hibernation import Hibernator
+from .leaderboard import Leaderboard
+from .memory import MemoryBudget
+from .player import Player
 from .player_session import PlayerSession
+from .progress_coalescer import ProgressCoalescer
+from .retention import RetentionPolicy
+from .roster import LobbyRoster
+from .round_state import RoundState
+from .scheduler import DeadlineScheduler, VirtualScheduler
 
-__all__ = ['Game', 'GameManager', 'PlayerSession']
+__all__ = ['Ballot', 'CodeAllocator', 'DeadlineScheduler', 'Game', 'GameActor', 'GameManager',
+           'Hibernator', 'Leaderboard', 'LobbyRoster', 'MemoryBudget', 'Player', 'PlayerSession',
+           'ProgressCoalescer', 'RetentionPolicy', 'RoundState', 'VirtualScheduler']
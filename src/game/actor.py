@@ -0,0 +1,106 @@
+"""
+GameActor class serializing every change made to a single game
+"""
+
+import contextvars
+import threading
+from collections import deque
+from typing import Callable, Deque, FrozenSet
+
+# Actors held by the running task. Context variables are per thread and,
+# with greenlet 1.0 or later, per greenlet, so this tells apart handlers
+# sharing one OS thread on an eventlet or gevent hub
+_held: contextvars.ContextVar[FrozenSet['GameActor']] = contextvars.ContextVar(
+    'held_game_actors', default=frozenset())
+
+# Builds the event a waiting caller blocks on, see set_event_factory()
+_make_event: Callable = threading.Event
+
+
+def set_event_factory(factory: Callable):
+    """Make waiting callers block on events from factory
+
+    Pass the async server's event type, e.g. socketio.server.eio.create_event,
+    so a waiting handler yields to the hub instead of blocking its thread.
+    """
+    global _make_event
+    _make_event = factory
+
+
+class GameActor:
+    """Runs commands for one game one at a time, in the order they arrive
+
+    Socket handlers, timer callbacks and host actions all call run(). A
+    caller that finds the actor busy queues an event and waits on it, and
+    each command hands the actor straight to the next waiter when it ends.
+    Commands run on the caller's own task so Flask-SocketIO's per-request
+    emit() still answers the right client. A command that issues further
+    commands for the same game (e.g. the last vote ending the voting phase)
+    runs them inline; that is decided by the running task, not the thread
+    id, which unpatched greenlets all share. Each game has its own actor,
+    so games never wait on each other.
+    """
+
+    __slots__ = ('_lock', '_busy', '_waiters', '_pending')
+
+    def __init__(self):
+        # Only held for bookkeeping, never while a command runs
+        self._lock = threading.Lock()
+        self._busy = False
+        self._waiters: Deque = deque()
+        self._pending = 0
+
+    def run(self, command: Callable, *args, **kwargs):
+        """Run a command once all earlier commands for this game have finished"""
+        held = _held.get()
+        if self in held:
+            return command(*args, **kwargs)
+
+        with self._lock:
+            self._pending += 1
+            event = None
+            if self._busy:
+                event = _make_event()
+                self._waiters.append(event)
+            else:
+                self._busy = True
+        if event is not None:
+            self._wait_for_turn(event)
+
+        token = _held.set(held | {self})
+        try:
+            return command(*args, **kwargs)
+        finally:
+            _held.reset(token)
+            self._release()
+
+    def _wait_for_turn(self, event):
+        try:
+            event.wait()
+        except BaseException:
+            with self._lock:
+                if event in self._waiters:
+                    # Still queued, give up the place
+                    self._waiters.remove(event)
+                    self._pending -= 1
+                    raise
+            # The actor was handed over just as the wait failed, pass it on
+            self._release()
+            raise
+
+    def _release(self):
+        with self._lock:
+            self._pending -= 1
+            if self._waiters:
+                # Ownership goes straight to the next caller in line
+                self._waiters.popleft().set()
+            else:
+                self._busy = False
+
+    @property
+    def pending(self) -> int:
+        """Number of commands running or waiting to run"""
+        return self._pending
+
+    def __repr__(self):
+        return f"GameActor(pending={self.pending})"
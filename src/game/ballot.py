@@ -0,0 +1,98 @@
+"""
+Ballot class holding the bribes a player may vote for in a round
+"""
+
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+
+class BallotOption(NamedTuple):
+    """One bribe a voter can choose"""
+    bribe_id: str
+    submitter_id: str
+    target_id: str
+    content: str
+    type: str
+    is_random: bool
+    # Points the submitter earns if this option is chosen
+    points: float
+
+
+class Ballot:
+    """Read-only set of options for one voter, fixed when voting opens
+
+    The same object backs the voting_phase payload, vote validation,
+    reconnect replay and scoring, so bribes are only scanned once per round.
+    """
+
+    __slots__ = ('_voter_id', '_options', '_order', '_payload')
+
+    def __init__(self, voter_id: str, options: List[BallotOption]):
+        self._voter_id = voter_id
+        self._options: Dict[str, BallotOption] = {option.bribe_id: option for option in options}
+        self._order = tuple(self._options)
+        # Clients see each option by its number on the ballot, starting at 1,
+        # so the payload names neither the submitter nor the voter.
+        # Don't add the "(randomly generated)" indicator during voting phase,
+        # players shouldn't know which bribes are random until afterwards
+        self._payload = tuple({
+            'id': number,
+            'content': option.content,
+            'type': option.type,
+            'is_random': option.is_random
+        } for number, option in enumerate(options, 1))
+
+    @classmethod
+    def build(cls, voter_id: str, bribes: Dict[str, dict]) -> 'Ballot':
+        """Build a ballot from {submitter_id: submission} sent to the voter"""
+        options = []
+        for submitter_id, bribe in bribes.items():
+            # Players never vote on their own bribes
+            if submitter_id == voter_id:
+                continue
+            is_random = bribe.get('is_random', False)
+            options.append(BallotOption(
+                bribe_id=f"{submitter_id}_{voter_id}",
+                submitter_id=submitter_id,
+                target_id=voter_id,
+                content=bribe.get('content', ''),
+                type=bribe.get('type', 'text'),
+                is_random=is_random,
+                # Award half a point for randomly generated bribes
+                points=0.5 if is_random else 1
+            ))
+        return cls(voter_id, options)
+
+    @property
+    def voter_id(self) -> str:
+        return self._voter_id
+
+    def get(self, bribe_id: str) -> Optional[BallotOption]:
+        """Get the option for a bribe ID, or None if it is not on this ballot"""
+        return self._options.get(bribe_id)
+
+    def resolve(self, choice) -> Optional[str]:
+        """Get the bribe ID for an option number from the client, or None
+
+        Bribe IDs are accepted as well and returned if they are on the ballot.
+        """
+        if isinstance(choice, bool):
+            return None
+        if isinstance(choice, int):
+            return self._order[choice - 1] if 1 <= choice <= len(self._order) else None
+        return choice if choice in self._options else None
+
+    def to_payload(self) -> List[dict]:
+        """Get the options as sent to the client in voting_phase"""
+        return list(self._payload)
+
+    def __contains__(self, bribe_id) -> bool:
+        return bribe_id in self._options
+
+    def __iter__(self) -> Iterator[BallotOption]:
+        return iter(self._options.values())
+
+    def __len__(self) -> int:
+        return len(self._options)
+
+    def __repr__(self):
+        return f"Ballot(voter='{self._voter_id}', options={list(self._options)})"
@@ -0,0 +1,133 @@
+"""
+CodeAllocator class handing out short, unique game codes
+"""
+
+import math
+import random
+import string
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Iterable, List, Set, Tuple
+
+# Characters used in game codes
+CODE_ALPHABET = string.ascii_uppercase + string.digits
+DEFAULT_CODE_LENGTH = 4
+# Seconds a released code rests before it can be handed out again, so
+# players with an old link are not dropped into somebody else's game
+DEFAULT_RELEASE_COOLDOWN = 600
+# How many fresh codes are drawn and shuffled at a time
+FRESH_BLOCK_SIZE = 1024
+
+
+def canonical_code(code: str) -> str:
+    """Normalize a game code as typed by a player"""
+    return code.strip().upper()
+
+
+class CodeAllocator:
+    """Allocates game codes in O(1) however many games are live
+
+    Fresh codes come from a random permutation of the whole code space,
+    walked a block at a time and shuffled within each block, so codes stay
+    unpredictable without ever retrying on collision or holding the full
+    space in memory. Released codes rest for a cooldown and are handed out
+    again once the fresh codes run out.
+    """
+
+    def __init__(self, length: int = DEFAULT_CODE_LENGTH, alphabet: str = CODE_ALPHABET,
+                 reserved: Iterable[str] = (), cooldown: float = DEFAULT_RELEASE_COOLDOWN,
+                 clock: Callable[[], float] = time.monotonic):
+        if length < 1:
+            raise ValueError("Game codes need at least one character")
+        self.length = length
+        self.alphabet = alphabet
+        self.cooldown = cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._reserved: Set[str] = {canonical_code(code) for code in reserved}
+        self._in_use: Set[str] = set()
+
+        # Random affine permutation i -> (a * i + b) mod size of the code space
+        self._space = len(alphabet) ** length
+        multiplier = random.randrange(1, self._space) if self._space > 1 else 1
+        while math.gcd(multiplier, self._space) != 1:
+            multiplier = random.randrange(1, self._space)
+        self._multiplier = multiplier
+        self._offset = random.randrange(self._space)
+        self._cursor = 0
+        self._fresh: List[str] = []
+
+        # (ready_at, code) in release order, and codes whose cooldown is over
+        self._cooling: Deque[Tuple[float, str]] = deque()
+        self._recycled: List[str] = []
+
+    def _encode(self, index: int) -> str:
+        base = len(self.alphabet)
+        chars = []
+        for _ in range(self.length):
+            index, digit = divmod(index, base)
+            chars.append(self.alphabet[digit])
+        return ''.join(chars)
+
+    def _refill_fresh(self):
+        end = min(self._cursor + FRESH_BLOCK_SIZE, self._space)
+        self._fresh = [self._encode((self._multiplier * i + self._offset) % self._space)
+                       for i in range(self._cursor, end)]
+        random.shuffle(self._fresh)
+        self._cursor = end
+
+    def _next_candidate(self):
+        now = self._clock()
+        while self._cooling and self._cooling[0][0] <= now:
+            self._recycled.append(self._cooling.popleft()[1])
+        if not self._fresh and self._cursor < self._space:
+            self._refill_fresh()
+        if self._fresh:
+            return self._fresh.pop()
+        if self._recycled:
+            return self._recycled.pop()
+        return None
+
+    def allocate(self) -> str:
+        """Get an unused code, raises RuntimeError if every code is taken"""
+        with self._lock:
+            while True:
+                code = self._next_candidate()
+                if code is None:
+                    raise RuntimeError("No game codes available")
+                # Skip codes that are reserved or were claimed directly
+                if code not in self._reserved and code not in self._in_use:
+                    self._in_use.add(code)
+                    return code
+
+    def claim(self, code: str) -> bool:
+        """Mark a code chosen elsewhere as in use, returns False if it already was"""
+        code = canonical_code(code)
+        with self._lock:
+            if code in self._in_use:
+                return False
+            self._in_use.add(code)
+            return True
+
+    def release(self, code: str):
+        """Return a code to the pool once its cooldown has passed"""
+        code = canonical_code(code)
+        with self._lock:
+            if code not in self._in_use:
+                return
+            self._in_use.discard(code)
+            if len(code) == self.length and code not in self._reserved:
+                self._cooling.append((self._clock() + self.cooldown, code))
+
+    def reserve(self, code: str):
+        """Never hand out this code"""
+        with self._lock:
+            self._reserved.add(canonical_code(code))
+
+    def is_in_use(self, code: str) -> bool:
+        return canonical_code(code) in self._in_use
+
+    def __len__(self) -> int:
+        """Number of codes currently in use"""
+        return len(self._in_use)
@@ -2,71 +2,260 @@
 Game class representing a single game instance with isolated state
 """
 
-import random
-import threading
 import time
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Set
+
+from .actor import GameActor
+from .leaderboard import Leaderboard
+from .memory import MemoryBudget, get_default_budget, player_size, prompt_size, submission_size
+from .pairing import PairingEngine
+from .phase_tracker import PhaseTracker
+from .player import Player
+from .progress_coalescer import ProgressCoalescer
+from .retention import RetentionPolicy, get_default_policy
+from .roster import LobbyRoster
+from .round_state import RoundFieldView, RoundState
+from .scheduler import DeadlineScheduler, ScheduledCall
+
+
+def normalize_username(username: str) -> str:
+    """Normalize a username for case-insensitive matching"""
+    return username.strip().casefold()
+
+
+class ActivePlayerView:
+    """Read-only, ordered view of the player IDs active in the current round
+
+    Membership and length are O(1). Iteration works on a snapshot so callers
+    can safely emit to players while others join or disconnect.
+    """
+
+    __slots__ = ('_ids',)
+
+    def __init__(self, ids: Dict[str, None]):
+        self._ids = ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, player_id) -> bool:
+        return player_id in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(tuple(self._ids))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ActivePlayerView):
+            return list(self._ids) == list(other._ids)
+        if isinstance(other, (list, tuple)):
+            return list(self._ids) == list(other)
+        return NotImplemented
+
+    def copy(self) -> List[str]:
+        """Return a plain list snapshot of the active player IDs"""
+        return list(self._ids)
+
+    def __repr__(self):
+        return f"ActivePlayerView({list(self._ids)!r})"
+
+
+def _round_field(field: str, doc: str) -> property:
+    """Build a read-only legacy {round: data} attribute backed by RoundState objects"""
+    def getter(self) -> RoundFieldView:
+        return RoundFieldView(self, field)
+
+    return property(getter, doc=doc)
 
 
 class Game:
     """Represents a single game instance with isolated state"""
 
-    def __init__(self, game_id: str, host_id: str, settings: dict):
+    # Legacy read-only per-round mappings, kept for callers that index by round number
+    bribes = _round_field('submissions', "{round: {player_id: {target_id: submission}}}")
+    votes = _round_field('votes', "{round: {player_id: chosen_bribe_id}}")
+    round_pairings = _round_field('pairings', "{round: {player_id: [target1, target2]}}")
+    player_prompts = _round_field('prompts', "{round: {player_id: chosen_prompt}}")
+    player_prompt_ready = _round_field('prompt_ready', "{round: {player_id: ready_status}}")
+    voted_players = _round_field('voted_players', "{round: {player_ids who voted}}")
+
+    def __init__(self, game_id: str, host_id: str, settings: dict,
+                 retention: Optional[RetentionPolicy] = None,
+                 scheduler: Optional[DeadlineScheduler] = None,
+                 clock: Optional[Callable[[], float]] = None,
+                 memory_budget: Optional[MemoryBudget] = None):
         self.game_id = game_id
         self.host_id = host_id
-        self.players: Dict[str, dict] = {}
+        # Approximate bytes held by this game's players, bribes and prompts
+        self.memory = (memory_budget if memory_budget is not None else get_default_budget()).meter()
+        self.players: Dict[str, Player] = {}
+        # Running totals maintained by Player status changes
+        self._connected_count = 0
+        self._active_count = 0
+        # Ordered set (dict keys) of active player IDs, in activation order
+        self._active_ids: Dict[str, None] = {}
+        self._active_view = ActivePlayerView(self._active_ids)
+        # Normalized username -> ordered set (dict keys) of player IDs using it
+        self._username_index: Dict[str, Dict[str, None]] = {}
+        # Small integer standing in for each player ID on the wire, never reused
+        self._handles: Dict[str, int] = {}
+        self._handle_ids: Dict[int, str] = {}
+        self._next_handle = 1
         self.state = "lobby"  # lobby, prompt_selection, submission, voting, scoreboard, finished
         self.current_round = 0
         self.settings = settings
-        self.round_timer: Optional[threading.Timer] = None
-        # {round: {player_id: {target_id: submission}}}
-        self.bribes: Dict[int, Dict[str, Dict[str, dict]]] = {}
-        # {round: {player_id: chosen_bribe_id}}
-        self.votes: Dict[int, Dict[str, str]] = {}
-        self.scores: Dict[str, int] = {}  # {player_id: total_score}
+        # Runs this game's phase deadlines; None uses the server-wide scheduler
+        self.scheduler = scheduler
+        self.clock = clock or time.time
+        # Handle for the pending phase deadline, see DeadlineScheduler
+        self.round_timer: Optional[ScheduledCall] = None
+        # Bumped on every phase transition; a scheduled or triggered transition
+        # carries the generation it expects and is dropped if it has moved on
+        self.phase_generation = 0
+        # Serializes every change to this game, see GameActor
+        self.actor = GameActor()
+        # Lobby as last sent to clients, published as versioned patches
+        self.roster = LobbyRoster()
+        # Rate limits room-wide progress broadcasts
+        self.progress_coalescer = ProgressCoalescer()
+        # Data for the round in progress, and for rounds already played
+        self.current: Optional[RoundState] = None
+        self.past_rounds: List[RoundState] = []
+        # Decides how many finished rounds keep their bribe content in memory
+        self.retention = retention or get_default_policy()
+        self._scores = Leaderboard()  # {player_id: total_score}, kept ranked
         self.current_prompt = ""
-        # {round: {player_id: [target1, target2]}}
-        self.round_pairings: Dict[int, Dict[str, List[str]]] = {}
-        # {round: {player_id: chosen_prompt}}
-        self.player_prompts: Dict[int, Dict[str, str]] = {}
-        # {round: {player_id: ready_status}}
-        self.player_prompt_ready: Dict[int, Dict[str, bool]] = {}
-        # {player_id: [bribed_player_ids]}
-        self.past_bribe_targets: Dict[str, List[str]] = {}
-        self.created_at = time.time()
+        # {player_id: {bribed_player_ids}}
+        self.past_bribe_targets: Dict[str, Set[str]] = {}
+        self._pairing_engine = PairingEngine()
+        self.created_at = self.clock()
+        # When the last connected player left, None while anyone is connected
+        self.idle_since: Optional[float] = self.created_at
+        # Called with the game whenever it empties or someone reconnects to
+        # it, see GameManager
+        self.on_idle_change: Optional[Callable[['Game'], None]] = None
 
     def add_player(self, player_id: str, username: str):
         """Add a player to this game"""
-        self.players[player_id] = {
-            'username': username,
-            'connected': True,
-            'ready': False,
-            'active_in_round': self.state == "lobby"  # Only active if joining during lobby
-        }
+        previous = self.players.get(player_id)
+        if previous is not None:
+            previous.detach()
+        # Only active if joining during lobby
+        self.players[player_id] = Player(player_id, username, self, active_in_round=self.state == "lobby")
         self.scores[player_id] = 0
-        self.past_bribe_targets[player_id] = []
+        self.past_bribe_targets[player_id] = set()
+        if player_id not in self._handles:
+            self._assign_handle(player_id)
 
     def remove_player(self, player_id: str):
         """Remove a player from this game"""
-        if player_id in self.players:
-            del self.players[player_id]
+        player = self.players.pop(player_id, None)
+        if player is not None:
+            player.detach()
+        if self.current is not None:
+            self.current.forget_player(player_id)
         if player_id in self.scores:
             del self.scores[player_id]
         if player_id in self.past_bribe_targets:
             del self.past_bribe_targets[player_id]
+        handle = self._handles.pop(player_id, None)
+        if handle is not None:
+            del self._handle_ids[handle]
+
+    @property
+    def scores(self) -> Leaderboard:
+        """Total score per player, with a ranking maintained as scores change"""
+        return self._scores
+
+    @scores.setter
+    def scores(self, scores):
+        self._scores = scores if isinstance(scores, Leaderboard) else Leaderboard(scores)
+
+    def _player_status_changed(self, player: Player, was_connected: bool, was_active: bool,
+                               now_connected: bool, now_active: bool):
+        """Keep the running counters and active index in step with a player's flags"""
+        self._connected_count += now_connected - was_connected
+        self._active_count += now_active - was_active
+        if now_connected != was_connected:
+            self.idle_since = None if self._connected_count else self.clock()
+            if self.on_idle_change is not None and self._connected_count == int(now_connected):
+                self.on_idle_change(self)
+        if now_active == was_active:
+            return
+        if now_active:
+            self._active_ids[player.player_id] = None
+        else:
+            self._active_ids.pop(player.player_id, None)
+        if self.current is not None and self.current.progress is not None:
+            self.current.progress.set_active(player.player_id, now_active)
+
+    def _index_username(self, player: Player):
+        key = normalize_username(player.username)
+        self._username_index.setdefault(key, {})[player.player_id] = None
+        self.memory.add(player_size(player.username))
+
+    def _unindex_username(self, player: Player, username: str):
+        self.memory.add(-player_size(username))
+        key = normalize_username(username)
+        player_ids = self._username_index.get(key)
+        if player_ids is not None:
+            player_ids.pop(player.player_id, None)
+            if not player_ids:
+                del self._username_index[key]
+
+    def _player_renamed(self, player: Player, previous_username: str):
+        """Move a renamed player to their new username in the index"""
+        self._unindex_username(player, previous_username)
+        self._index_username(player)
+
+    def find_player_by_username(self, username: str) -> Optional[str]:
+        """Get the ID of the earliest player with this username, ignoring case"""
+        player_ids = self._username_index.get(normalize_username(username))
+        if not player_ids:
+            return None
+        return next(iter(player_ids))
+
+    def _assign_handle(self, player_id: str):
+        self._handles[player_id] = self._next_handle
+        self._handle_ids[self._next_handle] = player_id
+        self._next_handle += 1
+
+    def handle_of(self, player_id: str) -> Optional[int]:
+        """Get the small integer that stands for a player in client payloads, None if not a player"""
+        return self._handles.get(player_id)
+
+    def player_for_handle(self, handle) -> Optional[str]:
+        """Get the ID of the player a handle stands for, None if unknown"""
+        if not isinstance(handle, int) or isinstance(handle, bool):
+            return None
+        return self._handle_ids.get(handle)
+
+    def set_player_connected(self, player_id: str, connected: bool) -> bool:
+        """Mark a player as connected or disconnected, returns False if unknown"""
+        player = self.players.get(player_id)
+        if player is None:
+            return False
+        player.connected = connected
+        return True
 
     def get_connected_player_count(self) -> int:
         """Get count of connected players"""
-        return len([p for p in self.players.values() if p['connected']])
+        return self._connected_count
 
     def get_active_player_count(self) -> int:
         """Get count of players active in current round"""
-        return len([p for p in self.players.values() if p['connected'] and p.get('active_in_round', True)])
+        return self._active_count
+
+    def get_active_player_ids(self) -> ActivePlayerView:
+        """Get a read-only view of player IDs active in current round"""
+        return self._active_view
+
+    def is_player_active(self, player_id: str) -> bool:
+        """Check if a player is connected and active in the current round"""
+        return player_id in self._active_ids
 
-    def get_active_player_ids(self) -> list:
-        """Get list of player IDs active in current round"""
-        return [pid for pid, player in self.players.items()
-                if player['connected'] and player.get('active_in_round', True)]
+    def get_round_participant_ids(self) -> List[str]:
+        """Get IDs of players taking part in the current round, connected or not"""
+        return [pid for pid, player in self.players.items() if player.active_in_round]
 
     def get_player_count(self) -> int:
         """Get total player count (including disconnected)"""
@@ -76,130 +265,153 @@ class Game:
         """Check if game can be started"""
         return self.get_active_player_count() >= 3 and self.state == "lobby"
 
+    def start_round(self, round_num: int) -> RoundState:
+        """Archive the current round and make a fresh RoundState current"""
+        existing = self.find_round(round_num)
+        if existing is not None:
+            self._remove_round(existing)
+        if self.current is not None:
+            self.past_rounds.append(self.current)
+            self.retention.apply(self)
+        self.current = self._new_round(round_num)
+        return self.current
+
+    def _new_round(self, round_num: int) -> RoundState:
+        round_state = RoundState(round_num)
+        round_state.attach_meter(self.memory)
+        return round_state
+
+    def find_round(self, round_num: int) -> Optional[RoundState]:
+        """Get the RoundState the game holds for a round number, compacted or not"""
+        current = self.current
+        if current is not None and current.round_num == round_num:
+            return current
+        for round_state in reversed(self.past_rounds):
+            if round_state.round_num == round_num:
+                return round_state
+        return None
+
+    def get_round(self, round_num: int, create: bool = False) -> Optional[RoundState]:
+        """Get the RoundState for a round number, optionally creating it
+
+        A spilled round is read back from disk into a copy for the caller,
+        leaving the game's own record compacted. Creating asks for the
+        record itself, so changes made through it are kept.
+        """
+        round_state = self.find_round(round_num)
+        if round_state is not None:
+            if round_state.compacted and not create:
+                return self.retention.hydrate(round_state) or round_state
+            return round_state
+        if not create:
+            return None
+
+        current = self.current
+        round_state = self._new_round(round_num)
+        if current is None or round_num > current.round_num:
+            if current is not None:
+                self.past_rounds.append(current)
+            self.current = round_state
+        else:
+            # Keep past rounds ordered by round number
+            index = len(self.past_rounds)
+            while index > 0 and self.past_rounds[index - 1].round_num > round_num:
+                index -= 1
+            self.past_rounds.insert(index, round_state)
+        return round_state
+
+    def iter_rounds(self) -> Iterator[RoundState]:
+        """Iterate over all rounds in order, the current round last"""
+        yield from list(self.past_rounds)
+        if self.current is not None:
+            yield self.current
+
+    def _remove_round(self, round_state: RoundState):
+        """Forget a round entirely, keeping the latest round as current"""
+        self.retention.discard(round_state)
+        round_state.attach_meter(None)
+        if round_state is self.current:
+            self.current = self.past_rounds.pop() if self.past_rounds else None
+        else:
+            self.past_rounds.remove(round_state)
+
+    def get_round_results(self, round_num: int) -> Optional[dict]:
+        """Get the round_results payload sent when a round's voting ended"""
+        round_state = self.get_round(round_num)
+        if round_state is None:
+            return None
+        return round_state.get_results()
+
+    def record_vote(self, round_state: RoundState, voter_id: str, bribe_id: str):
+        """Store a vote in a round, crediting its submitter in the round tally"""
+        submitter_id, target_id, points = self.credit_for_vote(round_state, bribe_id, voter_id)
+        round_state.record_vote(voter_id, bribe_id, submitter_id, target_id, points)
+
+    def credit_for_vote(self, round_state: RoundState, bribe_id: str,
+                        voter_id: Optional[str] = None):
+        """Work out (submitter_id, target_id, points) for a vote
+
+        Uses the voter's ballot when one was opened for the round, otherwise
+        parses the bribe ID. Returns (None, None, 0) if the vote does not
+        credit a current player.
+        """
+        ballot = round_state.ballots.get(voter_id) if voter_id is not None else None
+        if ballot is not None:
+            option = ballot.get(bribe_id)
+            if option is None or option.submitter_id not in self.players:
+                return None, None, 0
+            return option.submitter_id, option.target_id, option.points
+
+        parts = bribe_id.split('_') if isinstance(bribe_id, str) else []
+        if len(parts) != 2 or parts[0] not in self.players or parts[1] not in self.players:
+            return None, None, 0
+        submitter_id, target_id = parts
+        bribe = round_state.submissions.get(submitter_id, {}).get(target_id, {})
+        # Award half a point for randomly generated bribes
+        points = 0.5 if bribe.get('is_random', False) else 1
+        return submitter_id, target_id, points
+
+    def advance_phase(self, expected_generation: Optional[int] = None) -> bool:
+        """Start a new phase generation, cancelling the pending phase timer
+
+        Returns False, changing nothing, if expected_generation is given and
+        the game has already moved past it.
+        """
+        if expected_generation is not None and expected_generation != self.phase_generation:
+            return False
+        self.phase_generation += 1
+        if self.round_timer:
+            self.round_timer.cancel()
+            self.round_timer = None
+        return True
+
+    def reset_to_lobby(self):
+        """Return to the lobby, dropping all round data but keeping players and settings"""
+        self.advance_phase()
+        self.cleanup()
+        self.state = "lobby"
+        self.current_round = 0
+        self.current_prompt = ""
+        for round_state in self.iter_rounds():
+            round_state.release()
+        self.current = None
+        self.past_rounds = []
+        self.scores = {pid: 0 for pid in self.players}
+        self.past_bribe_targets = {pid: set() for pid in self.players}
+        self._pairing_engine.reset()
+
     def generate_round_pairings(self):
         """Generate pairings so each player bribes exactly 2 others and receives bribes from exactly 2 others"""
-        # Get a snapshot of active players to avoid race conditions
-        active_player_ids = self.get_active_player_ids()
-        n = len(active_player_ids)
+        return self._pairing_engine.generate(
+            self.get_active_player_ids(), self.past_bribe_targets, self.settings.get('rounds', 1))
 
-        if n < 3:
-            return {}
+    def track_phase(self, phase: str) -> PhaseTracker:
+        """Start counting outstanding work for a phase of the current round"""
+        return self.current.begin_phase(phase, self.get_round_participant_ids(), self._active_ids)
 
-        # Create a copy to avoid modifying the original list during iteration
-        player_ids = active_player_ids.copy()
-        
-        # Initialize pairings dictionary and bribes received counter
-        pairings = {}
-        bribes_received = {pid: 0 for pid in player_ids}
-        
-        # Create a copy of past_bribe_targets to avoid modifying during processing
-        past_targets_copy = {}
-        for pid in player_ids:
-            if pid in self.past_bribe_targets:
-                past_targets_copy[pid] = self.past_bribe_targets[pid].copy()
-            else:
-                past_targets_copy[pid] = []
-        
-        # Process each player to assign their targets
-        for player_id in player_ids:
-            # Get list of players this player hasn't bribed yet (excluding self)
-            potential_targets = [pid for pid in player_ids 
-                               if pid != player_id and 
-                               pid not in past_targets_copy[player_id]]
-            
-            # If fewer than 2 potential targets left, reset history for this player
-            if len(potential_targets) < 2:
-                potential_targets = [pid for pid in player_ids if pid != player_id]
-                past_targets_copy[player_id] = []
-            
-            # Sort potential targets by bribes received so far (prioritize those with fewer bribes)
-            potential_targets.sort(key=lambda pid: bribes_received[pid])
-            
-            # Select the first two targets (those with fewest bribes received)
-            targets = potential_targets[:2]
-            
-            # Update bribes received counts
-            for target in targets:
-                bribes_received[target] += 1
-            
-            # Update player's history in our copy
-            for target in targets:
-                if target not in past_targets_copy[player_id]:
-                    past_targets_copy[player_id].append(target)
-            
-            # Assign targets to this player
-            pairings[player_id] = targets
-        
-        # Now update the actual past_bribe_targets with our validated copy
-        for pid, targets in past_targets_copy.items():
-            self.past_bribe_targets[pid] = targets
-        
-        # Validate and fix if any player doesn't receive exactly 2 bribes
-        return self._balance_bribes(pairings, player_ids)
-
-    def _balance_bribes(self, pairings, player_ids):
-        """Ensure each player receives exactly 2 bribes"""
-        # Count bribes received by each player
-        bribes_received = {pid: 0 for pid in player_ids}
-        for player_id, targets in pairings.items():
-            for target in targets:
-                bribes_received[target] += 1
-        
-        # If all players have exactly 2 bribes, we're done
-        if all(count == 2 for count in bribes_received.values()):
-            return pairings
-        
-        # Otherwise, we need to rebalance
-        # Find players with too many bribes and those with too few
-        surplus = [pid for pid, count in bribes_received.items() if count > 2]
-        deficit = [pid for pid, count in bribes_received.items() if count < 2]
-        
-        # Adjust until balanced
-        while surplus and deficit:
-            donor = surplus.pop(0)
-            recipient = deficit.pop(0)
-            
-            # Find a player targeting the donor and redirect to recipient
-            for player_id, targets in pairings.items():
-                # Never assign a player to bribe themselves
-                if donor in targets and player_id != recipient and recipient != player_id:
-                    # Replace donor with recipient in this player's targets
-                    targets[targets.index(donor)] = recipient
-                    # Update counts
-                    bribes_received[donor] -= 1
-                    bribes_received[recipient] += 1
-                    
-                    # Check if we need to update the lists
-                    if bribes_received[donor] > 2:
-                        surplus.append(donor)
-                    if bribes_received[recipient] < 2:
-                        deficit.append(recipient)
-                    elif bribes_received[recipient] > 2:
-                        surplus.append(recipient)
-                    
-                    # Also update the past_bribe_targets
-                    if donor in self.past_bribe_targets[player_id]:
-                        self.past_bribe_targets[player_id].remove(donor)
-                    if recipient not in self.past_bribe_targets[player_id]:
-                        self.past_bribe_targets[player_id].append(recipient)
-                    
-                    break
-        
-        # Final verification: ensure no player is assigned to bribe themselves
-        for player_id, targets in pairings.items():
-            if player_id in targets:
-                # Find a safe swap with another player's targets
-                for other_id, other_targets in pairings.items():
-                    if other_id != player_id and player_id not in other_targets:
-                        # Swap a target between these players
-                        for target in other_targets:
-                            if target != other_id and target not in targets:
-                                # Safe to swap
-                                targets[targets.index(player_id)] = target
-                                other_targets[other_targets.index(target)] = player_id
-                                break
-        
-        return pairings
+    def get_phase_tracker(self, phase: str) -> PhaseTracker:
+        """Get the current round's tracker for a phase, starting one if needed"""
+        return self.current.tracker_for(phase) or self.track_phase(phase)
 
     def custom_prompts_enabled(self) -> bool:
         """Check if custom prompts are enabled for this game"""
@@ -210,15 +422,17 @@ class Game:
         if not self.custom_prompts_enabled():
             return True
 
-        if round_num not in self.player_prompt_ready:
+        round_state = self.get_round(round_num)
+        if round_state is None:
             return False
 
-        active_players = self.get_active_player_ids()
-        ready_players = [
-            pid for pid,
-            ready in self.player_prompt_ready[round_num].items() if ready]
+        progress = round_state.tracker_for("prompt_selection")
+        if progress is not None:
+            return progress.is_complete()
+
+        ready_count = sum(1 for ready in round_state.prompt_ready.values() if ready)
 
-        return len(ready_players) >= len(active_players)
+        return ready_count >= self.get_active_player_count()
 
     def get_prompt_for_target(
             self,
@@ -229,9 +443,8 @@ class Game:
             return self.current_prompt
 
         # Get the custom prompt for this target player
-        custom_prompt = self.player_prompts.get(
-            round_num, {}).get(
-            target_player_id, "")
+        round_state = self.get_round(round_num)
+        custom_prompt = round_state.prompts.get(target_player_id, "") if round_state else ""
 
         # Fall back to default prompt if custom prompt is empty or missing
         if not custom_prompt or not custom_prompt.strip():
@@ -244,10 +457,10 @@ class Game:
         activated_count = 0
         for player_id, player in self.players.items():
             # Only consider connected players
-            if player['connected']:
+            if player.connected:
                 # Check if player was marked as inactive
-                if not player.get('active_in_round', True):
-                    player['active_in_round'] = True
+                if not player.active_in_round:
+                    player.active_in_round = True
                     activated_count += 1
                     
                     # Initialize scores for newly activated players if not already present
@@ -256,7 +469,7 @@ class Game:
                         
                     # Initialize past bribe targets for new players
                     if player_id not in self.past_bribe_targets:
-                        self.past_bribe_targets[player_id] = []
+                        self.past_bribe_targets[player_id] = set()
         
         return activated_count  # Return count for logging purposes
 
@@ -265,6 +478,125 @@ class Game:
         if self.round_timer:
             self.round_timer.cancel()
             self.round_timer = None
+        self.progress_coalescer.cancel_pending()
+        for round_state in self.iter_rounds():
+            self.retention.discard(round_state)
+
+    def get_memory_usage(self) -> int:
+        """Approximate bytes held by this game's players, bribes and prompts"""
+        return self.memory.bytes_used
+
+    def make_room(self, growth: int) -> bool:
+        """Check that growth more bytes fit the memory budget
+
+        If they do not, the retention policy first compacts every finished
+        round of this game, so old bribe content goes before new content is
+        turned away. Other games are left alone, they may be busy on their
+        own actors.
+        """
+        if self.memory.fits(growth):
+            return True
+        return self.retention.shed(self) and self.memory.fits(growth)
+
+    def can_store_submission(self, player_id: str, target_id: str, submission: dict) -> bool:
+        """Check that a bribe for the current round fits the memory budget, see make_room()"""
+        previous = self.current.submissions.get(player_id, {}).get(target_id)
+        return self.make_room(submission_size(submission)
+                              - (submission_size(previous) if previous is not None else 0))
+
+    def can_store_prompt(self, player_id: str, prompt: str) -> bool:
+        """Check that a prompt choice for the current round fits the memory budget"""
+        previous = self.current.prompts.get(player_id)
+        return self.make_room(prompt_size(prompt)
+                              - (prompt_size(previous) if previous is not None else 0))
+
+    def can_store_player(self, player_id: str, username: str) -> bool:
+        """Check that adding or renaming a player fits the memory budget"""
+        player = self.players.get(player_id)
+        return self.make_room(player_size(username)
+                              - (player_size(player.username) if player is not None else 0))
+
+    def has_pending_deadline(self) -> bool:
+        """Check if a phase timer is still waiting to fire"""
+        return self.round_timer is not None and self.round_timer.pending
+
+    def to_snapshot(self) -> dict:
+        """Get the whole game as JSON-friendly values, see from_snapshot()"""
+        rounds = []
+        for round_state in self.iter_rounds():
+            data = round_state.to_dict()
+            data['ballots'] = round_state.ballot_order()
+            data['compacted'] = round_state.compacted
+            data['segment'] = round_state.segment
+            rounds.append(data)
+        return {
+            'game_id': self.game_id,
+            'host_id': self.host_id,
+            'settings': self.settings,
+            'state': self.state,
+            'current_round': self.current_round,
+            'current_prompt': self.current_prompt,
+            'phase_generation': self.phase_generation,
+            'created_at': self.created_at,
+            'players': [[pid, player.username, player.ready, player.connected,
+                         player.active_in_round] for pid, player in self.players.items()],
+            'scores': list(self.scores.items()),
+            'past_bribe_targets': {pid: list(targets)
+                                   for pid, targets in self.past_bribe_targets.items()},
+            'pairing': self._pairing_engine.to_dict(),
+            'handles': list(self._handles.items()),
+            'next_handle': self._next_handle,
+            'roster': self.roster.to_dict(),
+            'rounds': rounds,
+            'has_current': self.current is not None,
+        }
+
+    @classmethod
+    def from_snapshot(cls, data: dict, retention: Optional[RetentionPolicy] = None,
+                      scheduler: Optional[DeadlineScheduler] = None,
+                      clock: Optional[Callable[[], float]] = None,
+                      memory_budget: Optional[MemoryBudget] = None) -> 'Game':
+        """Rebuild a game from to_snapshot() output"""
+        game = cls(data['game_id'], data['host_id'], data['settings'],
+                   retention=retention, scheduler=scheduler, clock=clock,
+                   memory_budget=memory_budget)
+        game.state = data['state']
+        game.current_round = data['current_round']
+        game.current_prompt = data['current_prompt']
+        game.phase_generation = data['phase_generation']
+        game.created_at = data['created_at']
+        for pid, username, ready, connected, active_in_round in data['players']:
+            player = Player(pid, username, game, connected=connected,
+                            active_in_round=active_in_round)
+            player.ready = ready
+            game.players[pid] = player
+        game.scores = dict(data['scores'])
+        game.past_bribe_targets = {pid: set(targets)
+                                   for pid, targets in data['past_bribe_targets'].items()}
+        game._pairing_engine.restore(data['pairing'])
+        for pid, handle in data.get('handles', []):
+            game._handles[pid] = handle
+            game._handle_ids[handle] = pid
+        game._next_handle = data.get('next_handle', len(game._handles) + 1)
+        for pid in game.players:
+            if pid not in game._handles:
+                game._assign_handle(pid)
+        if 'roster' in data:
+            # Clients still hold the lobby at this version and keep patching it
+            game.roster.restore(data['roster'])
+
+        for round_data in data['rounds']:
+            round_state = game._new_round(round_data['round_num'])
+            round_state.restore(round_data)
+            round_state.restore_ballots(round_data.get('ballots', {}))
+            round_state.compacted = round_data.get('compacted', False)
+            round_state.segment = round_data.get('segment')
+            game.past_rounds.append(round_state)
+        if data['has_current'] and game.past_rounds:
+            game.current = game.past_rounds.pop()
+        if game.current is not None and game.state in ("prompt_selection", "submission", "voting"):
+            game.track_phase(game.state)
+        return game
 
     def __repr__(self):
         return f"Game(id='{self.game_id}', state='{self.state}', players={len(self.players)}, round={self.current_round})"
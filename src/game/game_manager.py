@@ -4,23 +4,143 @@ GameManager class for managing multiple concurrent games and player sessions
 
 import logging
 import threading
-from typing import Dict, Optional
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Set
 
+from .code_allocator import CodeAllocator, canonical_code
 from .game import Game
+from .hibernation import Hibernator, get_default_hibernator
 from .player_session import PlayerSession
 
 logger = logging.getLogger(__name__)
 
+# Number of independently locked partitions of the game registry
+SHARD_COUNT = 16
 
-class GameManager:
-    """Manages multiple concurrent games and player sessions"""
+
+class GameShard:
+    """One lock-striped partition of the game registry
+
+    Writers hold the shard's lock; readers use plain dict lookups, which
+    are atomic, so lookups never wait on creates, joins or cleanup. members
+    can change when a player moves in from another shard's game, so it is
+    written under the manager's index lock instead. empty is updated by the
+    games themselves, often while the lock is already held, so it relies on
+    single dict operations being atomic and takes no lock.
+    """
+
+    __slots__ = ('lock', 'games', 'members', 'empty')
 
     def __init__(self):
+        self.lock = threading.Lock()
         self.games: Dict[str, Game] = {}  # game_id -> Game
+        # Reverse index of player_to_game: game_id -> {player_ids}
+        self.members: Dict[str, Set[str]] = {}
+        # Ordered set (dict keys) of IDs of games nobody is connected to
+        self.empty: Dict[str, None] = {}
+
+
+class GameRegistryView(Mapping):
+    """Read-only {game_id: Game} view of the games in memory across all shards
+
+    Unlike GameManager.get_game(), looking a code up here never wakes a
+    hibernated game.
+    """
+
+    __slots__ = ('_manager',)
+
+    def __init__(self, manager: 'GameManager'):
+        self._manager = manager
+
+    def __getitem__(self, game_id: str) -> Game:
+        game_id = self._manager._resolve_game_id(game_id)
+        game = self._manager._shard_for(game_id).games.get(game_id)
+        if game is None:
+            raise KeyError(game_id)
+        return game
+
+    def __iter__(self) -> Iterator[str]:
+        for shard in self._manager._shards:
+            yield from list(shard.games)
+
+    def __len__(self) -> int:
+        return sum(len(shard.games) for shard in self._manager._shards)
+
+
+class GameManager:
+    """Manages multiple concurrent games and player sessions"""
+
+    def __init__(self, shard_count: int = SHARD_COUNT,
+                 code_allocator: Optional[CodeAllocator] = None,
+                 hibernator: Optional[Hibernator] = None):
+        self._shards: List[GameShard] = [GameShard() for _ in range(max(1, shard_count))]
+        self.codes = code_allocator if code_allocator is not None else CodeAllocator()
+        # Moves idle games to disk, None keeps every game in memory
+        self.hibernator = hibernator if hibernator is not None else get_default_hibernator()
+        # Guards the indexes shared by every shard: _canonical_ids,
+        # player_to_game and each shard's members. Taken after a shard lock,
+        # never before one
+        self._index_lock = threading.Lock()
+        # Canonical (upper case) game code -> game_id as stored
+        self._canonical_ids: Dict[str, str] = {}
         # socket_id -> PlayerSession
         self.player_sessions: Dict[str, PlayerSession] = {}
+        # Secondary session indexes, ordered sets (dict keys) of socket_ids
+        self._player_sockets: Dict[str, Dict[str, None]] = {}  # player_id -> sids
+        self._game_sockets: Dict[str, Dict[str, None]] = {}  # game_id -> sids
+        self._session_lock = threading.Lock()
         self.player_to_game: Dict[str, str] = {}  # player_id -> game_id
-        self._lock = threading.Lock()
+
+    def _shard_for(self, game_id: str) -> GameShard:
+        return self._shards[hash(game_id) % len(self._shards)]
+
+    @property
+    def games(self) -> GameRegistryView:
+        """Read-only {game_id: Game} mapping of all games"""
+        return GameRegistryView(self)
+
+    def allocate_game_code(self) -> str:
+        """Get an unused game code for a new game"""
+        return self.codes.allocate()
+
+    def _register_game(self, shard: GameShard, game: Game):
+        """Store a game and index its code, caller holds the shard lock"""
+        self._store_game(shard, game)
+        self.codes.claim(game.game_id)
+        with self._index_lock:
+            self._canonical_ids[canonical_code(game.game_id)] = game.game_id
+
+    def _store_game(self, shard: GameShard, game: Game):
+        """Put a game in its shard and start tracking whether it is empty"""
+        shard.games[game.game_id] = game
+        game.on_idle_change = self._game_idle_changed
+        self._game_idle_changed(game)
+
+    def _game_idle_changed(self, game: Game):
+        shard = self._shard_for(game.game_id)
+        if game.get_connected_player_count() == 0 and shard.games.get(game.game_id) is game:
+            shard.empty[game.game_id] = None
+        else:
+            shard.empty.pop(game.game_id, None)
+
+    def _link_player(self, shard: GameShard, game_id: str, player_id: str):
+        """Record a player as belonging to a game, caller holds the shard lock"""
+        with self._index_lock:
+            previous = self.player_to_game.get(player_id)
+            if previous is not None and previous != game_id:
+                # The previous game may live in another shard
+                previous_members = self._shard_for(previous).members.get(previous)
+                if previous_members is not None:
+                    previous_members.discard(player_id)
+            shard.members.setdefault(game_id, set()).add(player_id)
+            self.player_to_game[player_id] = game_id
+
+    def _unlink_game_players(self, shard: GameShard, game_id: str):
+        """Forget every player recorded as belonging to a game"""
+        with self._index_lock:
+            for player_id in shard.members.pop(game_id, ()):
+                if self.player_to_game.get(player_id) == game_id:
+                    del self.player_to_game[player_id]
 
     def create_game(
             self,
@@ -28,57 +148,213 @@ class GameManager:
             host_player_id: str,
             settings: dict) -> Game:
         """Create a new game instance"""
-        with self._lock:
-            if game_id in self.games:
+        shard = self._shard_for(game_id)
+        with shard.lock:
+            if game_id in shard.games:
                 raise ValueError(f"Game {game_id} already exists")
 
             game = Game(game_id, host_player_id, settings)
-            self.games[game_id] = game
-            self.player_to_game[host_player_id] = game_id
+            self._register_game(shard, game)
+            self._link_player(shard, game_id, host_player_id)
 
             logger.info(f"Created game {game_id} with host {host_player_id}")
             return game
 
+    def _resolve_game_id(self, game_id: str) -> str:
+        """Map a code typed in any case to the game_id as stored"""
+        if game_id in self._shard_for(game_id).games:
+            return game_id
+        return self._canonical_ids.get(canonical_code(game_id), game_id)
+
     def get_game(self, game_id: str) -> Optional[Game]:
-        """Get a game by ID"""
-        return self.games.get(game_id)
+        """Get a game by ID, matching the code case-insensitively
+
+        A hibernated game is loaded back into memory.
+        """
+        game_id = self._resolve_game_id(game_id)
+        game = self._shard_for(game_id).games.get(game_id)
+        if game is None and self.hibernator is not None and self.hibernator.is_hibernated(game_id):
+            game = self._wake_game(game_id)
+        return game
+
+    def _wake_game(self, game_id: str) -> Optional[Game]:
+        """Load a hibernated game back into its shard"""
+        shard = self._shard_for(game_id)
+        with shard.lock:
+            game = shard.games.get(game_id)
+            if game is not None:
+                # Another caller woke it first
+                return game
+            game = self.hibernator.load(game_id)
+            if game is None:
+                # The snapshot is unreadable, free the code and players
+                self._remove_game_locked(shard, game_id)
+                return None
+            self._store_game(shard, game)
+            logger.info(f"Woke game {game_id} from hibernation")
+            return game
+
+    def hibernate_game(self, game_id: str) -> bool:
+        """Move an idle game to disk, returns False if it is not idle or on failure"""
+        if self.hibernator is None:
+            return False
+        game_id = self._resolve_game_id(game_id)
+        shard = self._shard_for(game_id)
+        game = shard.games.get(game_id)
+        if game is None:
+            return False
+        # Wait for any in-flight event for the game before taking it out
+        return game.actor.run(self._hibernate_game, shard, game)
+
+    def _hibernate_game(self, shard: GameShard, game: Game) -> bool:
+        with shard.lock:
+            if shard.games.get(game.game_id) is not game or not self.hibernator.should_hibernate(game):
+                return False
+            if not self.hibernator.save(game):
+                return False
+            # The code, player links and round segments stay for when it wakes
+            del shard.games[game.game_id]
+            shard.empty.pop(game.game_id, None)
+            game.on_idle_change = None
+            game.memory.close()
+            if game.round_timer is not None:
+                game.round_timer.cancel()
+                game.round_timer = None
+            game.progress_coalescer.cancel_pending()
+            logger.info(f"Hibernated idle game {game.game_id}")
+            return True
+
+    def get_memory_usage(self) -> Dict[str, int]:
+        """Get approximate bytes held by each game in memory"""
+        return {game.game_id: game.get_memory_usage() for game in self.iter_games()}
+
+    def iter_games(self) -> Iterator[Game]:
+        """Iterate over a snapshot of all games"""
+        for shard in self._shards:
+            yield from list(shard.games.values())
 
     def add_game(self, game: Game):
         """Add a game instance to the manager"""
-        with self._lock:
-            self.games[game.game_id] = game
-            self.player_to_game[game.host_id] = game.game_id
+        shard = self._shard_for(game.game_id)
+        with shard.lock:
+            self._register_game(shard, game)
+            for player_id in list(game.players) or [game.host_id]:
+                self._link_player(shard, game.game_id, player_id)
             logger.info(f"Added game {game.game_id} to manager")
 
+    def remove_game(self, game_id: str) -> Optional[Game]:
+        """Remove a game and forget which players were in it"""
+        game_id = self._resolve_game_id(game_id)
+        shard = self._shard_for(game_id)
+        with shard.lock:
+            return self._remove_game_locked(shard, game_id)
+
+    def _remove_game_locked(self, shard: GameShard, game_id: str) -> Optional[Game]:
+        game = shard.games.pop(game_id, None)
+        shard.empty.pop(game_id, None)
+        if game is not None:
+            game.on_idle_change = None
+            game.memory.close()
+        if self.hibernator is not None:
+            self.hibernator.discard(game_id)
+        # Both are no-ops for codes that were never registered
+        canonical = canonical_code(game_id)
+        with self._index_lock:
+            if self._canonical_ids.get(canonical) == game_id:
+                del self._canonical_ids[canonical]
+        self.codes.release(game_id)
+        self._unlink_game_players(shard, game_id)
+        # Drop any sessions still pointing at the game
+        for socket_id in self.get_game_socket_ids(game_id):
+            self._pop_session(socket_id)
+        return game
+
     def add_player_session(self, socket_id: str, session: PlayerSession):
         """Add a player session"""
-        self.player_sessions[socket_id] = session
+        with self._session_lock:
+            previous = self.player_sessions.get(socket_id)
+            if previous is not None:
+                self._unindex_session(socket_id, previous)
+            self.player_sessions[socket_id] = session
+            self._player_sockets.setdefault(session.player_id, {})[socket_id] = None
+            self._game_sockets.setdefault(session.game_id, {})[socket_id] = None
         logger.info(
             f"Added player session {session.player_id} for socket {socket_id}")
 
     def remove_player_session(self, socket_id: str):
         """Remove a player session"""
-        if socket_id in self.player_sessions:
-            session = self.player_sessions[socket_id]
-            del self.player_sessions[socket_id]
+        session = self._pop_session(socket_id)
+        if session is not None:
             logger.info(
                 f"Removed player session {session.player_id} for socket {socket_id}")
 
+    def _pop_session(self, socket_id: str) -> Optional[PlayerSession]:
+        with self._session_lock:
+            session = self.player_sessions.pop(socket_id, None)
+            if session is not None:
+                self._unindex_session(socket_id, session)
+            return session
+
+    def _unindex_session(self, socket_id: str, session: PlayerSession):
+        """Remove a session from the secondary indexes, caller holds the session lock"""
+        for index, key in ((self._player_sockets, session.player_id),
+                           (self._game_sockets, session.game_id)):
+            socket_ids = index.get(key)
+            if socket_ids is not None:
+                socket_ids.pop(socket_id, None)
+                if not socket_ids:
+                    del index[key]
+
+    def get_player_socket_ids(self, player_id: str) -> List[str]:
+        """Get the socket IDs of a player's sessions, oldest first"""
+        return list(self._player_sockets.get(player_id, ()))
+
+    def get_game_socket_ids(self, game_id: str) -> List[str]:
+        """Get the socket IDs of all sessions in a game, oldest first"""
+        return list(self._game_sockets.get(game_id, ()))
+
+    def get_player_socket_id(self, game_id: str, player_id: str) -> Optional[str]:
+        """Get a player's oldest socket ID in a game, or None if they have none"""
+        for socket_id in self.get_player_socket_ids(player_id):
+            session = self.player_sessions.get(socket_id)
+            if session is not None and session.game_id == game_id:
+                return socket_id
+        return None
+
+    def has_other_sessions(self, socket_id: str, player_id: str, game_id: str) -> bool:
+        """Check if a player has sessions in a game besides the given socket"""
+        for other_id in self.get_player_socket_ids(player_id):
+            if other_id == socket_id:
+                continue
+            session = self.player_sessions.get(other_id)
+            if session is not None and session.game_id == game_id:
+                return True
+        return False
+
     def get_player_game(self, player_id: str) -> Optional[Game]:
         """Get the game a player is in"""
         game_id = self.player_to_game.get(player_id)
-        return self.games.get(game_id) if game_id else None
+        return self.get_game(game_id) if game_id else None
+
+    def get_game_player_ids(self, game_id: str) -> Set[str]:
+        """Get a snapshot of the player IDs registered to a game"""
+        with self._index_lock:
+            return set(self._shard_for(game_id).members.get(game_id, ()))
 
     def join_game(self, game_id: str, player_id: str, username: str) -> bool:
-        """Add a player to a game"""
-        with self._lock:
-            game = self.games.get(game_id)
+        """Add a player to a game, waking it if it was hibernated"""
+        if not self.get_game(game_id):
+            return False
+        game_id = self._resolve_game_id(game_id)
+        shard = self._shard_for(game_id)
+        with shard.lock:
+            game = shard.games.get(game_id)
             if not game:
                 return False
 
             # Check if player is rejoining
             if player_id in game.players:
-                game.players[player_id]['connected'] = True
+                game.set_player_connected(player_id, True)
                 logger.info(
                     f"Player {username} ({player_id}) reconnected to game {game_id}")
             else:
@@ -86,53 +362,71 @@ class GameManager:
                 logger.info(
                     f"Player {username} ({player_id}) joined game {game_id}")
 
-            self.player_to_game[player_id] = game_id
+            self._link_player(shard, game_id, player_id)
             return True
 
-    def register_player_session(
-            self,
-            socket_id: str,
-            player_id: str,
-            game_id: str):
-        """Register a player's socket session"""
-        self.player_sessions[socket_id] = PlayerSession(
-            socket_id, player_id, game_id)
+    def remove_player(self, game_id: str, player_id: str) -> bool:
+        """Remove a player from a game, e.g. when kicked"""
+        if not self.get_game(game_id):
+            return False
+        game_id = self._resolve_game_id(game_id)
+        shard = self._shard_for(game_id)
+        with shard.lock:
+            game = shard.games.get(game_id)
+            if not game or player_id not in game.players:
+                return False
+            game.remove_player(player_id)
+            with self._index_lock:
+                members = shard.members.get(game_id)
+                if members is not None:
+                    members.discard(player_id)
+                if self.player_to_game.get(player_id) == game_id:
+                    del self.player_to_game[player_id]
+            return True
 
     def get_player_session(self, socket_id: str) -> Optional[PlayerSession]:
         """Get player session by socket ID"""
         return self.player_sessions.get(socket_id)
 
-    def disconnect_player(self, socket_id: str):
-        """Handle player disconnection"""
-        session = self.player_sessions.get(socket_id)
-        if not session:
+    def cleanup_empty_games(self):
+        """Remove games with no connected players
+
+        With a hibernator, unfinished games are kept on disk instead once
+        they have been idle long enough, and dropped when their snapshot
+        expires. Only games in the shards' empty sets are looked at, and
+        each is removed by a command on its actor, so an event already
+        running for it finishes first.
+        """
+        if self.hibernator is not None:
+            self._hibernate_idle_games()
             return
+        for game in self._empty_games():
+            game.actor.run(self._remove_if_empty, self._shard_for(game.game_id), game)
 
-        with self._lock:
-            game = self.games.get(session.game_id)
-            if game and session.player_id in game.players:
-                game.players[session.player_id]['connected'] = False
-                logger.info(
-                    f"Player {session.player_id} disconnected from game {session.game_id}")
+    def _empty_games(self) -> Iterator[Game]:
+        for shard in self._shards:
+            for game_id in list(shard.empty):
+                game = shard.games.get(game_id)
+                if game is not None:
+                    yield game
 
-            del self.player_sessions[socket_id]
+    def _hibernate_idle_games(self):
+        for game_id in self.hibernator.expired():
+            self.remove_game(game_id)
+            logger.info(f"Dropped hibernated game {game_id}")
 
-    def cleanup_empty_games(self):
-        """Remove games with no connected players"""
-        with self._lock:
-            games_to_remove = []
-            for game_id, game in self.games.items():
-                if game.get_connected_player_count() == 0:
-                    games_to_remove.append(game_id)
-
-            for game_id in games_to_remove:
-                game = self.games[game_id]
-                game.cleanup()  # Clean up game resources
-                del self.games[game_id]
-                logger.info(f"Cleaned up empty game {game_id}")
-
-                # Clean up player mappings
-                players_to_remove = [
-                    pid for pid, gid in self.player_to_game.items() if gid == game_id]
-                for player_id in players_to_remove:
-                    del self.player_to_game[player_id]
+        for game in self._empty_games():
+            if game.state == "finished":
+                # Finished games are not worth keeping
+                game.actor.run(self._remove_if_empty, self._shard_for(game.game_id), game)
+            elif self.hibernator.should_hibernate(game):
+                self.hibernate_game(game.game_id)
+
+    def _remove_if_empty(self, shard: GameShard, game: Game):
+        with shard.lock:
+            # A player may have reconnected since the scan
+            if shard.games.get(game.game_id) is not game or game.get_connected_player_count() != 0:
+                return
+            game.cleanup()  # Clean up game resources
+            self._remove_game_locked(shard, game.game_id)
+            logger.info(f"Cleaned up empty game {game.game_id}")
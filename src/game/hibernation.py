@@ -0,0 +1,158 @@
+"""
+Hibernator moving idle games out of memory into on-disk snapshots
+"""
+
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .game import Game
+from .memory import MemoryBudget
+
+logger = logging.getLogger(__name__)
+
+# Seconds a game must have had nobody connected before it is hibernated
+DEFAULT_IDLE_SECONDS = 300
+# Seconds a snapshot is kept before the game is dropped for good
+DEFAULT_SNAPSHOT_TTL = 24 * 60 * 60
+
+
+class Hibernator:
+    """Writes idle games to gzipped JSON snapshots and loads them back
+
+    A game qualifies once nobody has been connected for idle_seconds and no
+    phase timer is pending. Its code stays reserved while it sleeps, and the
+    first lookup of the code loads the game again. Snapshots left alone for
+    snapshot_ttl seconds are deleted, along with the spilled round segments
+    the game would have read back, see RetentionPolicy.
+    """
+
+    def __init__(self, snapshot_dir: str, idle_seconds: float = DEFAULT_IDLE_SECONDS,
+                 snapshot_ttl: float = DEFAULT_SNAPSHOT_TTL,
+                 clock: Callable[[], float] = time.time):
+        self.snapshot_dir = snapshot_dir
+        self.idle_seconds = idle_seconds
+        self.snapshot_ttl = snapshot_ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        # game_id -> (snapshot path, hibernated_at, spilled round segment paths,
+        # memory budget the game counted towards)
+        self._snapshots: Dict[str, Tuple[str, float, List[str], Optional[MemoryBudget]]] = {}
+
+    @classmethod
+    def from_env(cls) -> Optional['Hibernator']:
+        """Build a hibernator from HIBERNATE_DIR, HIBERNATE_AFTER and HIBERNATE_TTL
+
+        Returns None, leaving hibernation off, if HIBERNATE_DIR is unset.
+        """
+        snapshot_dir = os.environ.get('HIBERNATE_DIR')
+        if not snapshot_dir:
+            return None
+        settings = {}
+        for name, key, default in (('HIBERNATE_AFTER', 'idle_seconds', DEFAULT_IDLE_SECONDS),
+                                   ('HIBERNATE_TTL', 'snapshot_ttl', DEFAULT_SNAPSHOT_TTL)):
+            try:
+                settings[key] = float(os.environ.get(name, default))
+            except ValueError:
+                logger.warning(f"Ignoring invalid {name} value")
+                settings[key] = default
+        return cls(snapshot_dir, **settings)
+
+    def should_hibernate(self, game: Game) -> bool:
+        """Check if a game has been idle long enough to leave memory"""
+        return (game.state != "finished"
+                and game.get_connected_player_count() == 0
+                and game.idle_since is not None
+                and game.clock() - game.idle_since >= self.idle_seconds
+                and not game.has_pending_deadline())
+
+    def save(self, game: Game) -> bool:
+        """Write a game's snapshot, returns False if it could not be written"""
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        filename = f"{game.game_id}-{uuid.uuid4().hex[:8]}.json.gz"
+        path = os.path.join(self.snapshot_dir, filename)
+        try:
+            with gzip.open(path, 'wt', encoding='utf-8') as snapshot:
+                json.dump(game.to_snapshot(), snapshot, separators=(',', ':'))
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"Could not hibernate game {game.game_id}: {e}")
+            self._remove_file(path)
+            return False
+        segments = [round_state.segment for round_state in game.iter_rounds()
+                    if round_state.segment is not None]
+        with self._lock:
+            previous = self._snapshots.get(game.game_id)
+            self._snapshots[game.game_id] = (path, self.clock(), segments, game.memory.budget)
+        if previous is not None:
+            self._remove_file(previous[0])
+        return True
+
+    def load(self, game_id: str) -> Optional[Game]:
+        """Load a hibernated game and delete its snapshot, None if there is none"""
+        with self._lock:
+            entry = self._snapshots.pop(game_id, None)
+        if entry is None:
+            return None
+        path, _, segments, budget = entry
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as snapshot:
+                game = Game.from_snapshot(json.load(snapshot), memory_budget=budget)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.error(f"Could not wake game {game_id} from {path}: {e}")
+            # Nothing can read the game's segments any more
+            for segment in segments:
+                self._remove_file(segment)
+            return None
+        finally:
+            self._remove_file(path)
+        # Anyone looking the game up restarts its idle clock
+        game.idle_since = game.clock()
+        return game
+
+    def is_hibernated(self, game_id: str) -> bool:
+        return game_id in self._snapshots
+
+    def discard(self, game_id: str):
+        """Forget a hibernated game without loading it, deleting its files"""
+        with self._lock:
+            entry = self._snapshots.pop(game_id, None)
+        if entry is not None:
+            path, _, segments, _ = entry
+            self._remove_file(path)
+            for segment in segments:
+                self._remove_file(segment)
+
+    def expired(self) -> List[str]:
+        """Get IDs of games whose snapshot is older than the TTL"""
+        cutoff = self.clock() - self.snapshot_ttl
+        return [game_id for game_id, (_, hibernated_at, _, _) in list(self._snapshots.items())
+                if hibernated_at <= cutoff]
+
+    @staticmethod
+    def _remove_file(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def __len__(self) -> int:
+        """Number of games currently hibernated"""
+        return len(self._snapshots)
+
+
+_default_hibernator: Optional[Hibernator] = None
+_default_loaded = False
+
+
+def get_default_hibernator() -> Optional[Hibernator]:
+    """Get the process-wide hibernator configured from the environment"""
+    global _default_hibernator, _default_loaded
+    if not _default_loaded:
+        _default_hibernator = Hibernator.from_env()
+        _default_loaded = True
+    return _default_hibernator
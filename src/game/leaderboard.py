@@ -0,0 +1,73 @@
+"""
+Leaderboard class keeping player scores in ranked order
+"""
+
+from bisect import bisect_left, insort
+from collections.abc import MutableMapping
+from typing import Dict, List, Tuple
+
+
+class Leaderboard(MutableMapping):
+    """{player_id: score} mapping that keeps a ranking sorted as scores change
+
+    Iterating the mapping follows insertion order like a dict; ranked()
+    returns players from highest to lowest score, ties in insertion order.
+    Each update finds its place with a binary search rather than a full
+    re-sort, but inserting into and deleting from the sorted list still
+    shifts the entries after it, so an update is O(n) in the number of
+    players. That shift is a single memmove, which for a lobby-sized game
+    costs less than the pointer chasing of a tree with O(log n) updates.
+    """
+
+    __slots__ = ('_scores', '_order', '_ranking', '_next_seq')
+
+    def __init__(self, scores=None):
+        self._scores: Dict[str, float] = {}
+        # {player_id: insertion sequence}, used to break ties stably
+        self._order: Dict[str, int] = {}
+        # Sorted [(-score, seq, player_id)]
+        self._ranking: List[Tuple[float, int, str]] = []
+        self._next_seq = 0
+        if scores:
+            for player_id, score in scores.items():
+                self[player_id] = score
+
+    def __getitem__(self, player_id: str) -> float:
+        return self._scores[player_id]
+
+    def __setitem__(self, player_id: str, score: float):
+        if player_id in self._scores:
+            self._unrank(player_id)
+        else:
+            self._order[player_id] = self._next_seq
+            self._next_seq += 1
+        self._scores[player_id] = score
+        insort(self._ranking, (-score, self._order[player_id], player_id))
+
+    def __delitem__(self, player_id: str):
+        self._unrank(player_id)
+        del self._scores[player_id]
+        del self._order[player_id]
+
+    def __iter__(self):
+        return iter(self._scores)
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def _unrank(self, player_id: str):
+        entry = (-self._scores[player_id], self._order[player_id], player_id)
+        index = bisect_left(self._ranking, entry)
+        del self._ranking[index]
+
+    def add(self, player_id: str, points: float):
+        """Add points to a player's score, starting from 0 if unknown"""
+        self[player_id] = self._scores.get(player_id, 0) + points
+
+    def ranked(self) -> List[Tuple[str, float]]:
+        """Get (player_id, score) pairs from highest to lowest score"""
+        scores = self._scores
+        return [(player_id, scores[player_id]) for _, _, player_id in self._ranking]
+
+    def __repr__(self):
+        return f"Leaderboard({self._scores!r})"
@@ -0,0 +1,135 @@
+"""
+Memory accounting for game content and the process-wide memory budget
+"""
+
+import logging
+import os
+import threading
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Budget for bribe content, prompts and player records across all games
+DEFAULT_MEMORY_BUDGET = 512 * 1024 * 1024
+# Largest single bribe accepted, room for a 5MB image as a base64 data URL
+DEFAULT_MAX_SUBMISSION_BYTES = 7 * 1024 * 1024
+# Rough fixed cost of a stored record on top of its text
+SUBMISSION_OVERHEAD = 256
+PROMPT_OVERHEAD = 64
+PLAYER_OVERHEAD = 512
+
+
+def submission_size(submission) -> int:
+    """Approximate bytes held by a stored bribe"""
+    content = submission.get('content', '') if isinstance(submission, dict) else ''
+    return SUBMISSION_OVERHEAD + (len(content) if isinstance(content, str) else 0)
+
+
+def prompt_size(prompt) -> int:
+    """Approximate bytes held by a chosen prompt"""
+    return PROMPT_OVERHEAD + (len(prompt) if isinstance(prompt, str) else 0)
+
+
+def player_size(username: str) -> int:
+    """Approximate bytes held by a player record"""
+    return PLAYER_OVERHEAD + len(username)
+
+
+class MemoryBudget:
+    """Process-wide byte count of game content, with a limit new content must fit
+
+    Sizes count characters of stored text, which for the ASCII data URLs
+    that dominate is their size in bytes, plus a fixed overhead per record.
+    A limit of 0 turns enforcement off while still counting.
+    """
+
+    def __init__(self, limit: int = DEFAULT_MEMORY_BUDGET,
+                 max_submission_bytes: int = DEFAULT_MAX_SUBMISSION_BYTES):
+        self.limit = limit
+        self.max_submission_bytes = max_submission_bytes
+        self._total = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> 'MemoryBudget':
+        """Build a budget from GAME_MEMORY_BUDGET and MAX_SUBMISSION_BYTES"""
+        settings = {}
+        for name, key, default in (('GAME_MEMORY_BUDGET', 'limit', DEFAULT_MEMORY_BUDGET),
+                                   ('MAX_SUBMISSION_BYTES', 'max_submission_bytes',
+                                    DEFAULT_MAX_SUBMISSION_BYTES)):
+            try:
+                settings[key] = int(os.environ.get(name, default))
+            except ValueError:
+                logger.warning(f"Ignoring invalid {name} value")
+                settings[key] = default
+        return cls(**settings)
+
+    @property
+    def total(self) -> int:
+        """Bytes currently held by all games"""
+        return self._total
+
+    def add(self, delta: int):
+        with self._lock:
+            self._total += delta
+
+    def meter(self) -> 'MemoryMeter':
+        """Start counting a new game"""
+        return MemoryMeter(self)
+
+    def fits(self, growth: int) -> bool:
+        """Check that growth more bytes stay within the limit, shrinking always fits"""
+        return not self.limit or growth <= 0 or self._total + growth <= self.limit
+
+    def too_large(self, submission: dict) -> bool:
+        """Check if a single bribe is over the per-bribe cap, however much room is left"""
+        return bool(self.max_submission_bytes) and (
+            submission_size(submission) > self.max_submission_bytes + SUBMISSION_OVERHEAD)
+
+
+class MemoryMeter:
+    """Byte count for one game, feeding the process-wide total"""
+
+    __slots__ = ('bytes_used', '_budget')
+
+    def __init__(self, budget: Optional[MemoryBudget] = None):
+        self.bytes_used = 0
+        self._budget = budget
+
+    def add(self, delta: int):
+        if delta:
+            self.bytes_used += delta
+            if self._budget is not None:
+                self._budget.add(delta)
+
+    @property
+    def budget(self) -> Optional[MemoryBudget]:
+        return self._budget
+
+    def fits(self, growth: int) -> bool:
+        """Check growth for this game against the process budget, see MemoryBudget"""
+        return self._budget is None or self._budget.fits(growth)
+
+    def too_large(self, submission: dict) -> bool:
+        """Check a bribe against the per-bribe cap, see MemoryBudget"""
+        return self._budget is not None and self._budget.too_large(submission)
+
+    def close(self):
+        """Stop counting this game towards the process total, e.g. once removed"""
+        if self._budget is not None:
+            self._budget.add(-self.bytes_used)
+            self._budget = None
+
+    def __repr__(self):
+        return f"MemoryMeter(bytes_used={self.bytes_used})"
+
+
+_default_budget: Optional[MemoryBudget] = None
+
+
+def get_default_budget() -> MemoryBudget:
+    """Get the process-wide budget configured from the environment"""
+    global _default_budget
+    if _default_budget is None:
+        _default_budget = MemoryBudget.from_env()
+    return _default_budget
@@ -0,0 +1,138 @@
+"""
+Pairing engine assigning each player's bribe targets for a round
+"""
+
+import random
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+# How many offsets to try when the scheduled ones would repeat past targets
+MAX_OFFSET_PROBES = 8
+
+
+def get_round_offsets(player_count: int, round_index: int) -> Tuple[int, int]:
+    """Get the (a, b) offsets used in one round of a game
+
+    With players placed in a ring, the player at position i bribes the
+    players at positions i + a and i + b. Every player then bribes exactly
+    two others and receives exactly two bribes, and since 0 < a != b < n
+    nobody is ever asked to bribe themselves. Offsets are walked in order so
+    a stable lobby does not repeat a target until all n - 1 have been used.
+    """
+    offset_count = player_count - 1
+    first = (2 * round_index) % offset_count + 1
+    second = (2 * round_index + 1) % offset_count + 1
+    return first, second
+
+
+class PairingEngine:
+    """Builds a game's round pairings from a fixed schedule of ring offsets
+
+    Each game keeps its own random labelling of players onto ring positions.
+    Returning players keep their position and newcomers are appended, so
+    the schedule stays valid as the lobby changes between rounds.
+    """
+
+    __slots__ = ('_order', '_members', '_round_index')
+
+    def __init__(self):
+        self._order: List[str] = []
+        self._members: Set[str] = set()
+        self._round_index = 0
+
+    def reset(self):
+        """Forget the labelling and schedule position, e.g. when returning to lobby"""
+        self._order = []
+        self._members = set()
+        self._round_index = 0
+
+    def to_dict(self) -> dict:
+        """Get the labelling and schedule position as JSON-friendly values"""
+        return {'order': list(self._order), 'round_index': self._round_index}
+
+    def restore(self, data: dict):
+        """Load state produced by to_dict()"""
+        self._order = list(data.get('order', ()))
+        self._members = set(self._order)
+        self._round_index = data.get('round_index', 0)
+
+    def generate(self, active_player_ids: Iterable[str], past_targets: Dict[str, Set[str]],
+                 round_count: int) -> Dict[str, List[str]]:
+        """Assign two targets to each active player, avoiding their past targets
+
+        past_targets is updated in place. A player's history is reset once
+        fewer than two fresh targets would remain.
+        """
+        order = self._relabel(active_player_ids)
+        n = len(order)
+        if n < 3:
+            return {}
+
+        histories = []
+        for player_id in order:
+            history = past_targets.get(player_id)
+            if history is None or len(history) > n - 3:
+                history = set()
+            elif not isinstance(history, set):
+                history = set(history)
+            past_targets[player_id] = history
+            histories.append(history)
+
+        first, second = get_round_offsets(n, self._round_index % max(round_count, 1))
+        self._round_index += 1
+
+        if (self._count_repeats(order, histories, first, 1)
+                or self._count_repeats(order, histories, second, 1)):
+            first, second = self._probe_offsets(order, histories, first)
+
+        pairings = {}
+        for index, player_id in enumerate(order):
+            targets = [order[(index + first) % n], order[(index + second) % n]]
+            pairings[player_id] = targets
+            histories[index].update(targets)
+        return pairings
+
+    def _relabel(self, active_player_ids: Iterable[str]) -> List[str]:
+        """Map the active players onto ring positions"""
+        active_ids = list(active_player_ids)
+        active = set(active_ids)
+        if active != self._members:
+            kept = [pid for pid in self._order if pid in active]
+            newcomers = [pid for pid in active_ids if pid not in self._members]
+            random.shuffle(newcomers)
+            self._order = kept + newcomers
+            self._members = active
+        return self._order
+
+    @staticmethod
+    def _count_repeats(order: Sequence[str], histories: Sequence[Set[str]],
+                       offset: int, limit: int = 0) -> int:
+        """Count players whose target at this offset is in their history
+
+        Stops early once limit repeats are found (0 means count them all).
+        """
+        n = len(order)
+        repeats = 0
+        for index, history in enumerate(histories):
+            if history and order[(index + offset) % n] in history:
+                repeats += 1
+                if repeats == limit:
+                    break
+        return repeats
+
+    def _probe_offsets(self, order: Sequence[str], histories: Sequence[Set[str]],
+                       start: int) -> Tuple[int, int]:
+        """Pick the two offsets with the fewest repeats from a bounded probe"""
+        n = len(order)
+        probes = min(MAX_OFFSET_PROBES, n - 1)
+        candidates = []
+        clean_offsets = 0
+        for step in range(probes):
+            offset = (start - 1 + step) % (n - 1) + 1
+            repeats = self._count_repeats(order, histories, offset)
+            candidates.append((repeats, step, offset))
+            if repeats == 0:
+                clean_offsets += 1
+                if clean_offsets == 2:
+                    break
+        candidates.sort()
+        return candidates[0][2], candidates[1][2]
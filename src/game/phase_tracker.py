@@ -0,0 +1,102 @@
+"""
+PhaseTracker class counting outstanding work in a timed game phase
+"""
+
+from itertools import islice
+from typing import Dict, Iterable, List, Set
+
+
+class PhaseTracker:
+    """Tracks which players still owe work in the current phase
+
+    Each participating player owes a number of actions (2 bribes, 1 vote,
+    1 prompt choice). Counters and the pending set are updated as work is
+    recorded and as players disconnect, reconnect or are kicked, so the
+    "everyone done?" check and progress numbers never rescan the lobby.
+    """
+
+    __slots__ = ('phase', '_owed', '_done', '_active', '_pending', '_completed', '_outstanding')
+
+    def __init__(self, phase: str, owed: Dict[str, int], done: Dict[str, int],
+                 active_player_ids: Iterable[str]):
+        self.phase = phase
+        self._owed = owed
+        self._done = done
+        self._active: Set[str] = set()
+        # Ordered set (dict keys) of active players with work outstanding
+        self._pending: Dict[str, None] = {}
+        self._completed = 0
+        self._outstanding = 0
+        for player_id in active_player_ids:
+            self.set_active(player_id, True)
+
+    def _remaining(self, player_id: str) -> int:
+        return max(self._owed[player_id] - self._done.get(player_id, 0), 0)
+
+    def set_active(self, player_id: str, active: bool):
+        """Count or stop counting a participant, e.g. on reconnect or disconnect"""
+        if player_id not in self._owed or (player_id in self._active) == active:
+            return
+        remaining = self._remaining(player_id)
+        if active:
+            self._active.add(player_id)
+        else:
+            self._active.discard(player_id)
+
+        if remaining:
+            self._outstanding += remaining if active else -remaining
+            if active:
+                self._pending[player_id] = None
+            else:
+                self._pending.pop(player_id, None)
+        else:
+            self._completed += 1 if active else -1
+
+    def record(self, player_id: str, amount: int = 1) -> bool:
+        """Record work done by a player, returns False if they are not taking part"""
+        if player_id not in self._owed:
+            return False
+        before = self._remaining(player_id)
+        self._done[player_id] = self._done.get(player_id, 0) + amount
+        after = self._remaining(player_id)
+        if player_id in self._active and before != after:
+            self._outstanding -= before - after
+            if after == 0:
+                self._pending.pop(player_id, None)
+                self._completed += 1
+        return True
+
+    def mark_done(self, player_id: str) -> bool:
+        """Record that a player has finished all of their work"""
+        if player_id not in self._owed:
+            return False
+        return self.record(player_id, self._remaining(player_id))
+
+    def is_complete(self) -> bool:
+        """Check if every active participant has finished"""
+        return not self._pending
+
+    def is_pending(self, player_id: str) -> bool:
+        return player_id in self._pending
+
+    @property
+    def completed_count(self) -> int:
+        return self._completed
+
+    @property
+    def total(self) -> int:
+        """Number of active participants"""
+        return self._completed + len(self._pending)
+
+    @property
+    def outstanding(self) -> int:
+        """Actions still owed by active participants"""
+        return self._outstanding
+
+    def pending_players(self, limit: int = 2) -> List[str]:
+        """Get up to limit player IDs that still owe work"""
+        return list(islice(self._pending, limit))
+
+    def __repr__(self):
+        return (f"PhaseTracker(phase='{self.phase}', completed={self._completed}, "
+                f"pending={len(self._pending)}, outstanding={self._outstanding})")
@@ -0,0 +1,106 @@
+"""
+Player class representing a single player's record within a game
+"""
+
+from typing import Optional
+
+
+class Player:
+    """Compact per-player record stored in Game.players
+
+    The connected and active_in_round flags and the username are properties
+    so that any change keeps the owning game's running counters and username
+    index in step. Item access (player['username']) is supported for code
+    written against the old dict-based records.
+    """
+
+    __slots__ = ('player_id', '_username', 'ready', '_connected', '_active_in_round', '_game')
+
+    _FIELDS = ('username', 'connected', 'ready', 'active_in_round')
+
+    def __init__(self, player_id: str, username: str, game=None, connected: bool = True,
+                 active_in_round: bool = True):
+        self.player_id = player_id
+        self._username = username
+        self.ready = False
+        self._connected = False
+        self._active_in_round = False
+        self._game = None
+        self._set_status(connected, active_in_round)
+        self.attach(game)
+
+    @property
+    def username(self) -> str:
+        return self._username
+
+    @username.setter
+    def username(self, value: str):
+        previous = self._username
+        self._username = value
+        if self._game is not None and previous != value:
+            self._game._player_renamed(self, previous)
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    @connected.setter
+    def connected(self, value: bool):
+        self._set_status(bool(value), self._active_in_round)
+
+    @property
+    def active_in_round(self) -> bool:
+        return self._active_in_round
+
+    @active_in_round.setter
+    def active_in_round(self, value: bool):
+        self._set_status(self._connected, bool(value))
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the player is connected and taking part in the current round"""
+        return self._connected and self._active_in_round
+
+    def attach(self, game):
+        """Start counting this player towards a game's totals"""
+        if self._game is not None:
+            self._game._player_status_changed(self, self._connected, self.is_active, False, False)
+            self._game._unindex_username(self, self._username)
+        self._game = game
+        if game is not None:
+            game._player_status_changed(self, False, False, self._connected, self.is_active)
+            game._index_username(self)
+
+    def detach(self):
+        """Stop counting this player towards its game's totals"""
+        self.attach(None)
+
+    def _set_status(self, connected: bool, active_in_round: bool):
+        was_connected, was_active = self._connected, self.is_active
+        self._connected = connected
+        self._active_in_round = active_in_round
+        if self._game is not None:
+            self._game._player_status_changed(
+                self, was_connected, was_active, connected, self.is_active)
+
+    # Mapping-style access for callers written against dict records
+    def __getitem__(self, key: str):
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value):
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._FIELDS
+
+    def get(self, key: str, default: Optional[object] = None):
+        """Dict-style get for the known record fields"""
+        return getattr(self, key) if key in self._FIELDS else default
+
+    def __repr__(self):
+        return (f"Player(player_id='{self.player_id}', username='{self.username}', connected={self._connected}, "
+                f"active_in_round={self._active_in_round})")
@@ -8,6 +8,8 @@ import time
 class PlayerSession:
     """Represents a player's socket session"""
 
+    __slots__ = ('socket_id', 'player_id', 'game_id', 'connected_at')
+
     def __init__(self, socket_id: str, player_id: str, game_id: str):
         self.socket_id = socket_id
         self.player_id = player_id
@@ -0,0 +1,38 @@
+"""
+ProgressCoalescer class holding the rate limiting state of a game's progress broadcasts
+"""
+
+from typing import Optional
+
+from .scheduler import ScheduledCall
+
+
+class ProgressCoalescer:
+    """Rate limits one game's room-wide progress broadcasts
+
+    The first change after a quiet window goes out at once; later changes
+    inside the window are merged into a single broadcast at its end, built
+    from the latest state. A finished phase is always sent immediately and
+    an update identical to the last one sent is dropped. State starts over
+    with each phase, so a new phase's first update is never held back.
+    """
+
+    __slots__ = ('generation', 'last_payload', 'last_sent_at', 'pending')
+
+    def __init__(self):
+        self.generation: Optional[int] = None  # Game.phase_generation the state belongs to
+        self.last_payload: Optional[dict] = None
+        self.last_sent_at: Optional[float] = None
+        # Scheduled flush at the end of the window, if an update is waiting
+        self.pending: Optional[ScheduledCall] = None
+
+    def start_phase(self, generation: int):
+        self.cancel_pending()
+        self.generation = generation
+        self.last_payload = None
+        self.last_sent_at = None
+
+    def cancel_pending(self):
+        if self.pending is not None:
+            self.pending.cancel()
+            self.pending = None
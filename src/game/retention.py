@@ -0,0 +1,122 @@
+"""
+Retention policy bounding how much finished-round data a game keeps in memory
+"""
+
+import gzip
+import json
+import logging
+import os
+import uuid
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Rounds kept in full, counting the current round
+DEFAULT_HOT_ROUNDS = 3
+
+
+class RetentionPolicy:
+    """Keeps a game's last few rounds hot and compacts the rest
+
+    Compacted rounds keep who voted for whom, round points, pairings and
+    prompts but drop bribe content, ballots and the results payload, which
+    is where image data URLs live. If spill_dir is set the full round is
+    first written there as a gzipped JSON segment, and looking the round up
+    later loads a temporary copy from it while the game keeps the compacted
+    one.
+    """
+
+    __slots__ = ('hot_rounds', 'spill_dir')
+
+    def __init__(self, hot_rounds: int = DEFAULT_HOT_ROUNDS, spill_dir: Optional[str] = None):
+        self.hot_rounds = max(1, hot_rounds)
+        self.spill_dir = spill_dir
+
+    @classmethod
+    def from_env(cls) -> 'RetentionPolicy':
+        """Build a policy from HOT_ROUNDS and ROUND_SPILL_DIR"""
+        try:
+            hot_rounds = int(os.environ.get('HOT_ROUNDS', DEFAULT_HOT_ROUNDS))
+        except ValueError:
+            logger.warning("Ignoring invalid HOT_ROUNDS value")
+            hot_rounds = DEFAULT_HOT_ROUNDS
+        return cls(hot_rounds, os.environ.get('ROUND_SPILL_DIR') or None)
+
+    def apply(self, game):
+        """Compact every finished round older than the hot window"""
+        cold_count = len(game.past_rounds) - (self.hot_rounds - 1)
+        for round_state in game.past_rounds[:max(cold_count, 0)]:
+            if not round_state.compacted:
+                self.compact(game.game_id, round_state)
+
+    def shed(self, game) -> bool:
+        """Compact every finished round, hot ones too, to make room under memory pressure
+
+        Returns False if every finished round was already compacted.
+        """
+        shed = False
+        for round_state in game.past_rounds:
+            if not round_state.compacted:
+                self.compact(game.game_id, round_state)
+                shed = True
+        return shed
+
+    def compact(self, game_id: str, round_state):
+        """Spill a round to disk if configured, then drop its bulky data"""
+        if self.spill_dir:
+            self._spill(game_id, round_state)
+        round_state.compact()
+
+    def hydrate(self, round_state):
+        """Load a compacted round's full data from its segment
+
+        Returns a separate RoundState that is not part of the game, so the
+        loaded bribe content is freed once the caller drops it, or None if
+        the round was never spilled or its segment cannot be read.
+        """
+        path = round_state.segment
+        if path is None:
+            return None
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as segment:
+                data = json.load(segment)
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not load round {round_state.round_num} from {path}: {e}")
+            return None
+        loaded = type(round_state)(round_state.round_num)
+        loaded.restore(data)
+        return loaded
+
+    def discard(self, round_state):
+        """Delete a round's segment file, if it has one"""
+        path = round_state.segment
+        round_state.segment = None
+        if path is None:
+            return
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _spill(self, game_id: str, round_state):
+        if round_state.segment is None:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            filename = f"{game_id}-r{round_state.round_num}-{uuid.uuid4().hex[:8]}.json.gz"
+            round_state.segment = os.path.join(self.spill_dir, filename)
+        try:
+            with gzip.open(round_state.segment, 'wt', encoding='utf-8') as segment:
+                json.dump(round_state.to_dict(), segment, separators=(',', ':'))
+        except OSError as e:
+            logger.error(f"Could not spill round {round_state.round_num} of game {game_id}: {e}")
+            round_state.segment = None
+
+
+_default_policy: Optional[RetentionPolicy] = None
+
+
+def get_default_policy() -> RetentionPolicy:
+    """Get the process-wide policy configured from the environment"""
+    global _default_policy
+    if _default_policy is None:
+        _default_policy = RetentionPolicy.from_env()
+    return _default_policy
@@ -0,0 +1,114 @@
+"""
+LobbyRoster class publishing a game's lobby as versioned snapshots and patches
+"""
+
+from typing import Dict, Optional
+
+
+class LobbyRoster:
+    """Versioned copy of what players see in the lobby
+
+    publish() compares the game against the last published state and, if
+    anything visible changed, bumps the version and returns a patch holding
+    only the differences. Clients apply patches in version order and ask
+    for a snapshot() when they notice a gap, so lobby churn costs bytes in
+    proportion to what changed rather than to the size of the lobby.
+
+    The roster doubles as the game's handle table: players appear by the
+    small integer handle other payloads use in place of their ID, next to
+    the username and host flag those payloads leave out. Every change to
+    who is in a game is followed by a publish, so the table is current
+    whenever another payload mentions a handle.
+    """
+
+    __slots__ = ('version', '_players', '_settings', '_summary')
+
+    def __init__(self):
+        self.version = 0
+        # player_id -> player entry as last published, in join order
+        self._players: Dict[str, dict] = {}
+        self._settings: dict = {}
+        # player_count and can_start as last published
+        self._summary: dict = {}
+
+    @staticmethod
+    def player_entry(game, player_id: str, player) -> dict:
+        """Get one player as shown in the lobby"""
+        return {
+            'handle': game.handle_of(player_id),
+            'username': player.username,
+            'is_host': player_id == game.host_id,
+            'connected': player.connected,
+            'score': game.scores.get(player_id, 0)
+        }
+
+    @staticmethod
+    def summary(game) -> dict:
+        return {
+            'player_count': game.get_connected_player_count(),
+            'can_start': game.can_start_game()
+        }
+
+    def publish(self, game) -> Optional[dict]:
+        """Record the game's current lobby, returns the patch or None if unchanged"""
+        players = {pid: self.player_entry(game, pid, player) for pid, player in game.players.items()}
+        patch = {}
+
+        added = [entry for pid, entry in players.items() if pid not in self._players]
+        removed = [entry['handle'] for pid, entry in self._players.items() if pid not in players]
+        changed = []
+        for pid, entry in players.items():
+            previous = self._players.get(pid)
+            if previous is None or previous == entry:
+                continue
+            diff = {key: value for key, value in entry.items() if previous.get(key) != value}
+            diff['handle'] = entry['handle']
+            changed.append(diff)
+        settings = {key: value for key, value in game.settings.items()
+                    if key not in self._settings or self._settings[key] != value}
+        summary = self.summary(game)
+
+        if added:
+            patch['added'] = added
+        if removed:
+            patch['removed'] = removed
+        if changed:
+            patch['changed'] = changed
+        if settings:
+            patch['settings'] = settings
+        if not patch and summary == self._summary:
+            return None
+
+        self._players = players
+        self._settings = dict(game.settings)
+        self._summary = summary
+        self.version += 1
+        patch['from_version'] = self.version - 1
+        patch['version'] = self.version
+        patch.update(summary)
+        return patch
+
+    def to_dict(self) -> dict:
+        """Get the published state as JSON-friendly values, see restore()"""
+        return {
+            'version': self.version,
+            'players': [[pid, entry] for pid, entry in self._players.items()],
+            'settings': dict(self._settings),
+            'summary': dict(self._summary)
+        }
+
+    def restore(self, data: dict):
+        """Pick up from to_dict() output, so patches continue the same versions"""
+        self.version = data['version']
+        self._players = {pid: entry for pid, entry in data['players']}
+        self._settings = dict(data['settings'])
+        self._summary = dict(data['summary'])
+
+    def snapshot(self) -> dict:
+        """Get the last published lobby in full"""
+        return {
+            'version': self.version,
+            'players': list(self._players.values()),
+            'settings': dict(self._settings),
+            **self._summary
+        }
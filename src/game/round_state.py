@@ -0,0 +1,378 @@
+"""
+RoundState class holding all per-round data for a single game round
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .ballot import Ballot
+from .memory import MemoryMeter, prompt_size, submission_size
+from .phase_tracker import PhaseTracker
+
+
+class FrozenResults(dict):
+    """Read-only dict holding a payload that was already sent to clients
+
+    Still a dict so it can be emitted as is; every nested dict is frozen
+    too and lists become tuples, so nothing replaying it can change it.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def freeze(cls, value: Any) -> Any:
+        """Get a read-only copy of a JSON-friendly value"""
+        if isinstance(value, dict):
+            return cls((key, cls.freeze(item)) for key, item in value.items())
+        if isinstance(value, (list, tuple)):
+            return tuple(cls.freeze(item) for item in value)
+        return value
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("frozen round results cannot be changed")
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    __ior__ = _read_only
+
+    def __reduce__(self):
+        # Copies and pickles, e.g. through a message queue, come out as plain dicts
+        return dict, (dict(self),)
+
+
+class RoundState:
+    """All data belonging to one round of a game
+
+    Game.current points at the round in progress; finished rounds are kept
+    in Game.past_rounds. Keeping a round's data together means hot paths do
+    a single attribute lookup and dropping a round frees everything at once.
+    """
+
+    __slots__ = ('round_num', 'pairings', 'submissions', 'inbox', 'ballots', 'votes',
+                 'voted_players', 'vote_credit', 'tally', 'prompts', 'prompt_ready', 'progress',
+                 'results', 'compacted', 'segment', 'content_bytes', 'meter')
+
+    # Per-round containers, also exposed through the legacy mappings on Game
+    FIELDS = ('pairings', 'submissions', 'inbox', 'ballots', 'votes', 'voted_players',
+              'vote_credit', 'tally', 'prompts', 'prompt_ready')
+    # Fields holding bribe content, dropped when a finished round is compacted
+    BULKY_FIELDS = ('submissions', 'inbox', 'ballots')
+
+    def __init__(self, round_num: int):
+        self.round_num = round_num
+        # {player_id: [target1, target2]}
+        self.pairings: Dict[str, List[str]] = {}
+        # {player_id: {target_id: submission}}
+        self.submissions: Dict[str, Dict[str, dict]] = {}
+        # Same submissions indexed by recipient: {target_id: {player_id: submission}}
+        self.inbox: Dict[str, Dict[str, dict]] = {}
+        # {voter_id: Ballot fixed when voting opened}
+        self.ballots: Dict[str, Ballot] = {}
+        # {player_id: chosen_bribe_id}
+        self.votes: Dict[str, str] = {}
+        # Players who voted, kept even if they disconnect afterwards
+        self.voted_players: Set[str] = set()
+        # {voter_id: (submitter_id, target_id, points)} for each counted vote
+        self.vote_credit: Dict[str, Tuple[str, str, float]] = {}
+        # Running points earned this round: {submitter_id: points}
+        self.tally: Dict[str, float] = {}
+        # {player_id: chosen_prompt}
+        self.prompts: Dict[str, str] = {}
+        # {player_id: ready_status}
+        self.prompt_ready: Dict[str, bool] = {}
+        # Outstanding work in the phase being played, see begin_phase()
+        self.progress: Optional[PhaseTracker] = None
+        # round_results payload as sent when voting ended, frozen once
+        self.results: Optional[FrozenResults] = None
+        # Set once bulky data was dropped by the game's RetentionPolicy
+        self.compacted = False
+        # Path of the on-disk copy of a compacted round, if it was spilled
+        self.segment: Optional[str] = None
+        # Approximate bytes of bribe content and prompts, reported to meter
+        self.content_bytes = 0
+        self.meter: Optional[MemoryMeter] = None
+
+    def attach_meter(self, meter: Optional[MemoryMeter]):
+        """Count this round's content towards a game's meter instead of the current one"""
+        if self.meter is not None:
+            self.meter.add(-self.content_bytes)
+        self.meter = meter
+        if meter is not None:
+            meter.add(self.content_bytes)
+
+    def _resize(self, delta: int):
+        self.content_bytes += delta
+        if self.meter is not None:
+            self.meter.add(delta)
+
+    def recount(self):
+        """Recompute the content size after metered fields were replaced wholesale"""
+        size = sum(prompt_size(prompt) for prompt in self.prompts.values())
+        for submissions in self.submissions.values():
+            if isinstance(submissions, dict):
+                size += sum(submission_size(submission) for submission in submissions.values())
+        self._resize(size - self.content_bytes)
+
+    def begin_phase(self, phase: str, participant_ids: Iterable[str],
+                    active_player_ids: Iterable[str]) -> PhaseTracker:
+        """Start tracking who still owes work in a phase of this round
+
+        participant_ids are all players taking part in the round, connected or
+        not, so a player who reconnects mid-phase is expected to finish too.
+        """
+        owed: Dict[str, int] = {}
+        done: Dict[str, int] = {}
+        for player_id in participant_ids:
+            if phase == "submission":
+                targets = self.pairings.get(player_id, [])
+                sent = self.submissions.get(player_id, {})
+                owed[player_id] = len(targets)
+                done[player_id] = sum(1 for target_id in targets if target_id in sent)
+            elif phase == "voting":
+                owed[player_id] = 1
+                done[player_id] = int(player_id in self.voted_players)
+            else:
+                owed[player_id] = 1
+                done[player_id] = int(bool(self.prompt_ready.get(player_id)))
+        self.progress = PhaseTracker(phase, owed, done, active_player_ids)
+        return self.progress
+
+    def tracker_for(self, phase: str) -> Optional[PhaseTracker]:
+        """Get the progress tracker if it is tracking the given phase"""
+        progress = self.progress
+        if progress is not None and progress.phase == phase:
+            return progress
+        return None
+
+    def select_prompt(self, player_id: str, prompt: str):
+        """Store a player's prompt choice and mark them ready"""
+        previous = self.prompts.get(player_id)
+        self._resize(prompt_size(prompt) - (prompt_size(previous) if previous is not None else 0))
+        self.prompts[player_id] = prompt
+        self.prompt_ready[player_id] = True
+        progress = self.tracker_for("prompt_selection")
+        if progress is not None:
+            progress.mark_done(player_id)
+
+    def add_submission(self, player_id: str, target_id: str, submission: dict):
+        """Record a bribe from player_id to target_id, replacing any earlier one"""
+        sent = self.submissions.setdefault(player_id, {})
+        progress = self.tracker_for("submission")
+        if (progress is not None and target_id not in sent
+                and target_id in self.pairings.get(player_id, ())):
+            progress.record(player_id)
+        previous = sent.get(target_id)
+        self._resize(submission_size(submission)
+                     - (submission_size(previous) if previous is not None else 0))
+        sent[target_id] = submission
+        self.inbox.setdefault(target_id, {})[player_id] = submission
+
+    def bribes_for(self, target_id: str) -> Dict[str, dict]:
+        """Get {player_id: submission} for all bribes sent to a target"""
+        return self.inbox.get(target_id, {})
+
+    def open_ballots(self, voter_ids: Iterable[str]):
+        """Fix each voter's ballot from the bribes they received"""
+        for voter_id in voter_ids:
+            self.ballots[voter_id] = Ballot.build(voter_id, self.bribes_for(voter_id))
+
+    def ballot_order(self) -> Dict[str, List[str]]:
+        """Get {voter_id: [bribe_ids]} in the order each ballot was shown"""
+        return {voter_id: [option.bribe_id for option in ballot]
+                for voter_id, ballot in self.ballots.items()}
+
+    def restore_ballots(self, order: Dict[str, List[str]]):
+        """Rebuild ballots from the inbox, keeping the order from ballot_order()"""
+        self.ballots = {}
+        for voter_id, bribe_ids in order.items():
+            built = Ballot.build(voter_id, self.bribes_for(voter_id))
+            self.ballots[voter_id] = Ballot(
+                voter_id, [built.get(bribe_id) for bribe_id in bribe_ids if bribe_id in built])
+
+    def rebuild_inbox(self):
+        """Recompute the inbox after submissions were replaced wholesale"""
+        self.inbox = {}
+        for player_id, submissions in self.submissions.items():
+            if not isinstance(submissions, dict):
+                continue
+            for target_id, submission in submissions.items():
+                self.inbox.setdefault(target_id, {})[player_id] = submission
+
+    def record_vote(self, voter_id: str, bribe_id: str, submitter_id: Optional[str] = None,
+                    target_id: Optional[str] = None, points: float = 0):
+        """Store a vote and update the round tally, replacing any earlier vote
+
+        Votes that do not credit a submitter still count as the voter having
+        voted.
+        """
+        self._uncredit(voter_id)
+        self.votes[voter_id] = bribe_id
+        if voter_id not in self.voted_players:
+            self.voted_players.add(voter_id)
+            progress = self.tracker_for("voting")
+            if progress is not None:
+                progress.mark_done(voter_id)
+        if submitter_id is not None:
+            self.credit_vote(voter_id, submitter_id, target_id, points)
+
+    def credit_vote(self, voter_id: str, submitter_id: str, target_id: str, points: float):
+        """Credit a voter's choice to a submitter in the round tally"""
+        self.vote_credit[voter_id] = (submitter_id, target_id, points)
+        self.tally[submitter_id] = self.tally.get(submitter_id, 0) + points
+
+    def freeze_results(self, payload: dict) -> FrozenResults:
+        """Keep the round_results payload so reconnecting players get the same view"""
+        self.results = FrozenResults.freeze(payload)
+        return self.results
+
+    def get_results(self) -> Optional[FrozenResults]:
+        """Get the frozen round_results payload, or None before results"""
+        return self.results
+
+    def forget_player(self, player_id: str):
+        """Drop a removed player's vote and any points credited to them"""
+        self._uncredit(player_id)
+        self.tally.pop(player_id, None)
+        for voter_id, (submitter_id, target_id, _) in list(self.vote_credit.items()):
+            if player_id in (submitter_id, target_id):
+                self._uncredit(voter_id)
+
+    def _uncredit(self, voter_id: str):
+        credit = self.vote_credit.pop(voter_id, None)
+        if credit is not None:
+            submitter_id, _, points = credit
+            if submitter_id in self.tally:
+                self.tally[submitter_id] -= points
+
+    def compact(self):
+        """Drop bribe content and derived data, keeping votes, points and metadata"""
+        for field in self.BULKY_FIELDS:
+            setattr(self, field, self.empty_field(field))
+        self.progress = None
+        self.results = None
+        self.compacted = True
+        self.recount()
+
+    def to_dict(self) -> dict:
+        """Get the round's data as JSON-friendly values"""
+        return {
+            'round_num': self.round_num,
+            'pairings': self.pairings,
+            'submissions': self.submissions,
+            'votes': self.votes,
+            'voted_players': list(self.voted_players),
+            'vote_credit': self.vote_credit,
+            'tally': self.tally,
+            'prompts': self.prompts,
+            'prompt_ready': self.prompt_ready,
+            'results': self.results,
+        }
+
+    def restore(self, data: dict):
+        """Load data produced by to_dict(), e.g. from a spilled segment"""
+        self.pairings = data.get('pairings', {})
+        self.submissions = data.get('submissions', {})
+        self.votes = data.get('votes', {})
+        self.voted_players = set(data.get('voted_players', ()))
+        self.vote_credit = {voter_id: tuple(credit)
+                            for voter_id, credit in data.get('vote_credit', {}).items()}
+        self.tally = data.get('tally', {})
+        self.prompts = data.get('prompts', {})
+        self.prompt_ready = data.get('prompt_ready', {})
+        results = data.get('results')
+        self.results = FrozenResults.freeze(results) if results is not None else None
+        self.rebuild_inbox()
+        self.recount()
+        self.compacted = False
+
+    @staticmethod
+    def empty_field(field: str):
+        """Return a fresh empty container for one of the round fields"""
+        return set() if field == 'voted_players' else {}
+
+    def is_empty(self) -> bool:
+        """Check if no data has been recorded for this round"""
+        return not any(getattr(self, field) for field in self.FIELDS)
+
+    def release(self):
+        """Drop all data held by this round"""
+        for field in self.FIELDS:
+            setattr(self, field, self.empty_field(field))
+        self.progress = None
+        self.results = None
+        self.recount()
+
+    def __repr__(self):
+        return (f"RoundState(round={self.round_num}, submitters={len(self.submissions)}, "
+                f"votes={len(self.votes)})")
+
+
+def read_only(value: Any) -> Any:
+    """Get a read-only view of round data, or a frozen copy of a list or set"""
+    if isinstance(value, dict):
+        return ReadOnlyMapping(value)
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+class ReadOnlyMapping(Mapping):
+    """Read-only view of a dict whose nested values come back read-only too
+
+    Nothing is copied up front; each lookup wraps the value it returns.
+    """
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data: dict):
+        self._data = data
+
+    def __getitem__(self, key):
+        return read_only(self._data[key])
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self):
+        return repr(self._data)
+
+
+class RoundFieldView(Mapping):
+    """Read-only {round_num: field} mapping over a game's RoundState objects
+
+    Backs the older Game.bribes / Game.votes / Game.round_pairings style
+    attributes so existing readers keep working while the data itself lives
+    on RoundState. Writes go through RoundState (add_submission,
+    record_vote, select_prompt, ...) so the inbox, tally, progress and
+    memory meter stay in step, which is why nothing here can be assigned.
+    """
+
+    __slots__ = ('_game', '_field')
+
+    def __init__(self, game, field: str):
+        self._game = game
+        self._field = field
+
+    def __getitem__(self, round_num: int):
+        round_state = self._game.get_round(round_num)
+        if round_state is None:
+            raise KeyError(round_num)
+        return read_only(getattr(round_state, self._field))
+
+    def __iter__(self):
+        return iter([round_state.round_num for round_state in self._game.iter_rounds()])
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._game.iter_rounds())
+
+    def __repr__(self):
+        return repr({round_num: getattr(self._game.get_round(round_num), self._field)
+                     for round_num in self})
@@ -0,0 +1,225 @@
+"""
+DeadlineScheduler class running every timed callback from one loop
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class ScheduledCall:
+    """Handle for a callback waiting in a DeadlineScheduler"""
+
+    __slots__ = ('deadline', 'callback', 'args', 'cancelled', 'fired', '_seq')
+
+    def __init__(self, deadline: float, seq: int, callback: Callable, args: tuple):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        # Set once the deadline passed and the call was handed off to run
+        self.fired = False
+        self._seq = seq
+
+    def cancel(self):
+        """Stop the callback from running if it has not started yet"""
+        self.cancelled = True
+
+    @property
+    def pending(self) -> bool:
+        """Whether the call is still waiting for its deadline"""
+        return not (self.cancelled or self.fired)
+
+    def __lt__(self, other: 'ScheduledCall') -> bool:
+        return (self.deadline, self._seq) < (other.deadline, other._seq)
+
+    def __repr__(self):
+        name = getattr(self.callback, '__name__', repr(self.callback))
+        return f"ScheduledCall({name}, deadline={self.deadline:.3f}, cancelled={self.cancelled})"
+
+
+class DeadlineScheduler:
+    """Runs callbacks at their deadlines from a single heap and loop
+
+    Phase timers, results waits and cleanups for every game share one
+    background loop instead of a sleeping thread each. The loop is started
+    with start_task and waits on an event from make_event until the earliest
+    deadline, or until call_later adds an earlier one and sets the event.
+    Passing socketio's start_background_task and its server's create_event
+    keeps it on the server's async hub, and an idle server never wakes. Due
+    callbacks are handed to dispatch, which by default starts a short task
+    per callback so one slow game cannot hold up everybody else's timers.
+    Cancelled calls are dropped lazily when they reach the top of the heap.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic,
+                 start_task: Optional[Callable] = None,
+                 make_event: Callable = threading.Event,
+                 dispatch: Optional[Callable] = None):
+        self.clock = clock
+        self._start_task = start_task or _start_daemon_thread
+        self._make_event = make_event
+        self._dispatch = dispatch or self._start_task
+        self._heap: List[ScheduledCall] = []
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._running = False
+        # Set to cut the loop's wait short, made fresh each time it starts
+        self._wake = None
+
+    def configure(self, start_task: Optional[Callable] = None,
+                  make_event: Optional[Callable] = None):
+        """Switch to another async hub, e.g. once socketio is known"""
+        with self._lock:
+            if start_task is not None:
+                self._start_task = start_task
+                self._dispatch = start_task
+            if make_event is not None:
+                self._make_event = make_event
+
+    def call_later(self, delay: float, callback: Callable, *args) -> ScheduledCall:
+        """Run callback(*args) after delay seconds, returns a cancellable handle"""
+        call = ScheduledCall(self.clock() + max(0.0, delay), next(self._seq), callback, args)
+        with self._lock:
+            heapq.heappush(self._heap, call)
+            start = not self._running
+            if start:
+                self._running = True
+                self._wake = self._make_event()
+            elif self._heap[0] is call:
+                # The loop is waiting for a later deadline, wake it to wait less
+                self._wake.set()
+        if start:
+            self._start_task(self._run)
+        return call
+
+    def pop_due(self) -> List[ScheduledCall]:
+        """Remove and return the live calls whose deadline has passed, in order"""
+        now = self.clock()
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0].deadline <= now:
+                call = heapq.heappop(self._heap)
+                if not call.cancelled:
+                    call.fired = True
+                    due.append(call)
+        return due
+
+    def next_deadline(self) -> Optional[float]:
+        """Deadline of the earliest live call, or None if nothing is waiting"""
+        with self._lock:
+            while self._heap and self._heap[0].cancelled:
+                heapq.heappop(self._heap)
+            return self._heap[0].deadline if self._heap else None
+
+    def _run(self):
+        while True:
+            for call in self.pop_due():
+                self._dispatch(self._fire, call)
+            with self._lock:
+                if not self._heap:
+                    # Nothing left to wait for, the next call_later restarts the loop
+                    self._running = False
+                    return
+                # Cleared under the lock, so an earlier call added from here on still wakes us
+                self._wake.clear()
+                wait = self._heap[0].deadline - self.clock()
+            self._wake.wait(max(wait, 0.0))
+
+    @staticmethod
+    def _fire(call: ScheduledCall):
+        if call.cancelled:
+            return
+        try:
+            call.callback(*call.args)
+        except Exception:
+            logger.exception(f"Scheduled call {call!r} failed")
+
+    def __len__(self) -> int:
+        """Number of calls waiting, including cancelled ones not yet dropped"""
+        return len(self._heap)
+
+
+class VirtualClock:
+    """Clock that only moves when told to"""
+
+    __slots__ = ('now',)
+
+    def __init__(self, start: float = 0.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+class VirtualScheduler(DeadlineScheduler):
+    """DeadlineScheduler on virtual time, for tests and simulations
+
+    Nothing runs in the background. run_next() jumps the clock straight to
+    the next deadline and runs what is due there on the calling thread, so
+    hours of timed games play out in however long their callbacks take and
+    timer races replay the same way every time. Exceptions from callbacks
+    propagate to the caller instead of being logged.
+    """
+
+    def __init__(self, start: float = 0.0):
+        super().__init__(clock=VirtualClock(start), start_task=_no_task)
+
+    def run_due(self) -> int:
+        """Run the calls due at the current virtual time, returns how many ran"""
+        ran = 0
+        due = self.pop_due()
+        while due:
+            for call in due:
+                if not call.cancelled:
+                    call.callback(*call.args)
+                    ran += 1
+            # Callbacks may schedule more work for the same instant
+            due = self.pop_due()
+        return ran
+
+    def run_next(self) -> bool:
+        """Jump to the next deadline and run it, returns False if none is waiting"""
+        deadline = self.next_deadline()
+        if deadline is None:
+            return False
+        self.clock.now = max(self.clock.now, deadline)
+        self.run_due()
+        return True
+
+    def advance(self, seconds: float) -> int:
+        """Move the clock forward, running everything due on the way in order"""
+        target = self.clock.now + seconds
+        ran = self.run_due()
+        while True:
+            deadline = self.next_deadline()
+            if deadline is None or deadline > target:
+                break
+            self.clock.now = max(self.clock.now, deadline)
+            ran += self.run_due()
+        self.clock.now = target
+        return ran
+
+    def run_until_idle(self, max_steps: int = 100000) -> int:
+        """Run deadlines until none are left, returns how many steps it took"""
+        steps = 0
+        while steps < max_steps and self.run_next():
+            steps += 1
+        return steps
+
+
+def _no_task(target: Callable, *args):
+    return None
+
+
+def _start_daemon_thread(target: Callable, *args):
+    thread = threading.Thread(target=target, args=args, daemon=True)
+    thread.start()
+    return thread
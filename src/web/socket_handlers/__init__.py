@@ -16,6 +16,7 @@ socketio = None
 __all__ = [
     'register_socket_handlers',
     'get_game_manager',
+    'get_scheduler',
     'emit_submission_progress',
     'emit_voting_progress',
 ]
@@ -42,6 +43,7 @@ def register_socket_handlers(socketio_instance):
         handle_join_game,
         handle_kick_player,
         handle_next_round,
+        handle_request_lobby_snapshot,
         handle_restart_game,
         handle_return_to_lobby,
         handle_select_prompt,
@@ -50,24 +52,26 @@ def register_socket_handlers(socketio_instance):
         handle_submit_vote,
         handle_get_game_state,
         handle_update_settings,
+        run_on_game_actor,
     )
 
-    # Register all handlers
+    # Register all handlers; everything but game creation runs on the
+    # target game's actor so changes to one game never overlap
     socketio.on_event('create_game', handle_create_game)
-    socketio.on_event('join_game', handle_join_game)
-    socketio.on_event('start_game', handle_start_game)
-    socketio.on_event('select_prompt', handle_select_prompt)
-    socketio.on_event('submit_bribe', handle_submit_bribe)
-    socketio.on_event('submit_vote', handle_submit_vote)
-    socketio.on_event('restart_game', handle_restart_game)
-    socketio.on_event('return_to_lobby', handle_return_to_lobby)
-    socketio.on_event('next_round', handle_next_round)
-    socketio.on_event('disconnect', handle_disconnect)
-    socketio.on_event('get_game_state', handle_get_game_state)
-    socketio.on_event('update_settings', handle_update_settings)
-    socketio.on_event('kick_player', handle_kick_player)
-
+    socketio.on_event('join_game', run_on_game_actor(handle_join_game))
+    socketio.on_event('start_game', run_on_game_actor(handle_start_game))
+    socketio.on_event('select_prompt', run_on_game_actor(handle_select_prompt))
+    socketio.on_event('submit_bribe', run_on_game_actor(handle_submit_bribe))
+    socketio.on_event('submit_vote', run_on_game_actor(handle_submit_vote))
+    socketio.on_event('restart_game', run_on_game_actor(handle_restart_game))
+    socketio.on_event('return_to_lobby', run_on_game_actor(handle_return_to_lobby))
+    socketio.on_event('next_round', run_on_game_actor(handle_next_round))
+    socketio.on_event('disconnect', run_on_game_actor(handle_disconnect))
+    socketio.on_event('get_game_state', run_on_game_actor(handle_get_game_state))
+    socketio.on_event('request_lobby_snapshot', run_on_game_actor(handle_request_lobby_snapshot))
+    socketio.on_event('update_settings', run_on_game_actor(handle_update_settings))
+    socketio.on_event('kick_player', run_on_game_actor(handle_kick_player))
 
 # Import these after the function definition to avoid circular imports
-from .game_flow import get_game_manager
+from .game_flow import get_game_manager, get_scheduler
 from .progress_tracking import emit_submission_progress, emit_voting_progress
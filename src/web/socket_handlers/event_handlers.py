@@ -4,9 +4,9 @@ Socket.IO event handlers for the Bribery game.
 This module contains the handlers for all Socket.IO events.
 """
 
+import functools
 import logging
 import random
-import string
 import uuid
 
 from flask import request
@@ -14,6 +14,7 @@ from flask_socketio import emit, join_room
 
 from .game_flow import (
     check_all_submissions_complete,
+    check_phase_complete,
     continue_or_end_game,
     emit_lobby_update,
     emit_midgame_joiner_state,
@@ -30,6 +31,45 @@ from ..utils import get_player_room
 logger = logging.getLogger(__name__)
 
 
+# Returned in place of a handler's result when its game was replaced
+_STALE_GAME = object()
+
+
+def run_on_game_actor(handler):
+    """Wrap an event handler so it runs on the actor of the game it targets
+
+    The game comes from the event's game_id when given, otherwise from the
+    sender's session. Events for unknown games run directly. If the game
+    was hibernated while the event waited for its actor, the event is run
+    again on the actor of the game that was woken in its place.
+    """
+    @functools.wraps(handler)
+    def wrapper(*args):
+        while True:
+            game = _get_request_game(args[0] if args else None)
+            if game is None:
+                return handler(*args)
+            result = game.actor.run(_run_if_registered, game, handler, args)
+            if result is not _STALE_GAME:
+                return result
+    return wrapper
+
+
+def _run_if_registered(game, handler, args):
+    if game_manager.games.get(game.game_id) is not game:
+        return _STALE_GAME
+    return handler(*args)
+
+
+def _get_request_game(data):
+    if isinstance(data, dict) and isinstance(data.get('game_id'), str):
+        return game_manager.get_game(data['game_id'].strip())
+    player_session = game_manager.get_player_session(request.sid)
+    if player_session:
+        return game_manager.get_game(player_session.game_id)
+    return None
+
+
 def handle_create_game(data):
     """Handle game creation request"""
     # Input validation
@@ -42,13 +82,12 @@ def handle_create_game(data):
         emit('error', {'message': 'Username is required'})
         return
 
-    # Generate 4-character game code (letters and digits)
-    characters = string.ascii_uppercase + string.digits
-    game_id = ''.join(random.choice(characters) for _ in range(4))
-    
-    # Ensure uniqueness (very unlikely collision with 4 chars, but check anyway)
-    while game_manager.get_game(game_id) is not None:
-        game_id = ''.join(random.choice(characters) for _ in range(4))
+    # Draw an unused game code (4 letters and digits by default)
+    try:
+        game_id = game_manager.allocate_game_code()
+    except RuntimeError:
+        emit('error', {'message': 'No game codes available, please try again later'})
+        return
     
     player_id = str(uuid.uuid4())
 
@@ -65,6 +104,10 @@ def handle_create_game(data):
     }
 
     game = Game(game_id, player_id, settings)
+    if not game.can_store_player(player_id, username.strip()):
+        game_manager.codes.release(game_id)
+        emit('error', {'message': 'The server is full, please try again later'})
+        return
     game.add_player(player_id, username.strip())
 
     game_manager.add_game(game)
@@ -73,14 +116,17 @@ def handle_create_game(data):
             request.sid, player_id, game_id))
 
     join_room(game_id)
+    join_room(get_player_room(player_id))
 
     emit('game_created', {
         'game_id': game_id,
         'player_id': player_id,
+        'handle': game.handle_of(player_id),
         'is_host': True
     })
 
     emit_lobby_update(game_id)
+    emit('lobby_snapshot', game.roster.snapshot())
 
 
 def handle_join_game(data):
@@ -107,12 +153,7 @@ def handle_join_game(data):
     username = username.strip()
 
     # Get game with case-insensitive matching (extra fault tolerance)
-    game = None
-    for gid in game_manager.games:
-        if gid.upper() == game_id.upper():
-            game = game_manager.get_game(gid)
-            game_id = gid  # Use the actual case from the stored game
-            break
+    game = game_manager.get_game(game_id)
             
     if not game:
         # Send specific 'game_not_found' event for better user experience
@@ -124,6 +165,8 @@ def handle_join_game(data):
         emit('game_ended', {'message': 'This game has already ended.'})
         return
 
+    game_id = game.game_id  # Use the actual case from the stored game
+
     # Import here to avoid circular imports
     from game import PlayerSession
 
@@ -139,25 +182,24 @@ def handle_join_game(data):
     if stored_player_id and stored_player_id in game.players:
         existing_player_id = stored_player_id
         logger.info(f"Player rejoining with stored ID: {username} ({stored_player_id})")
-        # Update username in case it changed
-        game.players[existing_player_id]['username'] = username
+        # Update username in case it changed, unless the new one would not fit in memory
+        if game.can_store_player(existing_player_id, username):
+            game.players[existing_player_id].username = username
     else:
         # Fallback to username matching (traditional rejoin)
-        for pid, player in game.players.items():
-            if player['username'].lower() == username.lower():  # Case-insensitive match
-                existing_player_id = pid
-                logger.info(f"Player rejoining by username match: {username} ({pid})")
-                break
+        existing_player_id = game.find_player_by_username(username)  # Case-insensitive match
+        if existing_player_id:
+            logger.info(f"Player rejoining by username match: {username} ({existing_player_id})")
 
     if existing_player_id:
         # Player rejoining
         player_id = existing_player_id
-        game.players[player_id]['connected'] = True
+        game.set_player_connected(player_id, True)
         
         # Clean up any existing socket sessions for this player_id to prevent duplicates
         # This ensures only one socket session per player
-        for sid, session in list(game_manager.player_sessions.items()):
-            if session.player_id == player_id and sid != request.sid:
+        for sid in game_manager.get_player_socket_ids(player_id):
+            if sid != request.sid:
                 logger.info(f"Cleaning up existing socket session for player {player_id}")
                 game_manager.remove_player_session(sid)
         
@@ -167,23 +209,30 @@ def handle_join_game(data):
     else:
         # New player
         player_id = str(uuid.uuid4())
-        game.add_player(player_id, username)
+        if not game.can_store_player(player_id, username):
+            emit('error', {'message': 'The server is full, please try again later'})
+            return
+        game_manager.join_game(game_id, player_id, username)
         game_manager.add_player_session(
             request.sid, PlayerSession(
                 request.sid, player_id, game_id))
         logger.info(f"New player joined: {username} ({player_id})")
 
     join_room(game_id)
+    join_room(get_player_room(player_id))
 
     emit('joined_game', {
         'game_id': game_id,
         'player_id': player_id,
         'username': username,  # Include username for client-side storage
+        'handle': game.handle_of(player_id),
         'is_host': player_id == game.host_id,
         'game_state': game.state
     })
 
+    # Others get the change as a patch, the joiner needs the whole lobby
     emit_lobby_update(game_id)
+    emit('lobby_snapshot', game.roster.snapshot())
 
     # If game is in progress, send appropriate state for mid-game joiner
     if game.state != "lobby":
@@ -238,23 +287,18 @@ def handle_select_prompt(data):
         available_prompts = load_prompts()
         prompt = random.choice(available_prompts)
 
-    # Initialize round data if needed
-    if game.current_round not in game.player_prompts:
-        game.player_prompts[game.current_round] = {}
-    if game.current_round not in game.player_prompt_ready:
-        game.player_prompt_ready[game.current_round] = {}
+    if not game.can_store_prompt(player_id, prompt):
+        emit('error', {'message': 'The server is short on memory, please pick a shorter prompt'})
+        return
 
     # Store player's prompt choice
-    game.player_prompts[game.current_round][player_id] = prompt
-    game.player_prompt_ready[game.current_round][player_id] = True
+    game.current.select_prompt(player_id, prompt)
 
     emit('prompt_selected', {'success': True})
 
     # Check if all players have selected prompts
     if game.all_players_prompt_ready(game.current_round):
-        if game.round_timer:
-            game.round_timer.cancel()
-        start_submission_phase(game)
+        start_submission_phase(game, game.phase_generation)
 
 
 def handle_submit_bribe(data):
@@ -278,10 +322,14 @@ def handle_submit_bribe(data):
         emit('error', {'message': 'Invalid request data'})
         return
 
-    target_id = data.get('target_id')
+    # Clients name the target by handle, a full player ID is accepted too
+    target = data.get('target_id')
     submission = data.get('submission')
 
-    if not target_id or not isinstance(target_id, str):
+    target_id = game.player_for_handle(target)
+    if target_id is None and isinstance(target, str):
+        target_id = target.strip()
+    if not target_id:
         emit('error', {'message': 'Target ID is required'})
         return
 
@@ -290,20 +338,28 @@ def handle_submit_bribe(data):
         emit('error', {'message': 'Submission is required'})
         return
 
-    target_id = target_id.strip()
     submission = submission.strip()
 
-    # Initialize player's bribes for this round if not exists
-    if player_id not in game.bribes[game.current_round]:
-        game.bribes[game.current_round][player_id] = {}
-
-    game.bribes[game.current_round][player_id][target_id] = {
+    bribe = {
         'content': submission,
         'type': data.get('type', 'text'),
         'is_random': False  # Player-submitted bribes are not random
     }
 
-    emit('bribe_submitted', {'target_id': target_id})
+    # Refuse bribes over the size cap, or that would push the server past
+    # its memory budget even after shedding this game's old rounds
+    if game.memory.too_large(bribe):
+        emit('error', {'message': 'Bribe is too large'})
+        return
+    if not game.can_store_submission(player_id, target_id, bribe):
+        emit('error', {'message': 'The server is short on memory, please send a smaller bribe'})
+        return
+
+    # Store the bribe under both the submitter and the target's inbox
+    game.current.add_submission(player_id, target_id, bribe)
+
+    # Echo the target the way the client named it
+    emit('bribe_submitted', {'target_id': target if isinstance(target, int) else target_id})
 
     # Check if all submissions are in
     check_all_submissions_complete(game)
@@ -330,38 +386,37 @@ def handle_submit_vote(data):
         emit('error', {'message': 'Invalid request data'})
         return
 
-    bribe_id = data.get('bribe_id')
-    if not bribe_id or not isinstance(bribe_id, str):
+    # The option's number on the voter's ballot, or a full bribe ID
+    choice = data.get('bribe_id')
+    if isinstance(choice, str):
+        choice = choice.strip()
+    elif not isinstance(choice, int) or isinstance(choice, bool):
+        choice = None
+    if not choice:
         emit('error', {'message': 'Bribe ID is required'})
         return
 
-    # Store the vote in the game state
-    if game.current_round not in game.votes:
-        game.votes[game.current_round] = {}
-    
-    game.votes[game.current_round][player_id] = bribe_id.strip()
-    
-    # Record that this player has voted, even if they disconnect later
-    if not hasattr(game, 'voted_players'):
-        game.voted_players = {}
-    if game.current_round not in game.voted_players:
-        game.voted_players[game.current_round] = set()
-    
-    game.voted_players[game.current_round].add(player_id)
+    round_state = game.current
+
+    # Only bribes on the ballot fixed when voting opened can be chosen
+    ballot = round_state.ballots.get(player_id)
+    bribe_id = ballot.resolve(choice) if ballot is not None else None
+    if bribe_id is None:
+        emit('error', {'message': 'Invalid vote'})
+        return
+
+    # Store the vote and credit it so the round tally stays current; the
+    # player counts as voted even if they disconnect later
+    game.record_vote(round_state, player_id, bribe_id)
     
     emit('vote_submitted')
 
     # Emit progress update
     emit_voting_progress(game)
 
-    # Check if all votes are in - using our tracked voted_players set
-    active_player_count = len(game.get_active_player_ids())
-    voted_player_count = len(game.voted_players.get(game.current_round, set()))
-    
-    if voted_player_count >= active_player_count:
-        if game.round_timer:
-            game.round_timer.cancel()
-        end_voting_phase(game)
+    # Check if all votes are in
+    if game.get_phase_tracker("voting").is_complete():
+        end_voting_phase(game, game.phase_generation)
 
 
 def handle_restart_game():
@@ -379,12 +434,7 @@ def handle_restart_game():
         return
 
     # Reset game state
-    game.state = "lobby"
-    game.current_round = 0
-    game.bribes = {}
-    game.votes = {}
-    game.scores = {player_id: 0 for player_id in game.players}
-    game.round_pairings = {}
+    game.reset_to_lobby()
 
     # Import to avoid circular imports
     from . import socketio
@@ -411,7 +461,7 @@ def handle_next_round():
         return
 
     # Advance to next round or end game
-    continue_or_end_game(game)
+    continue_or_end_game(game, game.phase_generation)
 
 
 def handle_return_to_lobby():
@@ -429,20 +479,9 @@ def handle_return_to_lobby():
         return
 
     # Reset game state to lobby but keep players and settings
-    game.state = "lobby"
-    game.current_round = 0
-    game.bribes = {}
-    game.votes = {}
-    game.scores = {pid: 0 for pid in game.players}
-    game.current_prompt = ""
-    game.round_pairings = {}
-
     # Keep custom prompts setting and other game settings unchanged
     # Keep all players connected
-
-    if game.round_timer:
-        game.round_timer.cancel()
-        game.round_timer = None
+    game.reset_to_lobby()
 
     # Import to avoid circular imports
     from . import socketio
@@ -457,24 +496,18 @@ def handle_disconnect():
         game = game_manager.get_game(player_session.game_id)
 
         if game and player_session.player_id in game.players:
-            # Mark player as disconnected but keep their data
-            game.players[player_session.player_id]['connected'] = False
-            # Only emit update if this was the most recent connection for this player
-            # This prevents multiple disconnect events for the same player
-            
             # Check if there are other active sessions for this player
-            has_other_sessions = False
-            for sid, session in game_manager.player_sessions.items():
-                if (sid != request.sid and 
-                    session.player_id == player_session.player_id and 
-                    session.game_id == player_session.game_id):
-                    has_other_sessions = True
-                    break
-            
-            # Only notify others if this was the player's last active session
+            has_other_sessions = game_manager.has_other_sessions(
+                request.sid, player_session.player_id, player_session.game_id)
+
+            # Only a player's last session going away disconnects them
             if not has_other_sessions:
+                # Mark player as disconnected but keep their data
+                game.set_player_connected(player_session.player_id, False)
                 emit_lobby_update(player_session.game_id)
                 logger.info(f"Player {player_session.player_id} disconnected from game {player_session.game_id}")
+                # The phase may have been waiting only on this player
+                check_phase_complete(game)
             else:
                 logger.info(f"Duplicate session {request.sid} disconnected, player still connected via another session")
 
@@ -511,6 +544,22 @@ def handle_get_game_state(data):
     emit('game_state', state_data)
 
 
+def handle_request_lobby_snapshot():
+    """Handle a client that missed a lobby patch asking for the whole lobby"""
+    player_session = game_manager.get_player_session(request.sid)
+    if not player_session:
+        emit('error', {'message': 'You are not in a game session'})
+        return
+
+    game = game_manager.get_game(player_session.game_id)
+    if not game:
+        emit('error', {'message': 'Game not found'})
+        return
+
+    emit_lobby_update(game.game_id)
+    emit('lobby_snapshot', game.roster.snapshot())
+
+
 def handle_update_settings(data):
     """Handle game settings update from the host"""
     player_session = game_manager.get_player_session(request.sid)
@@ -566,10 +615,12 @@ def handle_kick_player(data):
         emit('error', {'message': 'Invalid request data'})
         return
 
+    # Clients name the player by handle, a full player ID is accepted too
+    handle = data.get('handle')
     player_id = data.get('player_id')
     game_id = data.get('game_id')
     
-    if not player_id or not game_id:
+    if not (player_id or handle is not None) or not game_id:
         emit('error', {'message': 'Missing required fields'})
         return
     
@@ -590,6 +641,9 @@ def handle_kick_player(data):
         emit('error', {'message': 'Only the host can kick players'})
         return
     
+    if handle is not None:
+        player_id = game.player_for_handle(handle)
+
     # Check if player exists
     if player_id not in game.players:
         emit('error', {'message': 'Player not found'})
@@ -600,26 +654,26 @@ def handle_kick_player(data):
         emit('error', {'message': 'Host cannot kick themselves'})
         return
     
-    # Get the player's username for the kick message
-    kicked_username = game.players[player_id]['username']
+    # Get the player's handle for the kick message
+    kicked_handle = game.handle_of(player_id)
     
     # Remove player from game
-    game.remove_player(player_id)
+    game_manager.remove_player(game_id, player_id)
     
     # Notify the kicked player
     socketio.emit('kicked_from_game', {
         'message': f'You have been kicked from the game by the host'
     }, room=get_player_room(player_id))
     
-    # Notify all players in the game
-    socketio.emit('player_kicked', {
-        'player_id': player_id,
-        'username': kicked_username,
-        'message': f'{kicked_username} has been kicked from the game'
-    }, room=game_id)
+    # Notify all players in the game, who still know the handle's name
+    # until the lobby update below removes it
+    socketio.emit('player_kicked', {'handle': kicked_handle}, room=game_id)
     
     # Update lobby for all remaining players
     emit_lobby_update(game_id)
     
     # Return success to the host
     emit('kick_player_result', {'success': True})
+
+    # The phase may have been waiting only on the kicked player
+    check_phase_complete(game)
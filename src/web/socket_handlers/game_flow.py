@@ -4,30 +4,53 @@ Game flow management functions for the Bribery game.
 This module handles the game's state transitions and round management.
 """
 
+import json
 import logging
 import random
-import threading
 
-from flask_socketio import emit
+from flask_socketio import SocketIO, emit
+from src.game.actor import set_event_factory
 from src.game.game import Game
 from src.game.game_manager import GameManager
 from src.game.player_session import PlayerSession
+from src.game.scheduler import DeadlineScheduler
 
 from ..utils import get_player_room, load_prompts, generate_random_bribe
-from .progress_tracking import emit_submission_progress, emit_voting_progress
+from .progress_tracking import (build_submission_progress, build_voting_progress,
+                                emit_submission_progress, note_progress_sent)
 
 logger = logging.getLogger(__name__)
 
 # Game manager instance
 game_manager = None
 socketio = None
+# One deadline loop for every game's timers
+scheduler = DeadlineScheduler()
 
+# Seconds a finished game stays around so players can see the final results
+FINISHED_GAME_LINGER = 30.0
 
-def initialize_game_manager(socketio_instance):
-    """Initialize the game manager and set up socketio reference"""
+
+def initialize_game_manager(socketio_instance, deadline_scheduler=None):
+    """Initialize the game manager and set up socketio reference
+
+    deadline_scheduler replaces the server-wide scheduler, e.g. with a
+    VirtualScheduler to play timed games without waiting.
+    """
     global game_manager, socketio
     game_manager = GameManager()
     socketio = socketio_instance
+    event_factory = None
+    if isinstance(socketio_instance, SocketIO) and socketio_instance.server is not None:
+        # Handlers waiting on a game's actor yield to the server's async hub
+        event_factory = socketio_instance.server.eio.create_event
+        set_event_factory(event_factory)
+    if deadline_scheduler is not None:
+        set_scheduler(deadline_scheduler)
+    else:
+        # Run timers on the server's async hub rather than on OS threads
+        scheduler.configure(start_task=socketio_instance.start_background_task,
+                            make_event=event_factory)
 
 
 def get_game_manager():
@@ -35,8 +58,37 @@ def get_game_manager():
     return game_manager
 
 
-def start_next_round(game):
+def get_scheduler():
+    """Get the deadline scheduler shared by all games"""
+    return scheduler
+
+
+def set_scheduler(deadline_scheduler):
+    """Replace the deadline scheduler shared by all games"""
+    global scheduler
+    scheduler = deadline_scheduler
+
+
+def scheduler_for(game):
+    """Get the scheduler running a game's deadlines"""
+    return game.scheduler if game.scheduler is not None else scheduler
+
+
+def run_game_command(game, command, *args):
+    """Run a game flow step on the game's actor so it never overlaps other changes"""
+    return game.actor.run(command, game, *args)
+
+
+def schedule_transition(game, delay, transition):
+    """Run a phase transition after a delay, unless the game has moved on by then"""
+    game.round_timer = scheduler_for(game).call_later(
+        delay, run_game_command, game, transition, game.phase_generation)
+
+
+def start_next_round(game, generation=None):
     """Start the next round of the game"""
+    if not game.advance_phase(generation):
+        return
     game.current_round += 1
     logger.info(f"Starting round {game.current_round} for game {game.game_id}")
 
@@ -45,25 +97,16 @@ def start_next_round(game):
     if activated_count > 0:
         logger.info(f"Activated {activated_count} waiting players for round {game.current_round}")
 
-    # Generate new pairings for this round
-    game.round_pairings[game.current_round] = game.generate_round_pairings()
+    # Start a fresh round, archiving the previous one in game.past_rounds
+    round_state = game.start_round(game.current_round)
 
-    # Initialize bribes and votes for this round
-    game.bribes[game.current_round] = {}
-    game.votes[game.current_round] = {}
-    
-    # Initialize voted_players tracking for this round if not already present
-    if not hasattr(game, 'voted_players'):
-        game.voted_players = {}
-    game.voted_players[game.current_round] = set()
+    # Generate new pairings for this round
+    round_state.pairings = game.generate_round_pairings()
 
     if game.custom_prompts_enabled():
         # Start prompt selection phase
         game.state = "prompt_selection"
-
-        # Initialize prompt selection data
-        game.player_prompts[game.current_round] = {}
-        game.player_prompt_ready[game.current_round] = {}
+        game.track_phase("prompt_selection")
 
         # Load available prompts
         prompts = load_prompts()
@@ -82,82 +125,73 @@ def start_next_round(game):
         # Only start the timer if prompt_selection_time > 0
         if prompt_selection_time > 0:
             # Start prompt selection timer
-            game.round_timer = threading.Timer(prompt_selection_time, start_submission_phase, [game])
-            game.round_timer.start()
+            schedule_transition(game, prompt_selection_time, start_submission_phase)
     else:
         # Skip directly to submission phase with shared prompt
         start_submission_phase(game)
 
 
-def start_submission_phase(game):
+def start_submission_phase(game, generation=None):
     """Start the submission phase"""
+    if not game.advance_phase(generation):
+        return
     game.state = "submission"
+    game.track_phase("submission")
 
     # If not using custom prompts, select a random shared prompt
     if not game.custom_prompts_enabled():
         prompts = load_prompts()
         game.current_prompt = random.choice(prompts)
 
-    # Emit round start to all players
-    socketio.emit('round_started', {
-        'round': game.current_round,
-        'total_rounds': game.settings['rounds'],
-        'prompt': game.current_prompt if not game.custom_prompts_enabled() else None,
-        'custom_prompts_enabled': game.custom_prompts_enabled(),
-        'time_limit': game.settings['submission_time']  # Will be 0 for "no timer" mode
-    }, room=game.game_id)
-
-    # Send individual pairings to each player with their specific prompts
-    for player_id, targets in game.round_pairings[game.current_round].items():
-        target_data = []
-        for target_id in targets:
-            target_prompt = game.get_prompt_for_target(
-                game.current_round, target_id)
-            target_data.append({
-                'id': target_id,
-                'name': game.players[target_id]['username'],
-                'prompt': target_prompt
-            })
-
-        socketio.emit('your_targets', {
-            'targets': target_data
-        }, room=get_player_room(game_manager, game.game_id, player_id))
-
     # Set up timer or wait for all submissions
     if game.settings['submission_time'] > 0:
         # Start submission timer if time is set
-        game.round_timer = threading.Timer(
-            game.settings['submission_time'],
-            end_submission_phase,
-            [game])
-        game.round_timer.start()
-    
-    # Emit initial submission progress
-    emit_submission_progress(game)
+        schedule_transition(game, game.settings['submission_time'], end_submission_phase)
+
+    # Send each player the round, their targets and the opening progress at once
+    emit_phase_entry(game, game.current.pairings)
 
 
 def check_all_submissions_complete(game):
     """Check if all players have submitted all their bribes"""
-    expected_submissions = len(game.get_active_player_ids()) * \
-        2  # Each active player submits 2 bribes
-    actual_submissions = sum(len(bribes)
-                             for bribes in game.bribes[game.current_round].values())
+    # Each active player owes a bribe to each of their targets
+    progress = game.get_phase_tracker("submission")
 
     # Emit progress update
     emit_submission_progress(game)
 
-    if actual_submissions >= expected_submissions:
-        # If timer is active, cancel it
-        if game.round_timer:
-            game.round_timer.cancel()
-        
-        # Proceed to voting phase
-        end_submission_phase(game)
+    if progress.is_complete():
+        # Proceed to voting phase; this also cancels the submission timer
+        end_submission_phase(game, game.phase_generation)
+
+
+def check_phase_complete(game):
+    """End the current phase if a player leaving it left nobody with work outstanding
+
+    Called after a kick or disconnect, which can finish a phase as surely
+    as the last submission or vote. A phase with no active players left
+    waits for someone to reconnect instead.
+    """
+    if game.current is None:
+        return
+    progress = game.current.tracker_for(game.state)
+    if progress is None or not progress.total or not progress.is_complete():
+        return
+    if game.state == "prompt_selection":
+        start_submission_phase(game, game.phase_generation)
+    elif game.state == "submission":
+        end_submission_phase(game, game.phase_generation)
+    elif game.state == "voting":
+        end_voting_phase(game, game.phase_generation)
 
 
-def end_submission_phase(game):
+def end_submission_phase(game, generation=None):
     """End the submission phase and start voting"""
+    if not game.advance_phase(generation):
+        return
     from ..utils import generate_random_bribe
+
+    round_state = game.current
     
     # Before starting voting phase, add random bribes for any missing submissions
     active_player_ids = game.get_active_player_ids()
@@ -165,177 +199,114 @@ def end_submission_phase(game):
     # Check each player and their targets for missing submissions
     for player_id in active_player_ids:
         # Get the targets this player should have submitted bribes to
-        targets = game.round_pairings[game.current_round].get(player_id, [])
+        targets = round_state.pairings.get(player_id, [])
         
         # Skip if player has no targets (shouldn't happen, but just in case)
         if not targets:
             continue
         
-        # Initialize player's bribes dict if it doesn't exist
-        if player_id not in game.bribes[game.current_round]:
-            game.bribes[game.current_round][player_id] = {}
+        player_bribes = round_state.submissions.get(player_id, {})
         
         # Check for each target if a submission exists
         for target_id in targets:
-            if target_id not in game.bribes[game.current_round][player_id]:
+            if target_id not in player_bribes:
                 # Generate a random bribe for this missing submission
                 random_bribe, is_random = generate_random_bribe()
                 
-                # Add it to the game state
-                game.bribes[game.current_round][player_id][target_id] = {
+                # Add it to the game state and the target's inbox
+                round_state.add_submission(player_id, target_id, {
                     'content': random_bribe,
                     'type': 'text',
                     'is_random': True  # Flag it as randomly generated
-                }
+                })
     
     # Now change the game state to voting
     game.state = "voting"
+    game.track_phase("voting")
 
-    # Send voting options to each active player
-    for player_id in game.get_active_player_ids():
-        bribes_for_player = []
-
-        # Find all bribes submitted TO this player, but exclude their own submissions
-        for submitter_id, submissions in game.bribes[game.current_round].items():
-            # Skip bribes submitted by the voting player themselves
-            if submitter_id == player_id:
-                continue
-
-            for target_id, bribe in submissions.items():
-                if target_id == player_id:
-                    # Don't add the "(randomly generated)" indicator during voting phase
-                    # Players shouldn't know which bribes are random until afterwards
-                    bribes_for_player.append({
-                        'id': f"{submitter_id}_{target_id}",
-                        'content': bribe['content'],
-                        'type': bribe['type'],
-                        'is_random': bribe.get('is_random', False)  # Keep track but don't show in UI yet
-                    })
-
-        # Get the player's prompt for this round
-        player_prompt = game.get_prompt_for_target(game.current_round, player_id)
-
-        socketio.emit('voting_phase', {
-            'bribes': bribes_for_player,
-            'time_limit': game.settings['voting_time'],  # Will be 0 for "no timer" mode
-            'player_prompt': player_prompt
-        }, room=get_player_room(game_manager, game.game_id, player_id))
+    # Fix every participant's ballot once, including anyone briefly disconnected
+    round_state.open_ballots(game.get_round_participant_ids())
 
     # Set up timer or wait for all votes
     if game.settings['voting_time'] > 0:
         # Start voting timer if time is set
-        game.round_timer = threading.Timer(
-            game.settings['voting_time'], end_voting_phase, [game])
-        game.round_timer.start()
-    
-    # Emit initial voting progress
-    emit_voting_progress(game)
+        schedule_transition(game, game.settings['voting_time'], end_voting_phase)
 
+    # Send each active player their ballot and the opening progress at once
+    emit_phase_entry(game, game.get_active_player_ids())
 
-def end_voting_phase(game):
+
+def end_voting_phase(game, generation=None):
     """End the voting phase and show results"""
+    if not game.advance_phase(generation):
+        return
     game.state = "scoreboard"
+    round_state = game.current
 
-    # Calculate scores for this round
-    round_scores = {}
+    # Points were tallied as each vote arrived; kicked players were already dropped
+    round_scores = round_state.tally
     vote_results = []
 
-    # Process all votes, regardless of player connection status
-    # This ensures votes from players who disconnected after voting are still counted
-    for voter_id, bribe_id in game.votes[game.current_round].items():
-        # Skip if voter no longer exists in player list (rare edge case)
-        if voter_id not in game.players:
-            continue
-            
-        # Parse bribe_id to get submitter and target
-        parts = bribe_id.split('_')
-        if len(parts) != 2:
-            continue
-            
-        submitter_id, target_id = parts
-        
-        # Verify both submitter and target still exist
-        if submitter_id not in game.players or target_id not in game.players:
-            continue
-        
-        # Check if this bribe is random
-        is_random = False
-        try:
-            is_random = game.bribes[game.current_round][submitter_id][target_id].get('is_random', False)
-        except (KeyError, AttributeError):
-            pass
-        
-        # Award points (half point for random bribes)
-        if submitter_id not in round_scores:
-            round_scores[submitter_id] = 0
-            
-        # Award half a point for randomly generated bribes
-        if is_random:
-            round_scores[submitter_id] += 0.5
-        else:
-            round_scores[submitter_id] += 1
+    # Votes from players who disconnected after voting are still counted
+    for voter_id, (submitter_id, target_id, points) in round_state.vote_credit.items():
+        bribe = round_state.submissions.get(submitter_id, {}).get(target_id, {})
+        is_random = bribe.get('is_random', False)
 
         # Get the bribe content and type
-        bribe_content = ""
-        bribe_type = "text"
-        prompt_text = game.get_prompt_for_target(game.current_round, target_id)
-        
-        try:
-            bribe = game.bribes[game.current_round][submitter_id][target_id]
-            bribe_content = bribe.get('content', '')
-            if is_random:
-                bribe_content += " (randomly generated)"
-            bribe_type = bribe.get('type', 'text')
-        except (KeyError, AttributeError):
-            pass
+        bribe_content = bribe.get('content', '')
+        if is_random:
+            bribe_content += " (randomly generated)"
 
         vote_results.append({
-            'voter': game.players[voter_id]['username'],
-            'winner': game.players[submitter_id]['username'],
-            'prompt_owner': game.players[target_id]['username'],
-            'prompt': prompt_text,
+            'voter': game.handle_of(voter_id),
+            'winner': game.handle_of(submitter_id),
+            'prompt_owner': game.handle_of(target_id),
+            'prompt': game.get_prompt_for_target(game.current_round, target_id),
             'winning_bribe': bribe_content,
-            'bribe_type': bribe_type,
+            'bribe_type': bribe.get('type', 'text'),
             'is_random': is_random
         })
 
-    # Update total scores
+    # Fold this round's tally into the leaderboard, which keeps itself ranked
     for player_id, points in round_scores.items():
-        game.scores[player_id] += points
+        if points:
+            game.scores.add(player_id, points)
 
     # Prepare scoreboard data
     scoreboard = []
-    for player_id, total_score in game.scores.items():
+    for player_id, total_score in game.scores.ranked():
         scoreboard.append({
-            'username': game.players[player_id]['username'],
+            'handle': game.handle_of(player_id),
             'round_score': round_scores.get(player_id, 0),
-            'total_score': total_score,
-            'player_id': player_id,
-            'is_host': player_id == game.host_id
+            'total_score': total_score
         })
 
-    scoreboard.sort(key=lambda x: x['total_score'], reverse=True)
-
-    socketio.emit('round_results', {
+    round_results = {
         'round': game.current_round,
         'vote_results': vote_results,
         'scoreboard': scoreboard,
         'timer_enabled': game.settings['results_time'] > 0,
         'results_time': game.settings['results_time']
-    }, room=game.game_id)
+    }
+    # Keep the exact payload so reconnecting players see the same results
+    round_results = round_state.freeze_results(round_results)
+
+    socketio.emit('round_results', round_results, room=game.game_id)
 
     # Wait a bit then continue to next round or end game
     if game.settings['results_time'] > 0:
         # Use timer if results_time is set
-        threading.Timer(game.settings['results_time'], continue_or_end_game, [game]).start()
+        schedule_transition(game, game.settings['results_time'], continue_or_end_game)
     else:
         # Otherwise, let the host control when to continue
         socketio.emit('host_controls_next_round', {}, 
-                      room=get_player_room(game_manager, game.game_id, game.host_id))
+                      room=get_player_room(game.host_id))
 
 
-def continue_or_end_game(game):
+def continue_or_end_game(game, generation=None):
     """Continue to next round or end the game"""
+    if not game.advance_phase(generation):
+        return
     if game.current_round >= game.settings['rounds']:
         # Game is over
         end_game(game)
@@ -344,22 +315,20 @@ def continue_or_end_game(game):
         start_next_round(game)
 
 
-def end_game(game):
+def end_game(game, generation=None):
     """End the game and show final results"""
+    if not game.advance_phase(generation):
+        return
     game.state = "finished"
 
     # Final scoreboard
     final_scoreboard = []
-    for player_id, total_score in game.scores.items():
+    for player_id, total_score in game.scores.ranked():
         final_scoreboard.append({
-            'username': game.players[player_id]['username'],
-            'total_score': total_score,
-            'player_id': player_id,
-            'is_host': player_id == game.host_id
+            'handle': game.handle_of(player_id),
+            'total_score': total_score
         })
 
-    final_scoreboard.sort(key=lambda x: x['total_score'], reverse=True)
-
     # Add podium positions
     for i, player in enumerate(final_scoreboard):
         if i < 3:
@@ -370,44 +339,107 @@ def end_game(game):
     }, room=game.game_id)
 
     # Schedule game cleanup after players have time to see results
-    threading.Timer(30.0, cleanup_finished_game, [game.game_id]).start()
+    scheduler_for(game).call_later(FINISHED_GAME_LINGER, cleanup_finished_game, game.game_id)
 
 
 def cleanup_finished_game(game_id):
     """Clean up a finished game after delay"""
     game = game_manager.get_game(game_id)
-    if game and game.state == "finished":
+    if game:
+        game.actor.run(_cleanup_if_finished, game)
+
+
+def _cleanup_if_finished(game):
+    if game.state == "finished":
         # Remove the game from the manager after it's been finished for a while
         # This prevents memory leaks from old games
-        logger.info(f"Cleaning up finished game {game_id}")
+        logger.info(f"Cleaning up finished game {game.game_id}")
         # Note: Only cleanup if no players are still connected
-        connected_players = sum(1 for p in game.players.values() if p.get('connected', False))
-        if connected_players == 0:
-            game_manager.games.pop(game_id, None)
+        if game.get_connected_player_count() == 0:
+            game.cleanup()
+            game_manager.remove_game(game.game_id)
+
+
+def build_phase_entry_shared(game):
+    """Build the part of a phase_entered message that is the same for everyone"""
+    if game.state == "submission":
+        return {
+            'phase': 'submission',
+            'round': {
+                'round': game.current_round,
+                'total_rounds': game.settings['rounds'],
+                'prompt': game.current_prompt if not game.custom_prompts_enabled() else None,
+                'custom_prompts_enabled': game.custom_prompts_enabled(),
+                'time_limit': game.settings['submission_time']  # Will be 0 for "no timer" mode
+            },
+            'progress': build_submission_progress(game)
+        }
+    return {
+        'phase': 'voting',
+        'round': {
+            'round': game.current_round,
+            'total_rounds': game.settings['rounds'],
+            'time_limit': game.settings['voting_time']  # Will be 0 for "no timer" mode
+        },
+        'progress': build_voting_progress(game)
+    }
+
+
+def build_phase_entry_player(game, player_id):
+    """Build the part of a phase_entered message meant for one player"""
+    if game.state == "submission":
+        # Targets by handle, with each target's own prompt
+        return {
+            'targets': [{
+                'id': game.handle_of(target_id),
+                'prompt': game.get_prompt_for_target(game.current_round, target_id)
+            } for target_id in game.current.pairings.get(player_id, []) if target_id in game.players]
+        }
+    # Their ballot, which leaves out bribes they submitted themselves
+    ballot = game.current.ballots.get(player_id)
+    return {
+        'bribes': ballot.to_payload() if ballot is not None else [],
+        'player_prompt': game.get_prompt_for_target(game.current_round, player_id)
+    }
+
+
+def emit_phase_entry(game, player_ids, room=None):
+    """Send each player one phase_entered message for the submission or voting phase
+
+    The message replaces the round_started, your_targets or voting_phase and
+    progress events a phase used to open with. The shared part is encoded
+    to JSON once and goes into every player's message as that string, so
+    only the part built for each player is encoded per player. Without a
+    room the message goes to each connected player in player_ids and counts
+    as the phase's first progress broadcast.
+    """
+    shared = build_phase_entry_shared(game)
+    encoded_shared = json.dumps(shared)
+    for player_id in player_ids:
+        player = game.players.get(player_id)
+        if player is None or (room is None and not player.connected):
+            continue
+        socketio.emit('phase_entered', {
+            'shared': encoded_shared,
+            'player': build_phase_entry_player(game, player_id)
+        }, room=room or get_player_room(player_id))
+    if room is None:
+        note_progress_sent(game, shared['progress'])
 
 
 def emit_lobby_update(game_id):
-    """Emit lobby update to all players in the game"""
+    """Emit the lobby changes since the last update to all players in the game"""
     game = game_manager.get_game(game_id)
     if not game:
         return
+    publish_lobby_changes(game)
 
-    player_list = []
-    for player_id, player in game.players.items():
-        player_list.append({
-            'username': player['username'],
-            'is_host': player_id == game.host_id,
-            'connected': player['connected'],
-            'score': game.scores.get(player_id, 0),
-            'player_id': player_id  # Send player_id for kick functionality
-        })
 
-    socketio.emit('lobby_update', {
-        'players': player_list,
-        'player_count': len([p for p in player_list if p['connected']]),
-        'settings': game.settings,
-        'can_start': game.can_start_game()
-    }, room=game_id)
+def publish_lobby_changes(game):
+    """Broadcast a lobby_patch if anything players see in the lobby changed"""
+    patch = game.roster.publish(game)
+    if patch is not None:
+        socketio.emit('lobby_patch', patch, room=game.game_id)
 
 
 def emit_midgame_joiner_state(game, player_id):
@@ -424,10 +456,12 @@ def emit_midgame_joiner_state(game, player_id):
     
     # Ensure player has past_bribe_targets initialized
     if player_id not in game.past_bribe_targets:
-        game.past_bribe_targets[player_id] = []
+        game.past_bribe_targets[player_id] = set()
         
+    round_state = game.current
+
     # If player is reconnecting but was already active, send them the current game state
-    if player.get('active_in_round', False):
+    if player.active_in_round and round_state is not None:
         logger.info(f"Player {player_id} reconnected during active round - sending current game state")
         
         # Send the appropriate state based on current game phase
@@ -436,8 +470,8 @@ def emit_midgame_joiner_state(game, player_id):
             prompts = load_prompts()
             
             # Check if player already selected a prompt
-            player_prompt_ready = game.player_prompt_ready.get(game.current_round, {}).get(player_id, False)
-            player_selected_prompt = game.player_prompts.get(game.current_round, {}).get(player_id, "")
+            player_prompt_ready = round_state.prompt_ready.get(player_id, False)
+            player_selected_prompt = round_state.prompts.get(player_id, "")
             
             socketio.emit('prompt_selection_started', {
                 'round': game.current_round,
@@ -446,87 +480,7 @@ def emit_midgame_joiner_state(game, player_id):
                 'time_limit': game.settings.get('prompt_selection_time', 0),
                 'already_selected': player_prompt_ready,
                 'selected_prompt': player_selected_prompt
-            }, room=get_player_room(game_manager, game.game_id, player_id))
-            
-        elif game.state == "submission":
-            # Send submission phase data
-            pairings = game.round_pairings.get(game.current_round, {}).get(player_id, [])
-            
-            if pairings:
-                # Convert player IDs to usernames for the client
-                targets = [{
-                    'id': target_id,
-                    'username': game.players[target_id]['username']
-                } for target_id in pairings if target_id in game.players]
-                
-                # Check if this player has already submitted
-                already_submitted = player_id in game.bribes.get(game.current_round, {})
-                
-                # Get their prompt (either custom or shared)
-                prompt = None
-                if game.custom_prompts_enabled():
-                    prompt = game.player_prompts.get(game.current_round, {}).get(player_id)
-                else:
-                    prompt = game.current_prompt
-                
-                # Send the submission phase data
-                socketio.emit('submission_phase', {
-                    'round': game.current_round,
-                    'total_rounds': game.settings['rounds'],
-                    'targets': targets,
-                    'prompt': prompt,
-                    'already_submitted': already_submitted,
-                    'time_limit': game.settings.get('submission_time', 0)
-                }, room=get_player_room(game_manager, game.game_id, player_id))
-                
-        elif game.state == "voting":
-            # Send voting phase data
-            # Check if this player already voted
-            already_voted = player_id in game.votes.get(game.current_round, {})
-            
-            # Get bribes targeted at this player
-            bribes_for_player = []
-            round_bribes = game.bribes.get(game.current_round, {})
-            
-            for bribing_player, targets in round_bribes.items():
-                for target_id, bribe in targets.items():
-                    if target_id == player_id:
-                        # Found a bribe targeted at this player
-                        bribes_for_player.append({
-                            'id': bribe.get('id'),
-                            'content': bribe.get('content'),
-                            'type': bribe.get('type', 'text')
-                        })
-            
-            # Send voting phase data
-            socketio.emit('voting_phase', {
-                'round': game.current_round,
-                'total_rounds': game.settings['rounds'],
-                'bribes': bribes_for_player,
-                'already_voted': already_voted,
-                'time_limit': game.settings.get('voting_time', 0)
-            }, room=get_player_room(game_manager, game.game_id, player_id))
-            
-        elif game.state == "scoreboard":
-            # Send scoreboard data
-            # For reconnecting players, just give them a simplified version of the scoreboard
-            # Create a simplified round results structure
-            round_scores = {}
-            for pid, score in game.scores.items():
-                if pid in game.players:
-                    round_scores[pid] = {
-                        'username': game.players[pid]['username'],
-                        'score': score
-                    }
-            
-            # Send scoreboard data
-            socketio.emit('round_results', {
-                'round': game.current_round,
-                'total_rounds': game.settings['rounds'],
-                'simplified_reconnect': True,  # Flag to tell client this is simplified data
-                'scores': round_scores,
-                'time_limit': game.settings.get('results_time', 0)
-            }, room=get_player_room(game_manager, game.game_id, player_id))
+            }, room=get_player_room(player_id))
             
     else:
         # Player is waiting for next round - show waiting screen
@@ -535,22 +489,7 @@ def emit_midgame_joiner_state(game, player_id):
             'current_round': game.current_round,
             'total_rounds': game.settings['rounds'],
             'game_state': game.state
-        }, room=get_player_room(game_manager, game.game_id, player_id))
-        
-        # Also send them the current player list so they can see who's playing
-        socketio.emit('lobby_update', {
-            'players': [
-                {
-                    'username': p['username'],
-                    'is_host': pid == game.host_id,
-                    'connected': p.get('connected', True),
-                    'score': game.scores.get(pid, 0)
-                }
-                for pid, p in game.players.items()
-            ],
-            'player_count': len(game.players),
-            'settings': game.settings
-        }, room=get_player_room(game_manager, game.game_id, player_id))
+        }, room=get_player_room(player_id))
         
         return
 
@@ -560,85 +499,30 @@ def emit_midgame_joiner_state(game, player_id):
 
 def emit_game_state_to_player(game, player_id):
     """Send current game state to a reconnecting player"""
-    player_room = get_player_room(game_manager, game.game_id, player_id)
+    player_room = get_player_room(player_id)
     
-    # First, always send the player list regardless of game state
-    socketio.emit('lobby_update', {
-        'players': [
-            {
-                'username': p['username'],
-                'is_host': pid == game.host_id,
-                'connected': p.get('connected', True),
-                'score': p.get('score', 0)
-            }
-            for pid, p in game.players.items()
-        ],
-        'player_count': len(game.players)
-    }, room=player_room)
+    # The player list was sent as a lobby_snapshot when they joined
+    if game.state in ("submission", "voting"):
+        # Round info, their targets or ballot and progress in one message
+        emit_phase_entry(game, [player_id], room=player_room)
     
-    # Then handle specific game state
-    if game.state == "submission":
-        # Get targets for this player
-        targets = game.round_pairings[game.current_round].get(player_id, [])
-        target_data = []
-        
-        for target_id in targets:
-            target_prompt = game.get_prompt_for_target(
-                game.current_round, target_id)
-            target_data.append({
-                'id': target_id,
-                'name': game.players[target_id]['username'],
-                'prompt': target_prompt
-            })
-
-        # Send round info
-        socketio.emit('round_started', {
-            'round': game.current_round,
-            'total_rounds': game.settings['rounds'],
-            'prompt': game.current_prompt if not game.custom_prompts_enabled() else None,
-            'custom_prompts_enabled': game.custom_prompts_enabled(),
-            'time_limit': game.settings['submission_time']
-        }, room=player_room)
+    elif game.state == "scoreboard":
+        # Replay the results sent when voting ended
+        round_results = game.get_round_results(game.current_round)
+        if round_results is not None:
+            socketio.emit('round_results', round_results, room=player_room)
+            return
 
-        # Send targets
-        socketio.emit('your_targets', {
-            'targets': target_data
-        }, room=player_room)
-        
-        # Also send progress update
-        emit_submission_progress(game, player_room)
+        # Results not frozen yet, give them a simplified version of the scoreboard
+        round_scores = {}
+        for pid, score in game.scores.items():
+            if pid in game.players:
+                round_scores[game.handle_of(pid)] = {'score': score}
 
-    elif game.state == "voting":
-        # Send voting options, but exclude bribes player submitted themselves
-        bribes_for_player = []
-        for submitter_id, submissions in game.bribes[game.current_round].items():
-            # Skip bribes submitted by the voting player themselves
-            if submitter_id == player_id:
-                continue
-
-            for target_id, bribe in submissions.items():
-                if target_id == player_id:
-                    bribes_for_player.append({
-                        'id': f"{submitter_id}_{target_id}",
-                        'content': bribe['content'],
-                        'type': bribe['type'],
-                        'is_random': bribe.get('is_random', False)  # Keep track but don't show in UI yet
-                    })
-
-        socketio.emit('voting_phase', {
-            'bribes': bribes_for_player,
-            'time_limit': game.settings['voting_time']
+        socketio.emit('round_results', {
+            'round': game.current_round,
+            'total_rounds': game.settings['rounds'],
+            'simplified_reconnect': True,  # Flag to tell client this is simplified data
+            'scores': round_scores,
+            'time_limit': game.settings.get('results_time', 0)
         }, room=player_room)
-        
-        # Also send progress update
-        emit_voting_progress(game, player_room)
-    
-    elif game.state == "scoreboard":
-        # Regenerate and send scoreboard data
-        round_results = game.get_round_results(game.current_round)
-        if round_results:
-            socketio.emit('round_results', {
-                'round': game.current_round,
-                'results': round_results,
-                'time_limit': game.settings['results_time']
-            }, room=player_room)
@@ -3,12 +3,20 @@ Progress tracking for game rounds, tracking submissions and votes.
 """
 
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
 # Will be set in __init__
 socketio = None
 
+# Seconds over which a game's progress changes are merged into one broadcast
+try:
+    PROGRESS_WINDOW = float(os.environ.get('PROGRESS_WINDOW', 0.5))
+except ValueError:
+    logger.warning("Ignoring invalid PROGRESS_WINDOW value")
+    PROGRESS_WINDOW = 0.5
+
 
 def set_socketio(socketio_instance):
     """Set the socketio instance for this module"""
@@ -16,36 +24,38 @@ def set_socketio(socketio_instance):
     socketio = socketio_instance
 
 
-def emit_submission_progress(game):
-    """Emit submission progress to all players"""
+def _get_socketio():
     global socketio
     if not socketio:
         from . import socketio as socketio_instance
         socketio = socketio_instance
-        
-    active_players = game.get_active_player_ids()
-    total_active = len(active_players)
-    
-    # Count how many players have completed all their submissions
-    completed_players = []
-    pending_players = []
-    
-    for player_id in active_players:
-        player_submissions = game.bribes[game.current_round].get(player_id, {})
-        # Each player needs to submit 2 bribes
-        if len(player_submissions) >= 2:
-            completed_players.append(player_id)
-        else:
-            pending_players.append(player_id)
-    
-    completed_count = len(completed_players)
+    return socketio
+
+
+def emit_submission_progress(game, room=None):
+    """Emit submission progress to all players, or just to the given room
+
+    Room-wide updates are coalesced, see ProgressCoalescer.
+    """
+    if room is not None:
+        _get_socketio().emit('submission_progress', build_submission_progress(game), room=room)
+    else:
+        broadcast_progress(game, 'submission_progress')
+
+
+def build_submission_progress(game):
+    """Build the submission_progress payload for a game"""
+    progress = game.get_phase_tracker("submission")
+    total_active = progress.total
+    completed_count = progress.completed_count
+    remaining_count = total_active - completed_count
     
     # Generate progress message
-    if completed_count == total_active:
+    if remaining_count == 0:
         progress_message = "All players finished! Moving to voting..."
-    elif len(pending_players) <= 2 and len(pending_players) > 0:
+    elif remaining_count <= 2:
         # Show names when 2 or fewer players remaining
-        pending_names = [game.players[pid]['username'] for pid in pending_players]
+        pending_names = [game.players[pid].username for pid in progress.pending_players(2)]
         if len(pending_names) == 1:
             progress_message = f"Waiting for {pending_names[0]}"
         else:
@@ -53,39 +63,37 @@ def emit_submission_progress(game):
     else:
         progress_message = f"{completed_count}/{total_active} players finished"
     
-    socketio.emit('submission_progress', {
+    return {
         'completed': completed_count,
         'total': total_active,
         'message': progress_message
-    }, room=game.game_id)
+    }
 
 
-def emit_voting_progress(game):
-    """Emit voting progress to all players"""
-    global socketio
-    if not socketio:
-        from . import socketio as socketio_instance
-        socketio = socketio_instance
-        
-    active_players = game.get_active_player_ids()
-    total_active = len(active_players)
-    
-    # Get voted players using the tracked set for more accuracy
-    voted_set = getattr(game, 'voted_players', {}).get(game.current_round, set())
-    votes_submitted = len(voted_set)
-    
-    # Find remaining voters
-    remaining_voters = []
-    for player_id in active_players:
-        if player_id not in voted_set:
-            remaining_voters.append(player_id)
+def emit_voting_progress(game, room=None):
+    """Emit voting progress to all players, or just to the given room
+
+    Room-wide updates are coalesced, see ProgressCoalescer.
+    """
+    if room is not None:
+        _get_socketio().emit('voting_progress', build_voting_progress(game), room=room)
+    else:
+        broadcast_progress(game, 'voting_progress')
+
+
+def build_voting_progress(game):
+    """Build the voting_progress payload for a game"""
+    progress = game.get_phase_tracker("voting")
+    total_active = progress.total
+    votes_submitted = progress.completed_count
+    remaining_count = total_active - votes_submitted
     
     # Generate progress message
-    if votes_submitted == total_active:
+    if remaining_count == 0:
         progress_message = "All votes submitted! Calculating results..."
-    elif len(remaining_voters) <= 2 and len(remaining_voters) > 0:
+    elif remaining_count <= 2:
         # Show names when 2 or fewer players remaining
-        remaining_names = [game.players[pid]['username'] for pid in remaining_voters if pid in game.players]
+        remaining_names = [game.players[pid].username for pid in progress.pending_players(2)]
         if len(remaining_names) == 1:
             progress_message = f"Waiting for {remaining_names[0]}"
         else:
@@ -93,8 +101,79 @@ def emit_voting_progress(game):
     else:
         progress_message = f"{votes_submitted}/{total_active} players voted"
     
-    socketio.emit('voting_progress', {
+    return {
         'completed': votes_submitted,
         'total': total_active,
         'message': progress_message
-    }, room=game.game_id)
+    }
+
+
+_BUILDERS = {
+    'submission_progress': build_submission_progress,
+    'voting_progress': build_voting_progress,
+}
+
+
+def broadcast_progress(game, event):
+    """Send a progress event to the game's room, merging rapid changes"""
+    from .game_flow import run_game_command, scheduler_for
+
+    coalescer = _coalescer_for(game)
+    payload = _BUILDERS[event](game)
+    if payload == coalescer.last_payload:
+        # Nothing visible changed since the last broadcast
+        coalescer.cancel_pending()
+        return
+
+    scheduler = scheduler_for(game)
+    now = scheduler.clock()
+    finished = payload['completed'] >= payload['total']
+    window_open = (coalescer.last_sent_at is not None
+                   and now - coalescer.last_sent_at < PROGRESS_WINDOW)
+    if finished or not window_open:
+        coalescer.cancel_pending()
+        _send_progress(game, coalescer, event, payload, now)
+    elif coalescer.pending is None:
+        coalescer.pending = scheduler.call_later(
+            coalescer.last_sent_at + PROGRESS_WINDOW - now,
+            run_game_command, game, _flush_progress, event, game.phase_generation)
+
+
+def note_progress_sent(game, payload):
+    """Record progress that reached the room inside another message
+
+    Phase-entry messages carry the opening progress, so the first change
+    after them is coalesced as if that progress had been broadcast.
+    """
+    from .game_flow import scheduler_for
+
+    coalescer = _coalescer_for(game)
+    coalescer.cancel_pending()
+    coalescer.last_payload = payload
+    coalescer.last_sent_at = scheduler_for(game).clock()
+
+
+def _coalescer_for(game):
+    """Get a game's coalescer, reset if the game has moved to another phase"""
+    coalescer = game.progress_coalescer
+    if coalescer.generation != game.phase_generation:
+        coalescer.start_phase(game.phase_generation)
+    return coalescer
+
+
+def _flush_progress(game, event, generation):
+    coalescer = game.progress_coalescer
+    # The phase may have ended while the update waited
+    if coalescer.pending is None or generation != game.phase_generation:
+        return
+    coalescer.pending = None
+    payload = _BUILDERS[event](game)
+    if payload != coalescer.last_payload:
+        from .game_flow import scheduler_for
+        _send_progress(game, coalescer, event, payload, scheduler_for(game).clock())
+
+
+def _send_progress(game, coalescer, event, payload, now):
+    coalescer.last_payload = payload
+    coalescer.last_sent_at = now
+    _get_socketio().emit(event, payload, room=game.game_id)
@@ -3,7 +3,7 @@ Utility functions for the web application
 """
 
 import random
-from typing import List, Optional, Tuple
+from typing import List, Tuple
 
 # Cache prompts to avoid repeated file I/O
 _cached_prompts = None
@@ -96,9 +96,11 @@ def generate_random_bribe() -> Tuple[str, bool]:
         return random.choice(activities), True
 
 
-def get_player_room(game_manager, game_id: str, player_id: str) -> Optional[str]:
-    """Get the socket room for a specific player"""
-    for sid, session in game_manager.player_sessions.items():
-        if session.player_id == player_id and session.game_id == game_id:
-            return sid
-    return None
\ No newline at end of file
+def get_player_room(player_id: str) -> str:
+    """Get the Socket.IO room that reaches every socket of a player
+
+    Each socket joins a room named after its stable player ID when it
+    creates or joins a game, so the room survives reconnects and covers
+    every tab the player has open.
+    """
+    return player_id
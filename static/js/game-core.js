@@ -271,8 +271,10 @@ function updatePromptButtonState() {
 }
 
 function submitBribe(targetId, content, type = 'text') {
+    // Targets are player handles, which pass through the page as strings
+    const handle = Number(targetId);
     socket.emit('submit_bribe', {
-        target_id: targetId,
+        target_id: Number.isInteger(handle) ? handle : targetId,
         submission: content,
         type: type
     });
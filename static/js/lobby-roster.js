@@ -0,0 +1,158 @@
+/**
+ * @fileoverview Lobby Roster Module - Keeps the lobby in step with server patches
+ * @module lobby-roster
+ *
+ * The server sends the whole lobby once as a lobby_snapshot, then only the
+ * changes as numbered lobby_patch events. This module applies patches in
+ * version order and asks for a fresh snapshot when it sees a gap, then hands
+ * listeners the complete lobby in the shape the old lobby_update event had.
+ *
+ * The roster is also the table of player handles: other events name players
+ * by a small per-game number, and the helpers here turn those back into
+ * usernames and host flags.
+ */
+import { socket } from './socket-manager.js';
+
+// Last known lobby: { version, players, settings, player_count, can_start }
+let roster = null;
+// Handle -> player entry, rebuilt whenever the roster changes
+let playersByHandle = new Map();
+let snapshotRequested = false;
+const listeners = [];
+
+function currentLobby() {
+    return {
+        players: roster.players.slice(),
+        settings: { ...roster.settings },
+        player_count: roster.player_count,
+        can_start: roster.can_start
+    };
+}
+
+function notifyListeners() {
+    playersByHandle = new Map(roster.players.map(player => [player.handle, player]));
+    const data = currentLobby();
+    listeners.forEach(listener => listener(data));
+}
+
+function requestSnapshot() {
+    if (snapshotRequested) return;
+    snapshotRequested = true;
+    socket.emit('request_lobby_snapshot');
+}
+
+function applyPatch(patch) {
+    let players = roster.players;
+    if (patch.removed) {
+        const removed = new Set(patch.removed);
+        players = players.filter(player => !removed.has(player.handle));
+    }
+    if (patch.changed) {
+        const changes = new Map(patch.changed.map(change => [change.handle, change]));
+        players = players.map(player =>
+            changes.has(player.handle) ? { ...player, ...changes.get(player.handle) } : player);
+    }
+    if (patch.added) {
+        players = players.concat(patch.added);
+    }
+    roster = {
+        version: patch.version,
+        players,
+        settings: patch.settings ? { ...roster.settings, ...patch.settings } : roster.settings,
+        player_count: patch.player_count,
+        can_start: patch.can_start
+    };
+}
+
+socket.on('lobby_snapshot', (data) => {
+    snapshotRequested = false;
+    // A snapshot is the server's current lobby, even if its version went
+    // backwards because the game was restored from storage
+    roster = {
+        version: data.version,
+        players: data.players || [],
+        settings: data.settings || {},
+        player_count: data.player_count,
+        can_start: data.can_start
+    };
+    notifyListeners();
+});
+
+socket.on('lobby_patch', (patch) => {
+    // The snapshot sent on joining has not arrived yet
+    if (!roster) return;
+    if (patch.version <= roster.version) return;
+    if (patch.from_version !== roster.version) {
+        requestSnapshot();
+        return;
+    }
+    applyPatch(patch);
+    notifyListeners();
+});
+
+/**
+ * Get the username a handle stands for
+ * @param {number} handle - Player handle from a server payload
+ * @returns {string} Username, or a placeholder if the player has left
+ */
+function nameOf(handle) {
+    const player = playersByHandle.get(handle);
+    return player ? player.username : 'Unknown player';
+}
+
+function withPlayer(entry) {
+    const player = playersByHandle.get(entry.handle);
+    return {
+        ...entry,
+        username: player ? player.username : 'Unknown player',
+        is_host: player ? player.is_host : false
+    };
+}
+
+/**
+ * Fill usernames back into a round_results or game_finished payload
+ * @param {Object} data - Payload naming players by handle
+ * @returns {Object} Copy of the payload with usernames and host flags added
+ */
+function expandResults(data) {
+    const expanded = { ...data };
+    if (data.vote_results) {
+        expanded.vote_results = data.vote_results.map(result => ({
+            ...result,
+            voter: nameOf(result.voter),
+            winner: nameOf(result.winner),
+            prompt_owner: nameOf(result.prompt_owner)
+        }));
+    }
+    if (data.scoreboard) expanded.scoreboard = data.scoreboard.map(withPlayer);
+    if (data.final_scoreboard) expanded.final_scoreboard = data.final_scoreboard.map(withPlayer);
+    if (data.scores) {
+        expanded.scores = Object.fromEntries(Object.entries(data.scores).map(
+            ([handle, info]) => [handle, { ...info, username: nameOf(Number(handle)) }]));
+    }
+    return expanded;
+}
+
+// Public API object
+const LobbyRoster = {
+    /**
+     * Call listener with the full lobby now, if known, and after every change
+     * @param {Function} listener - Receives { players, settings, player_count, can_start }
+     */
+    onUpdate(listener) {
+        listeners.push(listener);
+        if (roster) listener(currentLobby());
+    },
+    get: () => (roster ? currentLobby() : null),
+    player: (handle) => playersByHandle.get(handle) || null,
+    nameOf,
+    expandResults,
+    requestSnapshot
+};
+
+// Export as ES module
+export { LobbyRoster };
+export default LobbyRoster;
+
+// Also add to window for backwards compatibility
+window.LobbyRoster = LobbyRoster;
@@ -0,0 +1,38 @@
+/**
+ * @fileoverview Phase Entry Module - Unpacks the single message that opens a phase
+ * @module phase-entry
+ *
+ * The server opens the submission and voting phases with one phase_entered
+ * message per player instead of separate round, targets or ballot and
+ * progress events. It holds a part shared by every player, sent as a JSON
+ * string the server encodes once for all of them, and a part for this
+ * player. This module splits it back into
+ * the events the screens already listen for, in the order they used to
+ * arrive, so their handlers stay unchanged.
+ */
+import { socket } from './socket-manager.js';
+import { LobbyRoster } from './lobby-roster.js';
+
+/**
+ * Run this client's own handlers for an event, as if the server had sent it
+ * @param {string} event - Event name
+ * @param {Object} data - Event payload
+ */
+function replay(event, data) {
+    socket.listeners(event).forEach(listener => listener(data));
+}
+
+socket.on('phase_entered', ({ shared: encodedShared, player }) => {
+    const shared = JSON.parse(encodedShared);
+    if (shared.phase === 'submission') {
+        replay('round_started', shared.round);
+        // Targets come as handles, the screens show their names
+        replay('your_targets', {
+            targets: player.targets.map(target => ({ ...target, name: LobbyRoster.nameOf(target.id) }))
+        });
+        replay('submission_progress', shared.progress);
+    } else if (shared.phase === 'voting') {
+        replay('voting_phase', { ...shared.round, ...player });
+        replay('voting_progress', shared.progress);
+    }
+});
@@ -11,6 +11,7 @@
 import ProgressTracker from './progress-tracker.js';
 import { socket } from './socket-manager.js';
 import { GameState } from './game-state.js';
+import { LobbyRoster } from './lobby-roster.js';
 
 // DOM references
 const playerListPanel = document.getElementById('player-list-panel');
@@ -43,7 +44,7 @@ function initializePlayerListPanel() {
     confirmKickButton.addEventListener('click', () => {
         if (playerToKick) {
             socket.emit('kick_player', {
-                player_id: playerToKick.player_id,
+                handle: playerToKick.handle,
                 game_id: gameId
             });
             confirmationModal.classList.remove('visible');
@@ -174,30 +175,30 @@ function updatePlayerListFromScoreboard(scoreboardData) {
         score: player.total_score,
         connected: true, // Assume connected since they're in the scoreboard
         is_host: player.is_host || false,
-        player_id: player.player_id || ''
+        handle: player.handle
     }));
     
     updatePlayerList(playerData);
 }
 
 // Socket event handlers
-socket.on('lobby_update', (data) => {
+LobbyRoster.onUpdate((data) => {
     updatePlayerList(data.players);
 });
 
 socket.on('round_results', (data) => {
     // Update player list with scores from scoreboard
-    updatePlayerListFromScoreboard(data.scoreboard);
+    updatePlayerListFromScoreboard(LobbyRoster.expandResults(data).scoreboard);
 });
 
 socket.on('game_over', (data) => {
     // Update player list with final scores
-    updatePlayerListFromScoreboard(data.final_scoreboard);
+    updatePlayerListFromScoreboard(LobbyRoster.expandResults(data).final_scoreboard);
 });
 
 socket.on('player_kicked', (data) => {
     // Show notification
-    updateStatus(`${data.username} has been kicked from the game`);
+    updateStatus(`${LobbyRoster.nameOf(data.handle)} has been kicked from the game`);
 });
 
 socket.on('kicked_from_game', (data) => {
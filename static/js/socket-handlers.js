@@ -1,6 +1,7 @@
 // Socket event handlers for game state management
 import { socket } from './socket-manager.js';
 import { GameState } from './game-state.js';
+import { LobbyRoster } from './lobby-roster.js';
 
 // Fallback mechanism in case imports fail
 let socketInstance = socket;
@@ -87,7 +88,7 @@ socket.on('midgame_waiting', (data) => {
     });
 });
 
-socket.on('lobby_update', (data) => {
+LobbyRoster.onUpdate((data) => {
     const playerList = document.getElementById('player-list');
     playerList.innerHTML = '<h3>Players (' + data.player_count + '):</h3>';
 
@@ -534,6 +535,7 @@ socket.on('voting_progress', (data) => {
 
 // Results events
 socket.on('round_results', (data) => {
+    data = LobbyRoster.expandResults(data);
     // Handle simplified results for reconnecting players
     if (data.simplified_reconnect) {
         hideAllScreens();
@@ -672,6 +674,7 @@ socket.on('host_controls_next_round', () => {
 });
 
 socket.on('game_finished', (data) => {
+    data = LobbyRoster.expandResults(data);
     hideAllScreens();
     document.getElementById('final-results').classList.remove('hidden');
 
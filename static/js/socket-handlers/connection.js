@@ -1,4 +1,6 @@
 // Connection and lobby event handlers
+import { LobbyRoster } from '../lobby-roster.js';
+
 export function registerConnectionHandlers(socket, GameState, hideAllScreens, updateStatus, Authentication) {
     // Connection and lobby events
     socket.on('joined_game', (data) => {
@@ -39,7 +41,7 @@ export function registerConnectionHandlers(socket, GameState, hideAllScreens, up
         GameState.set('ui', { activeScreen: 'waiting' });
     });
 
-    socket.on('lobby_update', (data) => {
+    LobbyRoster.onUpdate((data) => {
         const playerList = document.getElementById('player-list');
         playerList.innerHTML = '<h3>Players (' + data.player_count + '):</h3>';
 
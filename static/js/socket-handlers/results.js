@@ -1,7 +1,10 @@
 // Results and game flow event handlers
+import { LobbyRoster } from '../lobby-roster.js';
+
 export function registerResultsHandlers(socket, GameState, hideAllScreens, updateStatus, startTimer, stopTimer, displayScoreboard, Authentication, gameId) {
     // Results events
     socket.on('round_results', (data) => {
+        data = LobbyRoster.expandResults(data);
         hideAllScreens();
         document.getElementById('scoreboard-phase').classList.remove('hidden');
 
@@ -56,6 +59,7 @@ export function registerResultsHandlers(socket, GameState, hideAllScreens, updat
     });
 
     socket.on('game_finished', (data) => {
+        data = LobbyRoster.expandResults(data);
         hideAllScreens();
         document.getElementById('final-results').classList.remove('hidden');
 
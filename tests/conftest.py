@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fixtures shared by the unit tests
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.game.game import Game
+from src.web.socket_handlers import game_flow, progress_tracking
+
+
+@pytest.fixture
+def make_game():
+    """Build a game with players already added
+
+    The first player ID is the host and each username is the ID in upper
+    case. Pass round_num to start that round; any other keyword goes to
+    Game, e.g. scheduler, clock or memory_budget.
+    """
+    def build(game_id="TEST", player_ids=("p1", "p2", "p3"), settings=None,
+              round_num=None, **game_kwargs):
+        game = Game(game_id, player_ids[0], settings if settings is not None else {'rounds': 3},
+                    **game_kwargs)
+        for pid in player_ids:
+            game.add_player(pid, pid.upper())
+        if round_num is not None:
+            game.current_round = round_num
+            game.start_round(round_num)
+        return game
+    return build
+
+
+@pytest.fixture
+def mock_socketio():
+    """Capture what the game flow and progress broadcasts send through socketio"""
+    mock = MagicMock()
+    with patch.object(game_flow, 'socketio', mock), \
+            patch.object(progress_tracking, 'socketio', mock):
+        yield mock
@@ -16,6 +16,20 @@ sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.
 from game.game import Game
 from game.game_manager import GameManager
 
+
+def submit_bribes(round_state, bribes):
+    """Record {submitter_id: {target_id: bribe}} the way the handlers do"""
+    for submitter_id, sent in bribes.items():
+        for target_id, bribe in sent.items():
+            round_state.add_submission(submitter_id, target_id, bribe)
+
+
+def cast_votes(game, round_state, votes):
+    """Record {voter_id: bribe_id} the way the handlers do, crediting each vote"""
+    for voter_id, bribe_id in votes.items():
+        game.record_vote(round_state, voter_id, bribe_id)
+
+
 # Import test classes for re-export
 from .test_round_flow import TestRoundFlowLogic
 from .test_scoring import TestScoringSystem
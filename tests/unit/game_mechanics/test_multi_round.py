@@ -5,7 +5,7 @@ Tests for multi-round game progression
 """
 
 import pytest
-from tests.unit.game_mechanics import Game, GameManager
+from tests.unit.game_mechanics import Game, GameManager, cast_votes, submit_bribes
 
 class TestMultiRoundLogic:
     """Test multi-round game progression"""
@@ -87,20 +87,22 @@ class TestMultiRoundLogic:
         game = Game("TEST1234", "host", {'rounds': 3, 'submission_time': 60, 'voting_time': 30})
         
         # Add bribes for round 1
-        game.bribes[1] = {
+        first = game.start_round(1)
+        submit_bribes(first, {
             "p1": {"p2": {"content": "round1 bribe", "type": "text"}}
-        }
+        })
         
         # Add votes for round 1
-        game.votes[1] = {"p1": "p2_p1"}
+        cast_votes(game, first, {"p1": "p2_p1"})
         
         # Add bribes for round 2
-        game.bribes[2] = {
+        second = game.start_round(2)
+        submit_bribes(second, {
             "p1": {"p3": {"content": "round2 bribe", "type": "text"}}
-        }
+        })
         
         # Add votes for round 2
-        game.votes[2] = {"p1": "p3_p1"}
+        cast_votes(game, second, {"p1": "p3_p1"})
         
         # Data should be isolated per round
         assert game.bribes[1] != game.bribes[2]
@@ -5,7 +5,7 @@ Tests for game round flow logic
 """
 
 import pytest
-from tests.unit.game_mechanics import Game, GameManager
+from tests.unit.game_mechanics import Game, GameManager, cast_votes, submit_bribes
 
 class TestRoundFlowLogic:
     """Test actual round progression and completion logic"""
@@ -22,18 +22,18 @@ class TestRoundFlowLogic:
         # Start round
         game.current_round = 1
         game.state = "submission"
-        game.round_pairings[1] = game.generate_round_pairings()
-        game.bribes[1] = {}
+        round_state = game.start_round(1)
+        round_state.pairings = game.generate_round_pairings()
         
         # Initially no submissions
         assert not self._all_submissions_complete(game)
         
         # Add partial submissions
-        game.bribes[1]["p1"] = {"p2": {"content": "bribe1", "type": "text"}}
+        round_state.add_submission("p1", "p2", {"content": "bribe1", "type": "text"})
         assert not self._all_submissions_complete(game)
         
         # Complete all submissions (each player submits 2 bribes)
-        game.bribes[1] = {
+        submit_bribes(round_state, {
             "p1": {
                 "p2": {"content": "p1 to p2", "type": "text"},
                 "p3": {"content": "p1 to p3", "type": "text"}
@@ -46,7 +46,7 @@ class TestRoundFlowLogic:
                 "p1": {"content": "p3 to p1", "type": "text"},
                 "p2": {"content": "p3 to p2", "type": "text"}
             }
-        }
+        })
         
         assert self._all_submissions_complete(game)
     
@@ -62,21 +62,21 @@ class TestRoundFlowLogic:
         # Set up voting phase
         game.current_round = 1
         game.state = "voting"
-        game.votes[1] = {}
+        round_state = game.start_round(1)
         
         # Initially no votes
         assert not self._all_votes_complete(game)
         
         # Add partial votes
-        game.votes[1]["p1"] = "p2_p1"  # p1 votes for bribe from p2
+        game.record_vote(round_state, "p1", "p2_p1")  # p1 votes for bribe from p2
         assert not self._all_votes_complete(game)
         
         # Complete all votes
-        game.votes[1] = {
+        cast_votes(game, round_state, {
             "p1": "p2_p1",  # p1 votes for p2's bribe to p1
             "p2": "p3_p2",  # p2 votes for p3's bribe to p2
             "p3": "p1_p3"   # p3 votes for p1's bribe to p3
-        }
+        })
         
         assert self._all_votes_complete(game)
     
@@ -93,11 +93,11 @@ class TestRoundFlowLogic:
         # Start round
         game.current_round = 1
         game.state = "submission"
-        game.round_pairings[1] = game.generate_round_pairings()
-        game.bribes[1] = {}
+        round_state = game.start_round(1)
+        round_state.pairings = game.generate_round_pairings()
         
         # Only 3 out of 4 players submit bribes
-        game.bribes[1] = {
+        submit_bribes(round_state, {
             "p1": {
                 "p2": {"content": "p1 to p2", "type": "text"},
                 "p3": {"content": "p1 to p3", "type": "text"}
@@ -111,7 +111,7 @@ class TestRoundFlowLogic:
                 "p2": {"content": "p3 to p2", "type": "text"}
             }
             # p4 doesn't submit anything
-        }
+        })
         
         # Game should still be able to progress but not via the standard completion check
         # This tests that we have a mechanism to handle partial submissions
@@ -5,7 +5,7 @@ Tests for game scoring system
 """
 
 import pytest
-from tests.unit.game_mechanics import Game, GameManager
+from tests.unit.game_mechanics import Game, GameManager, cast_votes
 
 class TestScoringSystem:
     """Test vote counting and score accumulation"""
@@ -21,11 +21,11 @@ class TestScoringSystem:
         
         # Set up round 1 votes
         game.current_round = 1
-        game.votes[1] = {
+        cast_votes(game, game.start_round(1), {
             "p1": "p2_p1",  # p1 votes for p2's bribe
             "p2": "p2_p2",  # p2 votes for p2's bribe (if allowed)
             "p3": "p1_p3"   # p3 votes for p1's bribe
-        }
+        })
         
         # Calculate scores
         round_scores = self._calculate_round_scores(game)
@@ -51,11 +51,11 @@ class TestScoringSystem:
         
         # Round 2 voting
         game.current_round = 2
-        game.votes[2] = {
+        cast_votes(game, game.start_round(2), {
             "p1": "p3_p1",  # p1 votes for p3
             "p2": "p1_p2",  # p2 votes for p1
             "p3": "p1_p3"   # p3 votes for p1
-        }
+        })
         
         # Calculate round 2 scores
         round_scores = self._calculate_round_scores(game)
@@ -81,11 +81,11 @@ class TestScoringSystem:
         
         # Only 2 out of 4 players vote
         game.current_round = 1
-        game.votes[1] = {
+        cast_votes(game, game.start_round(1), {
             "p1": "p2_p1",  # p1 votes for p2
             "p3": "p2_p3"   # p3 votes for p2
             # p2 and p4 don't vote
-        }
+        })
         
         round_scores = self._calculate_round_scores(game)
         
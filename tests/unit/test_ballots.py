@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for per-voter ballots fixed when voting opens
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.game.ballot import Ballot
+
+
+@pytest.fixture
+def game(make_game):
+    """A game in round 1 where p1 has received two bribes"""
+    game = make_game(settings={"rounds": 1, "voting_time": 0, "results_time": 0}, round_num=1)
+    round_state = game.current
+    round_state.add_submission("p2", "p1", {"content": "cake", "type": "text", "is_random": False})
+    round_state.add_submission("p3", "p1", {"content": "cash", "type": "text", "is_random": True})
+    round_state.add_submission("p1", "p2", {"content": "fish", "type": "text", "is_random": False})
+    return game
+
+
+class TestBallot:
+    """Test ballot construction and lookups"""
+
+    def test_build_skips_own_bribes(self):
+        """A voter never sees a bribe they submitted"""
+        ballot = Ballot.build("p1", {
+            "p1": {"content": "mine"},
+            "p2": {"content": "theirs", "type": "text"},
+        })
+        assert len(ballot) == 1
+        assert "p2_p1" in ballot
+        assert "p1_p1" not in ballot
+
+    def test_option_carries_scoring_details(self):
+        """Each option knows who it credits and how many points"""
+        ballot = Ballot.build("p1", {
+            "p2": {"content": "a", "type": "text", "is_random": False},
+            "p3": {"content": "b", "type": "image", "is_random": True},
+        })
+        assert ballot.get("p2_p1").points == 1
+        random_option = ballot.get("p3_p1")
+        assert (random_option.submitter_id, random_option.target_id) == ("p3", "p1")
+        assert random_option.points == 0.5
+        assert random_option.type == "image"
+        assert ballot.get("p9_p1") is None
+
+    def test_payload_matches_voting_phase_format(self):
+        """The client payload keeps the option fields, numbering options from 1"""
+        ballot = Ballot.build("p1", {"p2": {"content": "a", "type": "text"}})
+        assert ballot.to_payload() == [
+            {'id': 1, 'content': 'a', 'type': 'text', 'is_random': False}
+        ]
+
+    def test_option_numbers_resolve_to_bribes(self):
+        """Clients vote by option number, full bribe IDs still work"""
+        ballot = Ballot.build("p1", {"p2": {"content": "a"}, "p3": {"content": "b"}})
+        assert [ballot.resolve(n) for n in (1, 2)] == ["p2_p1", "p3_p1"]
+        assert ballot.resolve("p3_p1") == "p3_p1"
+        for choice in (0, 3, True, "p1_p2"):
+            assert ballot.resolve(choice) is None
+
+    def test_payload_copies_do_not_change_ballot(self):
+        """Callers get their own list each time"""
+        ballot = Ballot.build("p1", {"p2": {"content": "a", "type": "text"}})
+        ballot.to_payload().clear()
+        assert len(ballot.to_payload()) == 1
+
+
+class TestBallotVoting:
+    """Votes are validated and scored through the round's ballots"""
+
+    def test_open_ballots_for_participants(self, game):
+        """Each listed voter gets a ballot from their inbox"""
+        game.current.open_ballots(["p1", "p2", "p3"])
+        assert {option.bribe_id for option in game.current.ballots["p1"]} == {"p2_p1", "p3_p1"}
+        assert len(game.current.ballots["p3"]) == 0
+
+    def test_credit_uses_ballot(self, game):
+        """Scoring reads the option instead of re-parsing the bribe"""
+        game.current.open_ballots(["p1", "p2", "p3"])
+        assert game.credit_for_vote(game.current, "p3_p1", "p1") == ("p3", "p1", 0.5)
+        # Not on p2's ballot, even though the bribe exists
+        assert game.credit_for_vote(game.current, "p3_p1", "p2") == (None, None, 0)
+
+    def test_handle_submit_vote_rejects_unknown_bribe(self, game):
+        """Votes for bribes not on the voter's ballot are refused"""
+        from src.web.socket_handlers import event_handlers
+
+        game.state = "voting"
+        game.current.open_ballots(["p1", "p2", "p3"])
+        session = MagicMock(player_id="p1", game_id="TEST")
+        manager = MagicMock()
+        manager.get_player_session.return_value = session
+        manager.get_game.return_value = game
+
+        with patch.object(event_handlers, 'game_manager', manager), \
+                patch.object(event_handlers, 'request', MagicMock(sid="sid1")), \
+                patch.object(event_handlers, 'emit') as mock_emit:
+            event_handlers.handle_submit_vote({'bribe_id': 'p1_p2'})
+
+        mock_emit.assert_called_once_with('error', {'message': 'Invalid vote'})
+        assert "p1" not in game.current.votes
@@ -69,7 +69,7 @@ class TestBribeBalance(unittest.TestCase):
         # Generate initial pairings
         self.game.current_round = 1
         pairings = self.game.generate_round_pairings()
-        self.game.round_pairings[1] = pairings
+        self.game.start_round(1).pairings = pairings
         
         # Find a player who has been assigned as a target
         target_player = None
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for game code allocation and case-insensitive lookup
+"""
+
+import pytest
+
+from src.game.code_allocator import CODE_ALPHABET, CodeAllocator, canonical_code
+from src.game.game_manager import GameManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCodeAllocator:
+    """Test drawing, reserving and recycling codes"""
+
+    def test_codes_are_unique_and_well_formed(self):
+        allocator = CodeAllocator()
+        codes = [allocator.allocate() for _ in range(3000)]
+        assert len(set(codes)) == 3000
+        assert all(len(code) == 4 and set(code) <= set(CODE_ALPHABET) for code in codes)
+
+    def test_configurable_length(self):
+        allocator = CodeAllocator(length=6)
+        assert len(allocator.allocate()) == 6
+
+    def test_exhausts_small_space_then_raises(self):
+        """Every code is handed out exactly once before running out"""
+        allocator = CodeAllocator(length=2, alphabet="AB")
+        codes = {allocator.allocate() for _ in range(4)}
+        assert codes == {"AA", "AB", "BA", "BB"}
+        with pytest.raises(RuntimeError):
+            allocator.allocate()
+
+    def test_reserved_and_claimed_codes_are_skipped(self):
+        allocator = CodeAllocator(length=2, alphabet="AB", reserved=["aa"])
+        assert allocator.claim("ab")
+        assert not allocator.claim("AB")
+        assert {allocator.allocate() for _ in range(2)} == {"BA", "BB"}
+        with pytest.raises(RuntimeError):
+            allocator.allocate()
+
+    def test_released_codes_return_after_cooldown(self):
+        clock = FakeClock()
+        allocator = CodeAllocator(length=1, alphabet="AB", cooldown=60, clock=clock)
+        first = allocator.allocate()
+        allocator.allocate()
+        allocator.release(first)
+
+        clock.now = 59
+        with pytest.raises(RuntimeError):
+            allocator.allocate()
+        clock.now = 60
+        assert allocator.allocate() == first
+
+    def test_canonical_code(self):
+        assert canonical_code(" ab1c ") == "AB1C"
+
+
+class TestCaseInsensitiveLookup:
+    """GameManager finds games whatever case the code is typed in"""
+
+    def test_lookup_ignores_case(self):
+        manager = GameManager()
+        game = manager.create_game(manager.allocate_game_code(), "host", {})
+        assert manager.get_game(game.game_id.lower()) is game
+        assert manager.get_game(f" {game.game_id.lower()} ") is game
+
+    def test_mixed_case_ids_keep_their_stored_case(self):
+        manager = GameManager()
+        game = manager.create_game("test-game", "host", {})
+        assert manager.get_game("TEST-GAME") is game
+        assert manager.get_game("test-game").game_id == "test-game"
+
+    def test_removed_game_releases_code(self):
+        manager = GameManager()
+        code = manager.allocate_game_code()
+        manager.create_game(code, "host", {})
+        assert manager.codes.is_in_use(code)
+        assert manager.remove_game(code.lower()).game_id == code
+        assert manager.get_game(code) is None
+        assert not manager.codes.is_in_use(code)
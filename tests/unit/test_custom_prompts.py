@@ -44,8 +44,7 @@ class TestCustomPrompts(unittest.TestCase):
     def test_prompt_selection_state_initialization(self):
         """Test prompt selection state is properly initialized"""
         self.custom_game.current_round = 1
-        self.custom_game.player_prompts = {1: {}}
-        self.custom_game.player_prompt_ready = {1: {}}
+        self.custom_game.start_round(1)
         
         # Initially no players ready
         self.assertFalse(self.custom_game.all_players_prompt_ready(1))
@@ -57,35 +56,35 @@ class TestCustomPrompts(unittest.TestCase):
         """Test prompt readiness detection logic"""
         round_num = 1
         self.custom_game.current_round = round_num
-        self.custom_game.player_prompt_ready = {round_num: {}}
+        round_state = self.custom_game.start_round(round_num)
         
         # No players ready initially
         self.assertFalse(self.custom_game.all_players_prompt_ready(round_num))
         
         # Mark players ready one by one
-        self.custom_game.player_prompt_ready[round_num]["host1"] = True
+        round_state.select_prompt("host1", "Host's prompt")
         self.assertFalse(self.custom_game.all_players_prompt_ready(round_num))
         
-        self.custom_game.player_prompt_ready[round_num]["player2"] = True
+        round_state.select_prompt("player2", "Player2's prompt")
         self.assertFalse(self.custom_game.all_players_prompt_ready(round_num))
         
-        self.custom_game.player_prompt_ready[round_num]["player3"] = True
+        round_state.select_prompt("player3", "Player3's prompt")
         self.assertTrue(self.custom_game.all_players_prompt_ready(round_num))
     
     def test_disconnected_players_not_counted_for_readiness(self):
         """Test that disconnected players don't block prompt readiness"""
         round_num = 1
         self.custom_game.current_round = round_num
-        self.custom_game.player_prompt_ready = {round_num: {}}
+        round_state = self.custom_game.start_round(round_num)
         
         # Disconnect one player
         self.custom_game.players["player3"]["connected"] = False
         
         # Only need 2 ready players now (host1 and player2)
-        self.custom_game.player_prompt_ready[round_num]["host1"] = True
+        round_state.select_prompt("host1", "Host's prompt")
         self.assertFalse(self.custom_game.all_players_prompt_ready(round_num))
         
-        self.custom_game.player_prompt_ready[round_num]["player2"] = True
+        round_state.select_prompt("player2", "Player2's prompt")
         self.assertTrue(self.custom_game.all_players_prompt_ready(round_num))
     
     def test_get_prompt_for_target_traditional_mode(self):
@@ -100,12 +99,9 @@ class TestCustomPrompts(unittest.TestCase):
         round_num = 1
         self.custom_game.current_round = round_num
         self.custom_game.current_prompt = "Default fallback prompt"
-        self.custom_game.player_prompts = {
-            round_num: {
-                "player2": "Custom prompt for player2",
-                "player3": "Custom prompt for player3"
-            }
-        }
+        round_state = self.custom_game.start_round(round_num)
+        round_state.select_prompt("player2", "Custom prompt for player2")
+        round_state.select_prompt("player3", "Custom prompt for player3")
         
         # Get custom prompt for player2
         prompt = self.custom_game.get_prompt_for_target(round_num, "player2")
@@ -129,10 +125,8 @@ class TestCustomPrompts(unittest.TestCase):
     
     def test_prompt_storage_per_round(self):
         """Test that prompts are stored separately per round"""
-        self.custom_game.player_prompts = {
-            1: {"player2": "Round 1 prompt for player2"},
-            2: {"player2": "Round 2 prompt for player2"}
-        }
+        self.custom_game.start_round(1).select_prompt("player2", "Round 1 prompt for player2")
+        self.custom_game.start_round(2).select_prompt("player2", "Round 2 prompt for player2")
         
         round1_prompt = self.custom_game.get_prompt_for_target(1, "player2")
         round2_prompt = self.custom_game.get_prompt_for_target(2, "player2")
@@ -145,13 +139,10 @@ class TestCustomPrompts(unittest.TestCase):
         """Test custom prompts work across multiple rounds"""
         # Round 1
         self.custom_game.current_round = 1
-        self.custom_game.player_prompts[1] = {
-            "player2": "R1: Make me laugh",
-            "player3": "R1: Something shiny"
-        }
-        self.custom_game.player_prompt_ready[1] = {
-            "host1": True, "player2": True, "player3": True
-        }
+        round_state = self.custom_game.start_round(1)
+        round_state.select_prompt("host1", "R1: Host's pick")
+        round_state.select_prompt("player2", "R1: Make me laugh")
+        round_state.select_prompt("player3", "R1: Something shiny")
         
         self.assertTrue(self.custom_game.all_players_prompt_ready(1))
         self.assertEqual(
@@ -161,13 +152,10 @@ class TestCustomPrompts(unittest.TestCase):
         
         # Round 2
         self.custom_game.current_round = 2
-        self.custom_game.player_prompts[2] = {
-            "player2": "R2: Something edible", 
-            "player3": "R2: A life hack"
-        }
-        self.custom_game.player_prompt_ready[2] = {
-            "host1": True, "player2": True, "player3": True
-        }
+        round_state = self.custom_game.start_round(2)
+        round_state.select_prompt("host1", "R2: Host's pick")
+        round_state.select_prompt("player2", "R2: Something edible")
+        round_state.select_prompt("player3", "R2: A life hack")
         
         self.assertTrue(self.custom_game.all_players_prompt_ready(2))
         self.assertEqual(
@@ -185,30 +173,23 @@ class TestCustomPrompts(unittest.TestCase):
         """Test prompt readiness with mixed ready states"""
         round_num = 1
         self.custom_game.current_round = round_num
-        self.custom_game.player_prompt_ready = {
-            round_num: {
-                "host1": True,
-                "player2": False,
-                "player3": True
-            }
-        }
+        round_state = self.custom_game.start_round(round_num)
+        round_state.select_prompt("host1", "Host's prompt")
+        round_state.select_prompt("player3", "Player3's prompt")
         
         # Not all players ready
         self.assertFalse(self.custom_game.all_players_prompt_ready(round_num))
         
         # Mark remaining player ready
-        self.custom_game.player_prompt_ready[round_num]["player2"] = True
+        round_state.select_prompt("player2", "Player2's prompt")
         self.assertTrue(self.custom_game.all_players_prompt_ready(round_num))
     
     def test_custom_prompts_empty_prompt_handling(self):
         """Test handling of empty or missing prompts"""
         self.custom_game.current_prompt = "Default prompt"
-        self.custom_game.player_prompts = {
-            1: {
-                "player2": "",  # Empty prompt
-                "player3": "Valid prompt"
-            }
-        }
+        round_state = self.custom_game.start_round(1)
+        round_state.select_prompt("player2", "")  # Empty prompt
+        round_state.select_prompt("player3", "Valid prompt")
         
         # Empty prompt should fall back to default
         prompt = self.custom_game.get_prompt_for_target(1, "player2")
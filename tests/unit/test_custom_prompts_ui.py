@@ -32,18 +32,14 @@ class TestCustomPromptsUIImprovements:
         
         # Start round and verify prompt selection logic
         game.current_round = 1
-        game.player_prompts = {1: {}}
-        game.player_prompt_ready = {1: {}}
+        round_state = game.start_round(1)
         
         # Players should be able to select custom prompts
-        game.player_prompts[1]["player1"] = "Write a funny joke about your target"
-        game.player_prompt_ready[1]["player1"] = True
+        round_state.select_prompt("player1", "Write a funny joke about your target")
         
-        game.player_prompts[1]["player2"] = "Create a meme about your target"  
-        game.player_prompt_ready[1]["player2"] = True
+        round_state.select_prompt("player2", "Create a meme about your target")
         
-        game.player_prompts[1]["player3"] = "Compose a haiku about your target"
-        game.player_prompt_ready[1]["player3"] = True
+        round_state.select_prompt("player3", "Compose a haiku about your target")
         
         # All players should be ready
         assert game.all_players_prompt_ready(1) == True
@@ -58,25 +54,20 @@ class TestCustomPromptsUIImprovements:
             game.add_player(player_id, f"Player{i+1}")
         
         game.current_round = 1
-        game.player_prompts = {1: {}}
-        game.player_prompt_ready = {1: {}}
+        round_state = game.start_round(1)
         
         # Mix of dropdown selections and custom prompts
         # Player 1 uses a predefined prompt (as if selected from dropdown)
-        game.player_prompts[1]["player1"] = "Write a limerick about your target"
-        game.player_prompt_ready[1]["player1"] = True
+        round_state.select_prompt("player1", "Write a limerick about your target")
         
         # Player 2 uses a custom prompt (as if typed in textarea)
-        game.player_prompts[1]["player2"] = "Tell me what superpower your target would have and why"
-        game.player_prompt_ready[1]["player2"] = True
+        round_state.select_prompt("player2", "Tell me what superpower your target would have and why")
         
         # Player 3 uses another predefined prompt
-        game.player_prompts[1]["player3"] = "Create a haiku about your target"
-        game.player_prompt_ready[1]["player3"] = True
+        round_state.select_prompt("player3", "Create a haiku about your target")
         
         # Player 4 uses a very specific custom prompt
-        game.player_prompts[1]["player4"] = "If your target was a restaurant, what would it be called and what would be on the menu?"
-        game.player_prompt_ready[1]["player4"] = True
+        round_state.select_prompt("player4", "If your target was a restaurant, what would it be called and what would be on the menu?")
         
         # All should be valid and ready
         assert game.all_players_prompt_ready(1) == True
@@ -95,28 +86,18 @@ class TestCustomPromptsUIImprovements:
         game.add_player("player1", "Player1")
         
         game.current_round = 1
-        game.player_prompts = {1: {}}
-        game.player_prompt_ready = {1: {}}
+        round_state = game.start_round(1)
         
-        # Test empty prompt (should not be ready)
-        game.player_prompts[1]["player1"] = ""
-        game.player_prompt_ready[1]["player1"] = False
-        assert not game.all_players_prompt_ready(1)
-        
-        # Test whitespace-only prompt (should not be ready)
-        game.player_prompts[1]["player1"] = "   "
-        game.player_prompt_ready[1]["player1"] = False
+        # Empty or whitespace-only input is never selected, so not ready yet
         assert not game.all_players_prompt_ready(1)
         
         # Test valid prompt
-        game.player_prompts[1]["player1"] = "Create something creative about your target"
-        game.player_prompt_ready[1]["player1"] = True
+        round_state.select_prompt("player1", "Create something creative about your target")
         assert game.all_players_prompt_ready(1)
         
         # Test very long prompt (should still be valid if under character limit)
         long_prompt = "A" * 150  # Reasonable length
-        game.player_prompts[1]["player1"] = long_prompt
-        game.player_prompt_ready[1]["player1"] = True
+        round_state.select_prompt("player1", long_prompt)
         assert game.all_players_prompt_ready(1)
         
     def test_mixed_prompt_modes_in_same_game(self):
@@ -129,8 +110,7 @@ class TestCustomPromptsUIImprovements:
             game.add_player(player_id, player_id.replace("_", " ").title())
         
         game.current_round = 1
-        game.player_prompts = {1: {}}
-        game.player_prompt_ready = {1: {}}
+        round_state = game.start_round(1)
         
         # Simulate realistic usage patterns
         prompts = {
@@ -141,8 +121,7 @@ class TestCustomPromptsUIImprovements:
         }
         
         for player_id, prompt in prompts.items():
-            game.player_prompts[1][player_id] = prompt
-            game.player_prompt_ready[1][player_id] = True
+            round_state.select_prompt(player_id, prompt)
         
         # Should work seamlessly
         assert game.all_players_prompt_ready(1) == True
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the per-game actor serializing changes to a game
+"""
+
+import contextvars
+import threading
+import time
+
+import pytest
+
+from src.game import actor as actor_module
+from src.game.actor import GameActor
+from src.game.game import Game
+from src.web.socket_handlers import game_flow
+
+
+class TestGameActor:
+    """Test that commands for one game run one at a time, in order"""
+
+    def test_run_returns_command_result(self):
+        actor = GameActor()
+        assert actor.run(lambda a, b=0: a + b, 1, b=2) == 3
+        assert actor.pending == 0
+
+    def test_commands_never_overlap(self):
+        actor = GameActor()
+        running = []
+        overlaps = []
+
+        def command():
+            running.append(1)
+            if len(running) > 1:
+                overlaps.append(True)
+            time.sleep(0.001)
+            running.pop()
+
+        threads = [threading.Thread(target=actor.run, args=(command,)) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert overlaps == []
+        assert actor.pending == 0
+
+    def test_waiting_commands_run_in_arrival_order(self):
+        actor = GameActor()
+        release = threading.Event()
+        started = threading.Event()
+        order = []
+
+        def blocker():
+            started.set()
+            release.wait()
+
+        first = threading.Thread(target=actor.run, args=(blocker,))
+        first.start()
+        started.wait()
+
+        waiting = []
+        for i in range(5):
+            thread = threading.Thread(target=actor.run, args=(order.append, i))
+            thread.start()
+            waiting.append(thread)
+            # Let each caller take its ticket before the next one arrives
+            while actor.pending < i + 2:
+                time.sleep(0.001)
+
+        release.set()
+        first.join()
+        for thread in waiting:
+            thread.join()
+
+        assert order == [0, 1, 2, 3, 4]
+
+    def test_nested_commands_run_inline(self):
+        actor = GameActor()
+        calls = []
+
+        def inner():
+            calls.append('inner')
+
+        def outer():
+            calls.append('outer')
+            actor.run(inner)
+
+        actor.run(outer)
+        assert calls == ['outer', 'inner']
+
+    def test_exception_releases_actor(self):
+        actor = GameActor()
+
+        def failing():
+            raise ValueError("boom")
+
+        try:
+            actor.run(failing)
+        except ValueError:
+            pass
+        assert actor.pending == 0
+        assert actor.run(lambda: 'ok') == 'ok'
+
+    def test_two_tasks_at_once_run_one_after_the_other(self):
+        actor = GameActor()
+        barrier = threading.Barrier(2)
+        steps = []
+
+        def command(name):
+            steps.append(f'{name} start')
+            time.sleep(0.01)
+            steps.append(f'{name} end')
+
+        def task(name):
+            barrier.wait()
+            actor.run(command, name)
+
+        threads = [threading.Thread(target=task, args=(name,)) for name in ('a', 'b')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        first, second = steps[0].split()[0], steps[2].split()[0]
+        assert {first, second} == {'a', 'b'}
+        assert steps == [f'{first} start', f'{first} end', f'{second} start', f'{second} end']
+        assert actor.pending == 0
+
+    def test_other_task_on_same_thread_waits_its_turn(self, monkeypatch):
+        """A greenlet sharing the holder's thread must queue, not run inline"""
+        actor = GameActor()
+        calls = []
+
+        class FailingEvent:
+            def wait(self):
+                raise RuntimeError("would block")
+
+            def set(self):
+                pass
+
+        monkeypatch.setattr(actor_module, '_make_event', FailingEvent)
+
+        def outer():
+            # A fresh context stands in for another greenlet on this thread
+            with pytest.raises(RuntimeError):
+                contextvars.Context().run(actor.run, calls.append, 'other')
+            calls.append('outer')
+
+        actor.run(outer)
+        assert calls == ['outer']
+        assert actor.pending == 0
+
+    def test_waiters_use_the_configured_event_factory(self, monkeypatch):
+        actor = GameActor()
+        created = []
+
+        def factory():
+            event = threading.Event()
+            created.append(event)
+            return event
+
+        monkeypatch.setattr(actor_module, '_make_event', threading.Event)
+        actor_module.set_event_factory(factory)
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocker():
+            started.set()
+            release.wait()
+
+        thread = threading.Thread(target=actor.run, args=(blocker,))
+        thread.start()
+        started.wait()
+        waiter = threading.Thread(target=actor.run, args=(lambda: None,))
+        waiter.start()
+        while actor.pending < 2:
+            time.sleep(0.001)
+        release.set()
+        thread.join()
+        waiter.join()
+
+        assert len(created) == 1
+        assert actor.pending == 0
+
+    def test_games_do_not_wait_on_each_other(self):
+        first, second = GameActor(), GameActor()
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocker():
+            started.set()
+            release.wait()
+
+        thread = threading.Thread(target=first.run, args=(blocker,))
+        thread.start()
+        started.wait()
+        try:
+            assert second.run(lambda: 'done') == 'done'
+        finally:
+            release.set()
+            thread.join()
+
+
+class TestGameCommands:
+    """Test that timer callbacks go through the game's actor"""
+
+    def test_each_game_has_an_actor(self):
+        game = Game("TEST", "host", {})
+        assert isinstance(game.actor, GameActor)
+
+    def test_run_game_command_runs_on_actor(self):
+        game = Game("TEST", "host", {})
+        seen = []
+
+        def command(target, value):
+            seen.append((target, value, game.actor.pending))
+
+        game_flow.run_game_command(game, command, 7)
+        assert seen == [(game, 7, 1)]
+        assert game.actor.pending == 0
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the sharded game registry in GameManager
+"""
+
+import threading
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.game.game import Game
+from src.game.game_manager import GameManager
+from src.game.player_session import PlayerSession
+
+
+@pytest.fixture
+def manager():
+    return GameManager(shard_count=4)
+
+
+def add_game_with_players(manager, game_id, player_ids):
+    game = manager.create_game(game_id, player_ids[0], {'rounds': 1})
+    for pid in player_ids:
+        manager.join_game(game_id, pid, pid.upper())
+    return game
+
+
+class TestRegistry:
+    """Games are spread over shards but look like one registry"""
+
+    def test_games_view_covers_all_shards(self, manager):
+        """The games mapping lists every game regardless of shard"""
+        for game_id in ("AAAA", "BBBB", "CCCC", "DDDD", "EEEE"):
+            manager.create_game(game_id, f"host-{game_id}", {})
+        assert sorted(manager.games) == ["AAAA", "BBBB", "CCCC", "DDDD", "EEEE"]
+        assert len(manager.games) == 5
+        assert manager.games["CCCC"].game_id == "CCCC"
+        assert "ZZZZ" not in manager.games
+
+    def test_duplicate_game_rejected(self, manager):
+        manager.create_game("AAAA", "h1", {})
+        with pytest.raises(ValueError):
+            manager.create_game("AAAA", "h2", {})
+
+    def test_add_game_registers_existing_players(self, manager):
+        """Games built outside the manager are linked to all their players"""
+        game = Game("AAAA", "h1", {})
+        game.add_player("h1", "Host")
+        game.add_player("p2", "Two")
+        manager.add_game(game)
+        assert manager.get_player_game("p2") is game
+        assert manager.get_game_player_ids("AAAA") == {"h1", "p2"}
+
+
+class TestReverseIndex:
+    """The game -> players index keeps cleanup proportional to what is removed"""
+
+    def test_join_and_kick_update_index(self, manager):
+        add_game_with_players(manager, "AAAA", ["h1", "p2", "p3"])
+        assert manager.get_game_player_ids("AAAA") == {"h1", "p2", "p3"}
+
+        assert manager.remove_player("AAAA", "p3")
+        assert manager.get_game_player_ids("AAAA") == {"h1", "p2"}
+        assert manager.get_player_game("p3") is None
+        assert "p3" not in manager.get_game("AAAA").players
+        assert not manager.remove_player("AAAA", "p3")
+
+    def test_cleanup_only_touches_removed_games(self, manager):
+        """Players of surviving games stay mapped"""
+        empty = add_game_with_players(manager, "AAAA", ["h1", "p2"])
+        add_game_with_players(manager, "BBBB", ["h2", "p3"])
+        for pid in empty.players:
+            empty.set_player_connected(pid, False)
+
+        manager.cleanup_empty_games()
+        assert manager.get_game("AAAA") is None
+        assert manager.get_player_game("h1") is None
+        assert manager.get_player_game("p3").game_id == "BBBB"
+        assert manager.get_game_player_ids("AAAA") == set()
+
+    def test_cleanup_skips_occupied_games(self, manager):
+        """Games are tracked as empty when their last player leaves, not rescanned"""
+        game = add_game_with_players(manager, "AAAA", ["h1", "p2"])
+        shard = manager._shard_for("AAAA")
+        assert "AAAA" not in shard.empty
+
+        game.set_player_connected("h1", False)
+        game.set_player_connected("p2", False)
+        assert "AAAA" in shard.empty
+        game.set_player_connected("p2", True)
+        assert "AAAA" not in shard.empty
+
+        game.actor = MagicMock()
+        manager.cleanup_empty_games()
+        game.actor.run.assert_not_called()
+        assert manager.get_game("AAAA") is game
+
+    def test_player_moving_games_leaves_old_index(self, manager):
+        add_game_with_players(manager, "AAAA", ["h1", "p2"])
+        add_game_with_players(manager, "BBBB", ["h2"])
+        manager.join_game("BBBB", "p2", "P2")
+        assert manager.get_game_player_ids("AAAA") == {"h1"}
+        assert manager.get_player_game("p2").game_id == "BBBB"
+
+    def test_remove_game(self, manager):
+        add_game_with_players(manager, "AAAA", ["h1", "p2"])
+        assert manager.remove_game("AAAA").game_id == "AAAA"
+        assert manager.get_player_game("p2") is None
+        assert manager.remove_game("AAAA") is None
+
+
+class TestConcurrency:
+    """Unrelated games can be created and joined from many threads"""
+
+    def test_parallel_creates_and_joins(self, manager):
+        def worker(index):
+            game_id = f"G{index:03d}"
+            manager.create_game(game_id, f"h{index}", {})
+            for n in range(5):
+                manager.join_game(game_id, f"p{index}-{n}", f"P{n}")
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(40)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(manager.games) == 40
+        assert all(len(manager.get_game_player_ids(f"G{i:03d}")) == 6 for i in range(40))
+        assert len(manager.player_to_game) == 240
+
+    def test_players_moving_across_shards(self, manager):
+        """Each player ends up indexed under exactly one game"""
+        game_ids = [f"M{i:03d}" for i in range(8)]
+        for game_id in game_ids:
+            manager.create_game(game_id, f"h-{game_id}", {})
+        player_ids = [f"p{n}" for n in range(20)]
+
+        def worker(offset):
+            for step in range(30):
+                for n, player_id in enumerate(player_ids):
+                    game_id = game_ids[(n + step + offset) % len(game_ids)]
+                    manager.join_game(game_id, player_id, player_id.upper())
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for player_id in player_ids:
+            indexed = [game_id for game_id in game_ids
+                       if player_id in manager.get_game_player_ids(game_id)]
+            assert indexed == [manager.player_to_game[player_id]]
+
+
+class TestSessionIndexes:
+    """Sessions are indexed by player and by game"""
+
+    def setup_method(self):
+        self.manager = GameManager()
+        add_game_with_players(self.manager, "AAAA", ["h1", "p2"])
+        self.manager.add_player_session("s1", PlayerSession("s1", "h1", "AAAA"))
+        self.manager.add_player_session("s2", PlayerSession("s2", "p2", "AAAA"))
+        self.manager.add_player_session("s3", PlayerSession("s3", "p2", "AAAA"))
+
+    def test_lookup_by_player_and_game(self):
+        assert self.manager.get_player_socket_ids("p2") == ["s2", "s3"]
+        assert self.manager.get_game_socket_ids("AAAA") == ["s1", "s2", "s3"]
+        assert self.manager.get_player_socket_id("AAAA", "p2") == "s2"
+        assert self.manager.get_player_socket_id("BBBB", "p2") is None
+
+    def test_other_sessions(self):
+        assert self.manager.has_other_sessions("s2", "p2", "AAAA")
+        assert not self.manager.has_other_sessions("s1", "h1", "AAAA")
+
+    def test_remove_and_disconnect_update_indexes(self):
+        self.manager.remove_player_session("s2")
+        assert self.manager.get_player_socket_ids("p2") == ["s3"]
+        assert not self.manager.has_other_sessions("s3", "p2", "AAAA")
+
+        self.manager.get_game("AAAA").set_player_connected("p2", False)
+        self.manager.remove_player_session("s3")
+        assert self.manager.get_player_socket_ids("p2") == []
+        assert self.manager.get_game_socket_ids("AAAA") == ["s1"]
+        assert not self.manager.get_game("AAAA").players["p2"].connected
+
+    def test_replacing_a_session_reindexes_it(self):
+        """A socket re-registered for another player moves between indexes"""
+        self.manager.add_player_session("s1", PlayerSession("s1", "p2", "AAAA"))
+        assert self.manager.get_player_socket_ids("h1") == []
+        assert self.manager.get_player_socket_ids("p2") == ["s2", "s3", "s1"]
+
+    def test_removed_game_drops_sessions(self):
+        self.manager.remove_game("AAAA")
+        assert self.manager.player_sessions == {}
+        assert self.manager.get_game_socket_ids("AAAA") == []
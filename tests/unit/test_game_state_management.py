@@ -147,9 +147,7 @@ class TestGameStateManagement:
         self.game.state = "voting"
         self.game.current_round = 2
         self.game.scores = {"host1": 2, "p1": 1, "p2": 3, "p3": 1}
-        self.game.bribes[2] = {
-            "host1": {"p1": {"content": "Test bribe", "type": "text"}}
-        }
+        self.game.start_round(2).add_submission("host1", "p1", {"content": "Test bribe", "type": "text"})
         
         # Player disconnects
         self.game.players["p1"]["connected"] = False
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for hibernating idle games to disk
+"""
+
+import os
+import threading
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.game.game import Game
+from src.game.game_manager import GameManager
+from src.game.hibernation import Hibernator
+from src.game.memory import MemoryBudget
+from src.game.retention import RetentionPolicy
+
+
+def played_game():
+    """A game in the voting phase of its second round"""
+    game = Game("SNAP", "p1", {'rounds': 3, 'custom_prompts': False})
+    for pid in ["p1", "p2", "p3", "p4"]:
+        game.add_player(pid, pid.upper())
+    game.current_round = 1
+    first = game.start_round(1)
+    first.pairings = game.generate_round_pairings()
+    game.scores.add("p2", 1)
+
+    game.current_round = 2
+    round_state = game.start_round(2)
+    round_state.pairings = game.generate_round_pairings()
+    for pid, targets in round_state.pairings.items():
+        for target_id in targets:
+            round_state.add_submission(pid, target_id, {
+                'content': f"{pid}->{target_id}", 'type': 'text', 'is_random': pid == "p4"})
+    game.state = "voting"
+    game.phase_generation = 7
+    round_state.open_ballots(game.get_round_participant_ids())
+    game.track_phase("voting")
+    option = next(iter(round_state.ballots["p1"]))
+    round_state.record_vote("p1", option.bribe_id, option.submitter_id, option.target_id, option.points)
+    return game
+
+
+@pytest.fixture
+def hibernator(tmp_path):
+    return Hibernator(str(tmp_path), idle_seconds=0)
+
+
+@pytest.fixture
+def manager(hibernator):
+    return GameManager(hibernator=hibernator)
+
+
+def add_idle_game(manager, game_id="AAAA"):
+    game = manager.create_game(game_id, "h1", {'rounds': 3})
+    for pid in ["h1", "p2", "p3"]:
+        manager.join_game(game_id, pid, pid.upper())
+    for pid in list(game.players):
+        game.set_player_connected(pid, False)
+    return game
+
+
+class TestSnapshots:
+    """Test that a game survives a snapshot round trip"""
+
+    def test_round_trip_keeps_state(self):
+        game = played_game()
+        restored = Game.from_snapshot(game.to_snapshot())
+
+        assert restored.state == "voting"
+        assert restored.current_round == 2
+        assert restored.phase_generation == 7
+        assert list(restored.players) == list(game.players)
+        assert restored.players["p4"].username == "P4"
+        assert restored.scores.ranked() == game.scores.ranked()
+        assert [rs.round_num for rs in restored.iter_rounds()] == [1, 2]
+        assert restored.current.submissions == game.current.submissions
+        assert restored.current.votes == game.current.votes
+        assert restored.current.tally == game.current.tally
+        assert restored.past_bribe_targets == game.past_bribe_targets
+
+    def test_round_trip_keeps_ballots_and_progress(self):
+        game = played_game()
+        restored = Game.from_snapshot(game.to_snapshot())
+
+        for pid, ballot in game.current.ballots.items():
+            assert restored.current.ballots[pid].to_payload() == ballot.to_payload()
+        progress = restored.get_phase_tracker("voting")
+        assert progress.completed_count == 1
+        assert not progress.is_complete()
+
+    def test_restored_game_counts_players(self):
+        game = played_game()
+        game.set_player_connected("p3", False)
+        restored = Game.from_snapshot(game.to_snapshot())
+        assert restored.get_connected_player_count() == 3
+        assert restored.find_player_by_username("p2") == "p2"
+
+    def test_round_trip_keeps_lobby_version(self):
+        game = played_game()
+        game.roster.publish(game)
+        restored = Game.from_snapshot(game.to_snapshot())
+
+        assert restored.roster.snapshot() == game.roster.snapshot()
+        assert restored.roster.publish(restored) is None
+        restored.set_player_connected("p3", False)
+        patch = restored.roster.publish(restored)
+        assert patch['from_version'] == game.roster.version
+        assert set(patch) - {'from_version', 'version', 'player_count', 'can_start'} == {'changed'}
+
+
+class TestHibernation:
+    """Test moving idle games out of the registry and back"""
+
+    def test_idle_game_is_hibernated_and_woken(self, manager, hibernator, tmp_path):
+        game = add_idle_game(manager)
+        game.scores.add("p2", 3)
+
+        manager.cleanup_empty_games()
+        assert "AAAA" not in manager.games
+        assert hibernator.is_hibernated("AAAA")
+        assert manager.codes.is_in_use("AAAA")
+        assert len(os.listdir(tmp_path)) == 1
+
+        woken = manager.get_game("aaaa")
+        assert woken is not None and woken is not game
+        assert woken.scores["p2"] == 3
+        assert "AAAA" in manager.games
+        assert not hibernator.is_hibernated("AAAA")
+        assert os.listdir(tmp_path) == []
+
+    def test_join_wakes_game(self, manager):
+        add_idle_game(manager)
+        manager.cleanup_empty_games()
+
+        assert manager.join_game("AAAA", "p2", "P2")
+        game = manager.get_game("AAAA")
+        assert game.players["p2"].connected
+        assert manager.get_player_game("p3") is game
+
+    def test_recently_idle_game_stays(self, manager, hibernator):
+        hibernator.idle_seconds = 600
+        add_idle_game(manager)
+        manager.cleanup_empty_games()
+        assert "AAAA" in manager.games
+
+    def test_connected_and_timed_games_stay(self, manager):
+        manager.create_game("BBBB", "h1", {'rounds': 3})
+        manager.join_game("BBBB", "h1", "H1")
+        timed = add_idle_game(manager, "CCCC")
+        timed.round_timer = MagicMock(pending=True)
+
+        manager.cleanup_empty_games()
+        assert "BBBB" in manager.games
+        assert "CCCC" in manager.games
+
+    def test_finished_games_are_removed(self, manager, hibernator):
+        game = add_idle_game(manager)
+        game.state = "finished"
+        manager.cleanup_empty_games()
+        assert manager.get_game("AAAA") is None
+        assert not hibernator.is_hibernated("AAAA")
+        assert not manager.codes.is_in_use("AAAA")
+
+    def test_expired_snapshot_frees_code(self, manager, hibernator, tmp_path):
+        add_idle_game(manager)
+        manager.cleanup_empty_games()
+
+        hibernator.snapshot_ttl = 0
+        manager.cleanup_empty_games()
+        assert not hibernator.is_hibernated("AAAA")
+        assert manager.get_game("AAAA") is None
+        assert manager.get_player_game("p2") is None
+        assert not manager.codes.is_in_use("AAAA")
+        assert os.listdir(tmp_path) == []
+
+    def test_without_hibernator_empty_games_are_removed(self):
+        manager = GameManager()
+        add_idle_game(manager)
+        manager.cleanup_empty_games()
+        assert manager.get_game("AAAA") is None
+
+    def test_woken_game_keeps_memory_budget(self, manager):
+        budget = MemoryBudget()
+        game = Game("DDDD", "h1", {'rounds': 3}, memory_budget=budget)
+        game.add_player("h1", "H1")
+        game.set_player_connected("h1", False)
+        manager.add_game(game)
+
+        manager.cleanup_empty_games()
+        assert budget.total == 0
+        woken = manager.get_game("DDDD")
+        assert woken.memory.budget is budget
+        assert budget.total == woken.memory.bytes_used > 0
+
+    def test_cleanup_waits_for_running_event(self):
+        manager = GameManager()
+        game = add_idle_game(manager)
+        release = threading.Event()
+        holder = threading.Thread(target=game.actor.run, args=(release.wait,))
+        holder.start()
+        while game.actor.pending < 1:
+            time.sleep(0.001)
+        cleaner = threading.Thread(target=manager.cleanup_empty_games)
+        cleaner.start()
+        while game.actor.pending < 2:
+            time.sleep(0.001)
+        assert "AAAA" in manager.games
+
+        release.set()
+        holder.join()
+        cleaner.join()
+        assert "AAAA" not in manager.games
+
+    def test_expired_snapshot_deletes_round_segments(self, manager, hibernator, tmp_path):
+        spill_dir = tmp_path / "rounds"
+        game = add_idle_game(manager)
+        game.retention = RetentionPolicy(hot_rounds=1, spill_dir=str(spill_dir))
+        for round_num in (1, 2, 3):
+            game.start_round(round_num).add_submission("p2", "h1", {'content': "x"})
+        assert len(os.listdir(spill_dir)) == 2
+
+        manager.cleanup_empty_games()
+        hibernator.snapshot_ttl = 0
+        manager.cleanup_empty_games()
+        assert os.listdir(spill_dir) == []
+
+
+class TestEventsDuringHibernation:
+    """Test events that were waiting on a game's actor when it hibernated"""
+
+    def test_waiting_event_runs_on_woken_game(self, manager):
+        from src.web.socket_handlers import event_handlers
+
+        old = add_idle_game(manager)
+        seen = []
+        handler = event_handlers.run_on_game_actor(
+            lambda data: seen.append(manager.games.get("AAAA")))
+        release = threading.Event()
+
+        def hibernate_after_release():
+            release.wait()
+            manager.cleanup_empty_games()
+
+        with patch.object(event_handlers, 'game_manager', manager):
+            holder = threading.Thread(target=old.actor.run, args=(hibernate_after_release,))
+            holder.start()
+            while old.actor.pending < 1:
+                time.sleep(0.001)
+            waiter = threading.Thread(target=handler, args=({'game_id': "AAAA"},))
+            waiter.start()
+            while old.actor.pending < 2:
+                time.sleep(0.001)
+            release.set()
+            holder.join()
+            waiter.join()
+
+        woken = manager.games.get("AAAA")
+        assert woken is not None and woken is not old
+        assert seen == [woken]
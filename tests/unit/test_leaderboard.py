@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the ranked leaderboard and incremental vote tallying
+"""
+
+from unittest.mock import MagicMock, patch
+
+from src.game.game import Game
+from src.game.leaderboard import Leaderboard
+
+
+class TestLeaderboard:
+    """Test the Leaderboard mapping keeps its ranking sorted"""
+
+    def test_ranking_follows_updates(self):
+        """Scores can be set, added to and removed while staying ranked"""
+        board = Leaderboard({"a": 0, "b": 0, "c": 0})
+        board.add("b", 2)
+        board.add("c", 1)
+        assert board.ranked() == [("b", 2), ("c", 1), ("a", 0)]
+
+        board["a"] = 5
+        assert board.ranked()[0] == ("a", 5)
+
+        del board["b"]
+        assert board.ranked() == [("a", 5), ("c", 1)]
+        assert "b" not in board
+
+    def test_ties_keep_insertion_order(self):
+        """Players with equal scores are ranked in the order they joined"""
+        board = Leaderboard({"first": 1, "second": 1, "third": 1})
+        board.add("third", 0.5)
+        board.add("third", -0.5)
+        assert [pid for pid, _ in board.ranked()] == ["first", "second", "third"]
+
+    def test_behaves_like_a_dict(self):
+        """Existing code reads and compares scores like a plain dict"""
+        board = Leaderboard({"a": 1})
+        board["a"] += 1
+        assert board == {"a": 2}
+        assert list(board.items()) == [("a", 2)]
+
+    def test_game_scores_assignment_keeps_leaderboard(self):
+        """Assigning a dict to Game.scores converts it to a Leaderboard"""
+        game = Game("TEST", "host", {'rounds': 3})
+        game.scores = {"a": 1, "b": 3}
+        assert isinstance(game.scores, Leaderboard)
+        assert game.scores.ranked()[0] == ("b", 3)
+
+
+class TestIncrementalTally:
+    """Test that votes are tallied as they arrive"""
+
+    def setup_method(self):
+        self.game = Game("TEST", "p1", {'rounds': 3, 'results_time': 0})
+        for pid in ["p1", "p2", "p3"]:
+            self.game.add_player(pid, pid.upper())
+        self.game.current_round = 1
+        self.round_state = self.game.start_round(1)
+        self.round_state.add_submission("p2", "p1", {"content": "a", "type": "text", "is_random": False})
+        self.round_state.add_submission("p3", "p1", {"content": "b", "type": "text", "is_random": True})
+
+    def vote(self, voter_id, bribe_id):
+        submitter_id, target_id, points = self.game.credit_for_vote(self.round_state, bribe_id)
+        self.round_state.record_vote(voter_id, bribe_id, submitter_id, target_id, points)
+
+    def test_votes_update_tally(self):
+        """Each vote adds a full or half point to the submitter's round tally"""
+        self.vote("p1", "p3_p1")
+        assert self.round_state.tally == {"p3": 0.5}
+
+    def test_changed_vote_moves_points(self):
+        """Voting again replaces the earlier vote's points"""
+        self.vote("p1", "p3_p1")
+        self.vote("p1", "p2_p1")
+        assert self.round_state.tally == {"p3": 0, "p2": 1}
+        assert self.round_state.votes == {"p1": "p2_p1"}
+
+    def test_unknown_bribe_counts_as_voted_without_points(self):
+        """A vote for an unknown bribe still marks the player as voted"""
+        self.vote("p1", "nobody_p1")
+        assert "p1" in self.round_state.voted_players
+        assert self.round_state.tally == {}
+
+    def test_kicked_submitter_loses_round_points(self):
+        """Removing a player drops the votes that credited them"""
+        self.vote("p1", "p2_p1")
+        self.game.remove_player("p2")
+        assert self.round_state.tally == {}
+        assert self.round_state.vote_credit == {}
+
+    def test_end_voting_phase_uses_tally_and_ranking(self):
+        """Closing the round folds the tally into the ranked scoreboard"""
+        self.vote("p1", "p2_p1")
+        mock_socketio = MagicMock()
+        with patch('src.web.socket_handlers.game_flow.socketio', mock_socketio), \
+                patch('src.web.socket_handlers.game_flow.game_manager', MagicMock()):
+            from src.web.socket_handlers.game_flow import end_voting_phase
+            end_voting_phase(self.game)
+
+        payload = mock_socketio.emit.call_args_list[0][0][1]
+        assert [row['handle'] for row in payload['scoreboard']][0] == self.game.handle_of("p2")
+        assert payload['scoreboard'][0]['round_score'] == 1
+        assert self.game.scores["p2"] == 1
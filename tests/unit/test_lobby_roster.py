@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for versioned lobby snapshots and patches
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.game.game import Game
+from src.web.socket_handlers import game_flow
+
+
+@pytest.fixture
+def game(make_game):
+    return make_game("LOBY", settings={'rounds': 3, 'submission_time': 0})
+
+
+def apply(snapshot, patch):
+    """Apply a patch to a snapshot the way the client does"""
+    assert patch['from_version'] == snapshot['version']
+    players = [p for p in snapshot['players'] if p['handle'] not in patch.get('removed', [])]
+    changes = {c['handle']: c for c in patch.get('changed', [])}
+    players = [{**p, **changes.get(p['handle'], {})} for p in players]
+    players += patch.get('added', [])
+    return {
+        'version': patch['version'],
+        'players': players,
+        'settings': {**snapshot['settings'], **patch.get('settings', {})},
+        'player_count': patch['player_count'],
+        'can_start': patch['can_start']
+    }
+
+
+class TestLobbyRoster:
+    """Test the versioned roster kept on each game"""
+
+    def test_first_publish_adds_everyone(self, game):
+        patch_ = game.roster.publish(game)
+        assert patch_['from_version'] == 0 and patch_['version'] == 1
+        assert [p['handle'] for p in patch_['added']] == [1, 2, 3]
+        assert [p['username'] for p in patch_['added']] == ["P1", "P2", "P3"]
+        assert patch_['settings'] == game.settings
+        assert patch_['can_start'] is True
+
+    def test_nothing_changed_publishes_nothing(self, game):
+        game.roster.publish(game)
+        assert game.roster.publish(game) is None
+        assert game.roster.version == 1
+
+    def test_join_sends_only_the_new_player(self, game):
+        game.roster.publish(game)
+        game.add_player("p4", "P4")
+        patch_ = game.roster.publish(game)
+        assert [p['handle'] for p in patch_['added']] == [game.handle_of("p4")]
+        assert 'changed' not in patch_ and 'settings' not in patch_
+        assert patch_['player_count'] == 4
+
+    def test_disconnect_sends_only_the_flag(self, game):
+        game.roster.publish(game)
+        game.set_player_connected("p2", False)
+        patch_ = game.roster.publish(game)
+        assert patch_['changed'] == [{'handle': game.handle_of("p2"), 'connected': False}]
+        assert patch_['player_count'] == 2
+
+    def test_leave_and_settings_change(self, game):
+        game.roster.publish(game)
+        handle = game.handle_of("p3")
+        game.remove_player("p3")
+        game.settings['rounds'] = 5
+        patch_ = game.roster.publish(game)
+        assert patch_['removed'] == [handle]
+        assert patch_['settings'] == {'rounds': 5}
+        assert patch_['can_start'] is False
+
+    def test_patches_rebuild_the_snapshot(self, game):
+        client = game.roster.snapshot()
+        steps = [
+            lambda: game.add_player("p4", "P4"),
+            lambda: game.set_player_connected("p1", False),
+            lambda: game.remove_player("p2"),
+            lambda: game.settings.update(voting_time=30),
+            lambda: game.scores.__setitem__("p3", 2),
+        ]
+        for step in steps:
+            step()
+            client = apply(client, game.roster.publish(game))
+        assert client == game.roster.snapshot()
+
+
+class TestHandles:
+    """Test the per-game handles standing in for player IDs"""
+
+    def test_handles_are_small_and_not_reused(self, game):
+        assert [game.handle_of(pid) for pid in ["p1", "p2", "p3"]] == [1, 2, 3]
+        game.remove_player("p2")
+        game.add_player("p2", "P2")
+        assert game.handle_of("p2") == 4
+        assert game.player_for_handle(2) is None
+        assert game.player_for_handle(4) == "p2"
+
+    def test_lookup_of_non_player_allocates_nothing(self, game):
+        assert game.handle_of("stranger") is None
+        game.add_player("p4", "P4")
+        assert game.handle_of("p4") == 4
+
+    def test_kicked_player_has_no_handle(self, game):
+        game.remove_player("p2")
+        assert game.handle_of("p2") is None
+
+    def test_only_integers_resolve(self, game):
+        assert game.player_for_handle("1") is None
+        assert game.player_for_handle(True) is None
+
+    def test_handles_survive_snapshots(self, game):
+        game.remove_player("p1")
+        restored = Game.from_snapshot(game.to_snapshot())
+        assert restored.handle_of("p3") == 3
+        assert restored.player_for_handle(1) is None
+        restored.add_player("p5", "P5")
+        assert restored.handle_of("p5") == 4
+
+
+class TestLobbyEmits:
+    """Test how lobby changes reach clients"""
+
+    @pytest.fixture(autouse=True)
+    def game_manager(self, game):
+        manager = MagicMock()
+        manager.get_game.return_value = game
+        with patch.object(game_flow, 'game_manager', manager):
+            yield manager
+
+    def test_update_broadcasts_patch_to_room(self, game, mock_socketio):
+        game_flow.emit_lobby_update(game.game_id)
+        event, payload = mock_socketio.emit.call_args[0]
+        assert event == 'lobby_patch' and payload['version'] == 1
+        assert mock_socketio.emit.call_args[1]['room'] == game.game_id
+
+    def test_unchanged_lobby_sends_nothing(self, game, mock_socketio):
+        game_flow.emit_lobby_update(game.game_id)
+        game_flow.emit_lobby_update(game.game_id)
+        assert mock_socketio.emit.call_count == 1
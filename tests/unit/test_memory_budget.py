@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for per-game memory accounting and the process-wide budget
+"""
+
+import os
+import sys
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+# handle_join_game imports PlayerSession from the game package under src
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'src'))
+
+from src.game.game import Game
+from src.game.game_manager import GameManager
+from src.game.memory import (PLAYER_OVERHEAD, PROMPT_OVERHEAD, SUBMISSION_OVERHEAD,
+                             MemoryBudget)
+from src.game.player_session import PlayerSession
+from src.web.socket_handlers import event_handlers
+
+
+@pytest.fixture
+def budget():
+    return MemoryBudget(limit=0, max_submission_bytes=0)
+
+
+@pytest.fixture
+def budget_game(make_game, budget):
+    def build(game_id="MEM1"):
+        return make_game(game_id, round_num=1, memory_budget=budget)
+    return build
+
+
+def bribe(content):
+    return {'content': content, 'type': 'text', 'is_random': False}
+
+
+class TestGameAccounting:
+    """Test that a game's byte count follows what it stores"""
+
+    def test_players_are_counted(self, budget):
+        game = Game("MEM1", "p1", {}, memory_budget=budget)
+        game.add_player("p1", "Alice")
+        assert game.get_memory_usage() == PLAYER_OVERHEAD + 5
+
+        game.players["p1"].username = "Al"
+        assert game.get_memory_usage() == PLAYER_OVERHEAD + 2
+        game.remove_player("p1")
+        assert game.get_memory_usage() == 0
+
+    def test_submissions_and_prompts_are_counted(self, budget, budget_game):
+        game = budget_game()
+        base = game.get_memory_usage()
+
+        game.current.add_submission("p1", "p2", bribe("x" * 1000))
+        game.current.select_prompt("p1", "hello")
+        assert game.get_memory_usage() == base + SUBMISSION_OVERHEAD + 1000 + PROMPT_OVERHEAD + 5
+
+        # Replacing a bribe only counts the new one
+        game.current.add_submission("p1", "p2", bribe("x" * 10))
+        assert game.get_memory_usage() == base + SUBMISSION_OVERHEAD + 10 + PROMPT_OVERHEAD + 5
+
+    def test_compaction_and_reset_free_content(self, budget, budget_game):
+        game = budget_game()
+        base = game.get_memory_usage()
+        game.current.add_submission("p1", "p2", bribe("x" * 1000))
+
+        game.current.compact()
+        assert game.get_memory_usage() == base
+        game.current.restore({'submissions': {"p1": {"p2": bribe("y" * 50)}}})
+        assert game.get_memory_usage() == base + SUBMISSION_OVERHEAD + 50
+
+        game.reset_to_lobby()
+        assert game.get_memory_usage() == base
+
+class TestProcessBudget:
+    """Test the process-wide total and limit"""
+
+    def test_total_covers_all_games(self, budget, budget_game):
+        first = budget_game("MEM1")
+        second = budget_game("MEM2")
+        second.current.add_submission("p1", "p2", bribe("x" * 100))
+        assert budget.total == first.get_memory_usage() + second.get_memory_usage()
+
+    def test_removed_games_leave_the_total(self, budget, budget_game):
+        manager = GameManager()
+        game = budget_game()
+        manager.add_game(game)
+        manager.remove_game("MEM1")
+        assert budget.total == 0
+
+    def test_limit_rejects_growth_but_allows_replacement(self, budget, budget_game):
+        game = budget_game()
+        game.current.add_submission("p1", "p2", bribe("x" * 1000))
+        budget.limit = budget.total + 400
+
+        assert game.can_store_submission("p1", "p3", bribe("y" * 50))
+        assert not game.can_store_submission("p1", "p3", bribe("y" * 500))
+        # Replacing the earlier bribe to p2 frees its bytes first
+        assert game.can_store_submission("p1", "p2", bribe("y" * 500))
+
+    def test_oversized_bribe_rejected(self, budget, budget_game):
+        budget.max_submission_bytes = 100
+        game = budget_game()
+        assert not game.memory.too_large(bribe("x" * 100))
+        assert game.memory.too_large(bribe("x" * 101))
+
+    def test_finished_rounds_are_shed_before_rejecting(self, budget, budget_game):
+        game = budget_game()
+        game.current.add_submission("p1", "p2", bribe("x" * 1000))
+        game.current_round = 2
+        game.start_round(2)
+        # Round 1 is still within the hot window
+        assert not game.past_rounds[0].compacted
+        budget.limit = budget.total + 400
+
+        assert game.can_store_submission("p1", "p2", bribe("y" * 500))
+        assert game.past_rounds[0].compacted
+        assert not game.can_store_submission("p1", "p2", bribe("y" * 5000))
+
+    def test_prompts_and_players_are_checked(self, budget, budget_game):
+        game = budget_game()
+        budget.limit = budget.total + 100
+
+        assert game.can_store_prompt("p1", "short")
+        assert not game.can_store_prompt("p1", "x" * 100)
+        assert game.can_store_player("p1", "P1" + "x" * 90)
+        assert not game.can_store_player("p4", "P4")
+
+
+class TestSubmitBribeBudget:
+    """Test that handle_submit_bribe enforces the budget before storing"""
+
+    def submit(self, game, content):
+        manager = MagicMock()
+        manager.get_player_session.return_value = PlayerSession("s1", "p1", game.game_id)
+        manager.get_game.return_value = game
+        with patch.object(event_handlers, 'game_manager', manager), \
+                patch.object(event_handlers, 'request', MagicMock(sid="s1")), \
+                patch.object(event_handlers, 'check_all_submissions_complete'), \
+                patch.object(event_handlers, 'emit') as mock_emit:
+            event_handlers.handle_submit_bribe({'target_id': 'p2', 'submission': content})
+        return mock_emit
+
+    def test_bribe_over_budget_is_not_stored(self, budget, budget_game):
+        game = budget_game()
+        game.state = "submission"
+        budget.limit = budget.total + 400
+
+        mock_emit = self.submit(game, "x" * 1000)
+        mock_emit.assert_called_once_with(
+            'error', {'message': 'The server is short on memory, please send a smaller bribe'})
+        assert "p1" not in game.current.submissions
+
+        mock_emit = self.submit(game, "small")
+        mock_emit.assert_called_once_with('bribe_submitted', {'target_id': 'p2'})
+        assert game.current.submissions["p1"]["p2"]['content'] == "small"
+
+
+class TestOtherWritesBudget:
+    """Test that prompt choices and joins are checked against the budget too"""
+
+    def run(self, handler, game, data, sid="s1", player_id="p1"):
+        manager = MagicMock()
+        manager.get_player_session.return_value = PlayerSession(sid, player_id, game.game_id)
+        manager.get_game.return_value = game
+        with patch.object(event_handlers, 'game_manager', manager), \
+                patch.object(event_handlers, 'request', MagicMock(sid=sid)), \
+                patch.object(event_handlers, 'join_room'), \
+                patch.object(event_handlers, 'emit') as mock_emit:
+            handler(data)
+        return manager, mock_emit
+
+    def test_prompt_over_budget_is_not_stored(self, budget, budget_game):
+        game = budget_game()
+        game.settings['custom_prompts'] = True
+        game.state = "prompt_selection"
+        budget.limit = budget.total + 100
+
+        _, mock_emit = self.run(event_handlers.handle_select_prompt, game, {'prompt': "x" * 200})
+        mock_emit.assert_called_once_with(
+            'error', {'message': 'The server is short on memory, please pick a shorter prompt'})
+        assert "p1" not in game.current.prompts
+
+    def test_new_player_over_budget_is_turned_away(self, budget, budget_game):
+        game = budget_game()
+        game.state = "lobby"
+        budget.limit = budget.total + 100
+
+        manager, mock_emit = self.run(event_handlers.handle_join_game, game,
+                                      {'game_id': game.game_id, 'username': "Newcomer"})
+        mock_emit.assert_called_once_with(
+            'error', {'message': 'The server is full, please try again later'})
+        manager.join_game.assert_not_called()
@@ -128,24 +128,19 @@ class TestMidGameJoining:
         # Add waiting player
         self.game.add_player("p4", "Player4")
         
-        # Initialize prompt readiness for active players
-        self.game.player_prompt_ready[1] = {
-            "host1": True,
-            "p1": True,
-            "p2": True,
-            "p3": False  # One active player not ready
-        }
+        # Every active player but p3 has picked a prompt
+        round_state = self.game.start_round(1)
+        for player_id in ("host1", "p1", "p2"):
+            round_state.select_prompt(player_id, f"{player_id}'s prompt")
         
         # Should not be ready (active player p3 not ready)
         assert not self.game.all_players_prompt_ready(1)
         
         # Mark last active player as ready
-        self.game.player_prompt_ready[1]["p3"] = True
-        assert self.game.all_players_prompt_ready(1)
+        round_state.select_prompt("p3", "p3's prompt")
         
-        # Waiting player readiness shouldn't matter
-        self.game.player_prompt_ready[1]["p4"] = False
-        assert self.game.all_players_prompt_ready(1)  # Still ready
+        # Waiting player p4 has not picked, which shouldn't matter
+        assert self.game.all_players_prompt_ready(1)
 
     def test_can_start_game_uses_active_count(self):
         """Test that game start uses active player count"""
@@ -26,29 +26,6 @@ class TestNoSelfBribe(unittest.TestCase):
                 self.assertNotIn(player_id, targets, 
                                 f"Player {player_id} was assigned to bribe themselves")
     
-    def test_balance_bribes_no_self_assignment(self):
-        """Test that the bribe balancing logic never assigns players to bribe themselves"""
-        # Create an unbalanced pairing situation that might trigger the rebalancing logic
-        player_ids = [f"player_{i}" for i in range(6)]
-        
-        # Create an intentionally unbalanced set of pairings
-        unbalanced_pairings = {
-            "player_0": ["player_1", "player_2"],
-            "player_1": ["player_0", "player_3"],
-            "player_2": ["player_0", "player_3"],  # player_3 gets 2 bribes
-            "player_3": ["player_0", "player_4"],
-            "player_4": ["player_1", "player_5"],
-            "player_5": ["player_1", "player_2"]
-        }
-        
-        # Call the balancing method directly
-        balanced_pairings = self.game._balance_bribes(unbalanced_pairings, player_ids)
-        
-        # Verify no player bribes themselves after balancing
-        for player_id, targets in balanced_pairings.items():
-            self.assertNotIn(player_id, targets,
-                            f"Player {player_id} was assigned to bribe themselves after balancing")
-
     def test_exhaustive_check_all_sizes(self):
         """Test with different player counts to ensure no self-bribes happen"""
         # Test with different numbers of players
@@ -31,9 +31,7 @@ class TestNoTimerModes:
         # Set up a round
         self.game.current_round = 1
         self.game.state = "lobby"
-        self.game.bribes[1] = {}
-        self.game.votes[1] = {}
-        self.game.round_pairings[1] = {
+        self.game.start_round(1).pairings = {
             "host123": ["player1", "player2"],
             "player1": ["player2", "player3"],
             "player2": ["player3", "host123"],
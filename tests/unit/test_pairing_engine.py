@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the linear-time pairing engine and its cached schedules
+"""
+
+import pytest
+
+from src.game.game import Game
+from src.game.pairing import PairingEngine, get_round_offsets
+
+
+def assert_valid_pairings(pairings, player_ids):
+    """Every player bribes exactly 2 others and receives exactly 2 bribes"""
+    assert set(pairings) == set(player_ids)
+    received = {pid: 0 for pid in player_ids}
+    for player_id, targets in pairings.items():
+        assert len(targets) == 2
+        assert len(set(targets)) == 2
+        assert player_id not in targets
+        for target in targets:
+            received[target] += 1
+    assert all(count == 2 for count in received.values())
+
+
+class TestPairingEngine:
+    """Test the ring-offset pairing engine"""
+
+    @pytest.mark.parametrize("player_count", [3, 4, 5, 7, 10, 64, 1000])
+    def test_valid_assignment_for_many_sizes(self, player_count):
+        """The 2-in/2-out, no-self-target rule holds at every lobby size"""
+        engine = PairingEngine()
+        player_ids = [f"p{i}" for i in range(player_count)]
+        past_targets = {}
+        for _ in range(5):
+            assert_valid_pairings(engine.generate(player_ids, past_targets, 5), player_ids)
+
+    def test_no_repeat_targets_in_stable_lobby(self):
+        """With a stable lobby no target repeats until all others were bribed"""
+        engine = PairingEngine()
+        player_ids = [f"p{i}" for i in range(9)]
+        past_targets = {}
+        seen = {pid: [] for pid in player_ids}
+        for _ in range(4):  # 4 rounds x 2 targets = all 8 other players
+            for player_id, targets in engine.generate(player_ids, past_targets, 4).items():
+                seen[player_id].extend(targets)
+        for player_id, targets in seen.items():
+            assert len(targets) == len(set(targets)) == 8
+
+    def test_lobby_changes_between_rounds(self):
+        """Players leaving and joining between rounds still get valid pairings"""
+        engine = PairingEngine()
+        past_targets = {}
+        player_ids = [f"p{i}" for i in range(8)]
+        assert_valid_pairings(engine.generate(player_ids, past_targets, 3), player_ids)
+
+        player_ids = player_ids[2:] + ["new1", "new2", "new3"]
+        assert_valid_pairings(engine.generate(player_ids, past_targets, 3), player_ids)
+
+    def test_fewer_than_three_players(self):
+        """No pairings can be made with fewer than 3 players"""
+        assert PairingEngine().generate(["a", "b"], {}, 3) == {}
+
+    def test_round_offsets_stay_on_the_ring(self):
+        """Each round's offsets are two distinct non-zero ring steps"""
+        for round_index in range(20):
+            first, second = get_round_offsets(12, round_index)
+            assert 0 < first < 12 and 0 < second < 12 and first != second
+
+    def test_game_uses_engine_and_records_history(self):
+        """Game.generate_round_pairings records targets in past_bribe_targets"""
+        game = Game("TEST", "p0", {'rounds': 3})
+        for i in range(6):
+            game.add_player(f"p{i}", f"Player {i}")
+
+        pairings = game.generate_round_pairings()
+        assert_valid_pairings(pairings, [f"p{i}" for i in range(6)])
+        for player_id, targets in pairings.items():
+            assert set(targets) <= game.past_bribe_targets[player_id]
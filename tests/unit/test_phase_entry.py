@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the single phase_entered message opening each phase
+"""
+
+import json
+
+import pytest
+from unittest.mock import patch
+
+from src.web.socket_handlers import game_flow
+
+
+@pytest.fixture
+def game(make_game):
+    game = make_game("PHAS", ["p1", "p2", "p3", "p4"],
+                     {'rounds': 3, 'results_time': 0, 'voting_time': 0,
+                      'submission_time': 0, 'custom_prompts': False}, round_num=1)
+    game.current.pairings = game.generate_round_pairings()
+    return game
+
+
+@pytest.fixture(autouse=True)
+def shared_prompt():
+    with patch.object(game_flow, 'load_prompts', return_value=["Shared prompt"]):
+        yield
+
+
+def raw_messages(mock_socketio):
+    """Get the phase_entered messages sent, keyed by room, as emitted"""
+    return {c[1]['room']: c[0][1] for c in mock_socketio.emit.call_args_list
+            if c[0][0] == 'phase_entered'}
+
+
+def messages(mock_socketio):
+    """Get the phase_entered messages sent, keyed by room, with the shared part decoded"""
+    return {room: {**entry, 'shared': json.loads(entry['shared'])}
+            for room, entry in raw_messages(mock_socketio).items()}
+
+
+class TestSubmissionEntry:
+    """Test the message that opens the submission phase"""
+
+    def test_one_message_per_player(self, game, mock_socketio):
+        game_flow.start_submission_phase(game)
+        events = [c[0][0] for c in mock_socketio.emit.call_args_list]
+        assert events == ['phase_entered'] * 4
+
+    def test_message_holds_round_targets_and_progress(self, game, mock_socketio):
+        game_flow.start_submission_phase(game)
+        sent = messages(mock_socketio)["p1"]
+        assert sent['shared']['phase'] == 'submission'
+        assert sent['shared']['round']['prompt'] == "Shared prompt"
+        assert sent['shared']['progress']['completed'] == 0
+        assert [t['id'] for t in sent['player']['targets']] == [
+            game.handle_of(pid) for pid in game.current.pairings["p1"]]
+
+    def test_shared_part_is_built_and_encoded_once(self, game, mock_socketio):
+        with patch.object(game_flow, 'build_phase_entry_shared',
+                          wraps=game_flow.build_phase_entry_shared) as build, \
+                patch.object(game_flow.json, 'dumps', wraps=json.dumps) as dumps:
+            game_flow.start_submission_phase(game)
+        build.assert_called_once()
+        dumps.assert_called_once()
+        shared = [entry['shared'] for entry in raw_messages(mock_socketio).values()]
+        assert len(shared) == 4 and all(part is shared[0] for part in shared)
+        assert isinstance(shared[0], str)
+
+    def test_disconnected_players_are_skipped(self, game, mock_socketio):
+        game.set_player_connected("p4", False)
+        game_flow.start_submission_phase(game)
+        assert "p4" not in messages(mock_socketio)
+
+    def test_entry_counts_as_first_progress(self, game, mock_socketio):
+        game_flow.start_submission_phase(game)
+        game_flow.emit_submission_progress(game)
+        events = [c[0][0] for c in mock_socketio.emit.call_args_list]
+        assert 'submission_progress' not in events
+
+
+class TestVotingEntry:
+    """Test the message that opens the voting phase"""
+
+    def test_ballot_and_prompt_per_player(self, game, mock_socketio):
+        game_flow.start_submission_phase(game)
+        mock_socketio.reset_mock()
+        game_flow.end_submission_phase(game, game.phase_generation)
+        sent = messages(mock_socketio)
+        assert set(sent) == {"p1", "p2", "p3", "p4"}
+        entry = sent["p2"]
+        assert entry['shared']['phase'] == 'voting'
+        assert entry['player']['bribes'] == game.current.ballots["p2"].to_payload()
+        assert entry['player']['player_prompt'] == "Shared prompt"
+
+    def test_reconnect_gets_entry_in_own_room(self, game, mock_socketio):
+        game_flow.start_submission_phase(game)
+        game_flow.end_submission_phase(game, game.phase_generation)
+        mock_socketio.reset_mock()
+        game_flow.emit_game_state_to_player(game, "p3")
+        assert list(messages(mock_socketio)) == ["p3"]
+        assert mock_socketio.emit.call_count == 1
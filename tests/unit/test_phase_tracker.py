@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the per-phase completion tracker
+"""
+
+import pytest
+
+from src.game.game import Game
+
+
+@pytest.fixture
+def game():
+    """A game in round 1 with four players and fixed pairings"""
+    game = Game("TEST", "p1", {"rounds": 1, "custom_prompts": True})
+    for pid in ("p1", "p2", "p3", "p4"):
+        game.add_player(pid, pid.upper())
+    game.state = "submission"
+    game.current_round = 1
+    round_state = game.start_round(1)
+    round_state.pairings = {
+        "p1": ["p2", "p3"],
+        "p2": ["p3", "p4"],
+        "p3": ["p4", "p1"],
+        "p4": ["p1", "p2"],
+    }
+    return game
+
+
+class TestSubmissionTracking:
+    """Submissions count once per assigned target"""
+
+    def test_counts_only_new_assigned_targets(self, game):
+        """Resubmitting or bribing a non-target does not count as progress"""
+        progress = game.track_phase("submission")
+        round_state = game.current
+        assert progress.outstanding == 8
+
+        round_state.add_submission("p1", "p2", {"content": "a"})
+        round_state.add_submission("p1", "p2", {"content": "again"})
+        round_state.add_submission("p1", "p4", {"content": "not my target"})
+        assert progress.outstanding == 7
+        assert progress.is_pending("p1")
+
+        round_state.add_submission("p1", "p3", {"content": "b"})
+        assert not progress.is_pending("p1")
+        assert progress.completed_count == 1
+        assert progress.total == 4
+
+    def test_complete_when_everyone_submits(self, game):
+        """The check flips once the last outstanding bribe arrives"""
+        progress = game.track_phase("submission")
+        for pid, targets in game.current.pairings.items():
+            for target_id in targets:
+                assert not progress.is_complete()
+                game.current.add_submission(pid, target_id, {"content": "x"})
+        assert progress.is_complete()
+        assert progress.outstanding == 0
+
+    def test_pending_players_in_join_order(self, game):
+        """Progress messages name the first players still working"""
+        progress = game.track_phase("submission")
+        for target_id in game.current.pairings["p1"]:
+            game.current.add_submission("p1", target_id, {"content": "x"})
+        assert progress.pending_players(2) == ["p2", "p3"]
+
+
+class TestPlayerChanges:
+    """Disconnects, reconnects and kicks adjust the counters"""
+
+    def test_disconnect_stops_waiting_for_player(self, game):
+        """A disconnected player no longer holds up the phase"""
+        progress = game.track_phase("voting")
+        for pid in ("p1", "p2", "p3"):
+            game.current.record_vote(pid, "x_" + pid)
+        assert not progress.is_complete()
+
+        game.set_player_connected("p4", False)
+        assert progress.is_complete()
+        assert progress.total == 3
+
+    def test_reconnect_resumes_outstanding_work(self, game):
+        """A player reconnecting mid-phase is expected to finish"""
+        progress = game.track_phase("submission")
+        game.set_player_connected("p2", False)
+        assert progress.outstanding == 6
+
+        game.current.add_submission("p2", "p3", {"content": "offline"})
+        game.set_player_connected("p2", True)
+        assert progress.outstanding == 7
+        assert progress.is_pending("p2")
+
+    def test_voter_who_disconnects_is_not_counted(self, game):
+        """Completed players leave the total when they disconnect"""
+        progress = game.track_phase("voting")
+        game.current.record_vote("p1", "p2_p1")
+        game.set_player_connected("p1", False)
+        assert progress.completed_count == 0
+        assert progress.total == 3
+
+    def test_kick_removes_player_from_tracking(self, game):
+        """Removing a player drops their outstanding work"""
+        progress = game.track_phase("prompt_selection")
+        for pid in ("p1", "p2", "p3"):
+            game.current.select_prompt(pid, "prompt")
+        game.remove_player("p4")
+        assert progress.is_complete()
+        assert game.all_players_prompt_ready(1)
+
+    def test_waiting_players_are_not_tracked(self, game):
+        """Mid-game joiners waiting for the next round owe nothing"""
+        progress = game.track_phase("prompt_selection")
+        game.add_player("p5", "P5")
+        assert progress.total == 4
+        assert not progress.is_pending("p5")
+
+
+class TestPhaseStart:
+    """Trackers pick up work already recorded when a phase begins"""
+
+    def test_existing_votes_are_counted(self, game):
+        """Votes recorded before tracking started still count"""
+        game.current.record_vote("p1", "p2_p1")
+        progress = game.get_phase_tracker("voting")
+        assert progress.completed_count == 1
+        assert game.get_phase_tracker("voting") is progress
+
+    def test_new_phase_replaces_tracker(self, game):
+        """Each phase gets a fresh tracker"""
+        submission = game.track_phase("submission")
+        voting = game.track_phase("voting")
+        assert voting is not submission
+        assert game.current.tracker_for("submission") is None
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for phase generation tokens keeping transitions idempotent
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.web.socket_handlers import game_flow, progress_tracking
+
+
+@pytest.fixture
+def game(make_game):
+    game = make_game(settings={'rounds': 3, 'results_time': 0, 'voting_time': 0,
+                               'submission_time': 0, 'custom_prompts': False}, round_num=1)
+    game.state = "voting"
+    return game
+
+
+class TestAdvancePhase:
+    """Test the phase generation counter on Game"""
+
+    def test_advance_without_token_always_moves_on(self, game):
+        start = game.phase_generation
+        assert game.advance_phase()
+        assert game.advance_phase()
+        assert game.phase_generation == start + 2
+
+    def test_stale_token_is_rejected(self, game):
+        token = game.phase_generation
+        assert game.advance_phase(token)
+        assert not game.advance_phase(token)
+        assert game.phase_generation == token + 1
+
+    def test_advance_cancels_pending_timer(self, game):
+        timer = MagicMock()
+        game.round_timer = timer
+        game.advance_phase()
+        timer.cancel.assert_called_once()
+        assert game.round_timer is None
+
+    def test_reset_to_lobby_invalidates_tokens(self, game):
+        token = game.phase_generation
+        game.reset_to_lobby()
+        assert not game.advance_phase(token)
+
+
+class TestIdempotentTransitions:
+    """Test that duplicate or late transitions change nothing"""
+
+    def run_flow(self, command, *args):
+        mock_socketio = MagicMock()
+        with patch.object(game_flow, 'socketio', mock_socketio), \
+                patch.object(progress_tracking, 'socketio', mock_socketio), \
+                patch.object(game_flow, 'game_manager', MagicMock()):
+            command(*args)
+        return mock_socketio
+
+    def test_duplicate_end_voting_counts_scores_once(self, game):
+        round_state = game.current
+        round_state.add_submission("p2", "p1", {"content": "a", "type": "text", "is_random": False})
+        submitter_id, target_id, points = game.credit_for_vote(round_state, "p2_p1", "p1")
+        round_state.record_vote("p1", "p2_p1", submitter_id, target_id, points)
+
+        token = game.phase_generation
+        first = self.run_flow(game_flow.end_voting_phase, game, token)
+        second = self.run_flow(game_flow.end_voting_phase, game, token)
+
+        assert game.scores["p2"] == 1
+        assert game.state == "scoreboard"
+        assert first.emit.called
+        second.emit.assert_not_called()
+
+    def test_late_timer_after_host_advanced_is_ignored(self, game):
+        game.state = "scoreboard"
+        timer_token = game.phase_generation
+
+        # The host moves on before the results timer fires
+        self.run_flow(game_flow.continue_or_end_game, game, game.phase_generation)
+        assert game.current_round == 2
+        state, generation = game.state, game.phase_generation
+
+        late = self.run_flow(game_flow.run_game_command, game,
+                             game_flow.continue_or_end_game, timer_token)
+        assert game.current_round == 2
+        assert (game.state, game.phase_generation) == (state, generation)
+        late.emit.assert_not_called()
+
+    def test_results_timer_is_stored(self, game):
+        game.settings['results_time'] = 60
+        try:
+            self.run_flow(game_flow.end_voting_phase, game)
+            assert game.round_timer is not None
+        finally:
+            game.cleanup()
+
+
+@pytest.mark.usefixtures('mock_socketio')
+class TestPlayerLeavingEndsPhase:
+    """Test that losing the last pending player finishes the phase"""
+
+    def run_check(self, game):
+        game_flow.check_phase_complete(game)
+
+    def test_kick_of_last_pending_voter_ends_voting(self, game):
+        game.track_phase("voting")
+        for pid in ("p1", "p2"):
+            game.current.record_vote(pid, "x_" + pid)
+        game.remove_player("p3")
+        self.run_check(game)
+        assert game.state == "scoreboard"
+
+    def test_disconnect_of_last_pending_voter_ends_voting(self, game):
+        game.track_phase("voting")
+        for pid in ("p1", "p2"):
+            game.current.record_vote(pid, "x_" + pid)
+        game.set_player_connected("p3", False)
+        self.run_check(game)
+        assert game.state == "scoreboard"
+
+    def run_disconnect(self, game, has_other_sessions):
+        from src.web.socket_handlers import event_handlers
+
+        manager = MagicMock()
+        manager.get_player_session.return_value = MagicMock(player_id="p3", game_id="TEST")
+        manager.get_game.return_value = game
+        manager.has_other_sessions.return_value = has_other_sessions
+        with patch.object(event_handlers, 'game_manager', manager), \
+                patch.object(event_handlers, 'request', MagicMock(sid="sid3")), \
+                patch.object(event_handlers, 'emit_lobby_update'):
+            event_handlers.handle_disconnect()
+        manager.remove_player_session.assert_called_once_with("sid3")
+
+    def test_last_session_disconnecting_ends_voting(self, game):
+        game.track_phase("voting")
+        for pid in ("p1", "p2"):
+            game.current.record_vote(pid, "x_" + pid)
+        self.run_disconnect(game, has_other_sessions=False)
+        assert not game.players["p3"].connected
+        assert game.state == "scoreboard"
+
+    def test_duplicate_tab_closing_leaves_player_connected(self, game):
+        game.track_phase("voting")
+        for pid in ("p1", "p2"):
+            game.current.record_vote(pid, "x_" + pid)
+        self.run_disconnect(game, has_other_sessions=True)
+        assert game.players["p3"].connected
+        assert game.state == "voting"
+
+    def test_phase_still_owed_is_left_running(self, game):
+        game.track_phase("voting")
+        game.current.record_vote("p1", "x_p1")
+        game.set_player_connected("p3", False)
+        self.run_check(game)
+        assert game.state == "voting"
+
+    def test_phase_with_nobody_connected_waits(self, game):
+        game.track_phase("voting")
+        for pid in ("p1", "p2", "p3"):
+            game.set_player_connected(pid, False)
+        self.run_check(game)
+        assert game.state == "voting"
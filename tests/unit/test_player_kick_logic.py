@@ -79,13 +79,12 @@ class TestPlayerKickLogic:
         # Set up an active round
         self.game.current_round = 1
         self.game.state = "submission"
-        self.game.round_pairings[1] = self.game.generate_round_pairings()
-        self.game.bribes[1] = {}
+        self.game.start_round(1).pairings = self.game.generate_round_pairings()
         
         # Record the initial pairings
         initial_pairings = {}
         for player_id, targets in self.game.round_pairings[1].items():
-            initial_pairings[player_id] = targets.copy()
+            initial_pairings[player_id] = list(targets)
         
         # Remove a player
         player_to_remove = "player1"
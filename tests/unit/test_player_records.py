@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for slotted player records and the running player counters
+"""
+
+import pytest
+
+from src.game.game import Game
+from src.game.player import Player
+from src.game.player_session import PlayerSession
+
+
+class TestPlayerRecords:
+    """Test the compact Player and PlayerSession records"""
+
+    def setup_method(self):
+        self.game = Game("TEST", "host", {'rounds': 3, 'submission_time': 0, 'voting_time': 0})
+        for pid in ["host", "p1", "p2", "p3"]:
+            self.game.add_player(pid, pid.upper())
+
+    def test_records_are_slotted(self):
+        """Player and session records should not carry a per-instance __dict__"""
+        assert not hasattr(self.game.players["p1"], '__dict__')
+        assert not hasattr(PlayerSession("sid", "p1", "TEST"), '__dict__')
+
+    def test_dict_style_access_still_works(self):
+        """Existing callers use item access on player records"""
+        player = self.game.players["p1"]
+        assert player["username"] == "P1"
+        assert player.get("active_in_round") is True
+        assert player.get("unknown", "default") == "default"
+        with pytest.raises(KeyError):
+            player["unknown"]
+
+    def test_counters_follow_connect_and_disconnect(self):
+        """Connected and active counts update when a player's flags change"""
+        assert self.game.get_connected_player_count() == 4
+        assert self.game.get_active_player_count() == 4
+
+        self.game.set_player_connected("p1", False)
+        assert self.game.get_connected_player_count() == 3
+        assert self.game.get_active_player_count() == 3
+
+        # Setting the same value twice must not double count
+        self.game.players["p1"]["connected"] = False
+        assert self.game.get_connected_player_count() == 3
+
+        self.game.set_player_connected("p1", True)
+        assert self.game.get_connected_player_count() == 4
+        assert self.game.get_active_player_count() == 4
+
+    def test_counters_follow_kick(self):
+        """Removing a player takes them out of both counters"""
+        self.game.remove_player("p2")
+        assert self.game.get_connected_player_count() == 3
+        assert self.game.get_active_player_count() == 3
+
+        # A disconnected player only counted towards neither total
+        self.game.set_player_connected("p3", False)
+        self.game.remove_player("p3")
+        assert self.game.get_connected_player_count() == 2
+        assert self.game.get_active_player_count() == 2
+
+    def test_counters_follow_midgame_activation(self):
+        """Mid-game joiners are connected but only become active on activation"""
+        self.game.state = "submission"
+        self.game.add_player("late", "Late")
+        assert self.game.get_connected_player_count() == 5
+        assert self.game.get_active_player_count() == 4
+
+        assert self.game.activate_waiting_players() == 1
+        assert self.game.get_active_player_count() == 5
+
+    def test_counters_match_full_scan(self):
+        """The running totals always agree with a full scan of the players"""
+        self.game.state = "voting"
+        self.game.add_player("late", "Late")
+        self.game.set_player_connected("p1", False)
+        self.game.players["p2"].active_in_round = False
+        self.game.remove_player("p3")
+
+        players = self.game.players.values()
+        assert self.game.get_connected_player_count() == sum(p.connected for p in players)
+        assert self.game.get_active_player_count() == sum(p.is_active for p in players)
+
+    def test_detached_player_does_not_touch_counters(self):
+        """A standalone record can be modified without an owning game"""
+        player = Player("solo", "Solo")
+        player.connected = False
+        assert player.is_active is False
+
+
+class TestActivePlayerIndex:
+    """Test the maintained, ordered index of active player IDs"""
+
+    def setup_method(self):
+        self.game = Game("TEST", "host", {'rounds': 3, 'submission_time': 0, 'voting_time': 0})
+        for pid in ["host", "p1", "p2", "p3"]:
+            self.game.add_player(pid, pid.upper())
+
+    def test_index_tracks_join_disconnect_kick_and_activation(self):
+        """Every path that changes a player's status updates the index"""
+        active = self.game.get_active_player_ids()
+        assert active == ["host", "p1", "p2", "p3"]
+
+        self.game.set_player_connected("p1", False)
+        assert "p1" not in active
+        assert not self.game.is_player_active("p1")
+
+        self.game.remove_player("p2")
+        assert active == ["host", "p3"]
+
+        self.game.state = "submission"
+        self.game.add_player("late", "Late")
+        assert "late" not in active
+        self.game.activate_waiting_players()
+        assert active == ["host", "p3", "late"]
+        assert len(active) == self.game.get_active_player_count()
+
+    def test_view_is_read_only(self):
+        """Callers get a view they cannot use to mutate the index"""
+        active = self.game.get_active_player_ids()
+        assert not hasattr(active, 'append')
+        assert not hasattr(active, 'add')
+        with pytest.raises(AttributeError):
+            active.extra = True
+
+    def test_iteration_survives_concurrent_changes(self):
+        """Iterating while players disconnect must not raise"""
+        seen = []
+        for pid in self.game.get_active_player_ids():
+            seen.append(pid)
+            self.game.set_player_connected("p3", False)
+        assert seen == ["host", "p1", "p2", "p3"]
+        assert self.game.get_active_player_ids() == ["host", "p1", "p2"]
+
+    def test_copy_returns_plain_list(self):
+        """copy() gives a snapshot list that is independent of the index"""
+        snapshot = self.game.get_active_player_ids().copy()
+        self.game.set_player_connected("host", False)
+        assert snapshot == ["host", "p1", "p2", "p3"]
+
+
+class TestUsernameIndex:
+    """Test the casefolded username index used for rejoining"""
+
+    def setup_method(self):
+        self.game = Game("TEST", "p1", {})
+        self.game.add_player("p1", "Alice")
+        self.game.add_player("p2", "Bob")
+
+    def test_lookup_ignores_case_and_spacing(self):
+        assert self.game.find_player_by_username("ALICE") == "p1"
+        assert self.game.find_player_by_username(" bob ") == "p2"
+        assert self.game.find_player_by_username("carol") is None
+
+    def test_rename_moves_entry(self):
+        """Renaming in the stored-ID rejoin path updates the index"""
+        self.game.players["p1"].username = "Alicia"
+        assert self.game.find_player_by_username("alice") is None
+        assert self.game.find_player_by_username("ALICIA") == "p1"
+
+        self.game.players["p2"]["username"] = "Robert"
+        assert self.game.find_player_by_username("robert") == "p2"
+
+    def test_kick_removes_entry(self):
+        self.game.remove_player("p2")
+        assert self.game.find_player_by_username("bob") is None
+
+    def test_duplicate_names_resolve_to_earliest(self):
+        """If two players share a name, the one who joined first wins until they leave"""
+        self.game.add_player("p3", "alice")
+        assert self.game.find_player_by_username("Alice") == "p1"
+        self.game.remove_player("p1")
+        assert self.game.find_player_by_username("Alice") == "p3"
+
+    def test_re_adding_player_id_replaces_record(self):
+        self.game.add_player("p2", "Bobby")
+        assert self.game.find_player_by_username("bob") is None
+        assert self.game.find_player_by_username("bobby") == "p2"
+        assert self.game.get_connected_player_count() == 2
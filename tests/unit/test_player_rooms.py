@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for per-player Socket.IO rooms
+"""
+
+import os
+import sys
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.game.game import Game
+from src.game.game_manager import GameManager
+from src.game.player_session import PlayerSession
+from src.web.socket_handlers import event_handlers, game_flow
+from src.web.utils import get_player_room
+
+# The socket handlers import the game package as a top-level module
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'src'))
+
+
+@pytest.fixture
+def manager():
+    return GameManager()
+
+
+def call_handler(handler, manager, sid, *args):
+    """Run an event handler as if sent from socket sid, returning joined rooms and emits"""
+    joined = []
+    with patch.object(event_handlers, 'game_manager', manager), \
+            patch.object(event_handlers, 'request', MagicMock(sid=sid)), \
+            patch.object(event_handlers, 'join_room', joined.append), \
+            patch.object(event_handlers, 'emit') as mock_emit, \
+            patch.object(event_handlers, 'emit_lobby_update'):
+        handler(*args)
+    return joined, mock_emit
+
+
+class TestPlayerRooms:
+    """Sockets join a room named after their player ID"""
+
+    def test_room_is_player_id(self):
+        assert get_player_room("abc-123") == "abc-123"
+
+    def test_create_and_join_enter_player_room(self, manager):
+        joined, mock_emit = call_handler(
+            event_handlers.handle_create_game, manager, "s1", {'username': 'Host'})
+        created = mock_emit.call_args_list[0][0][1]
+        assert joined == [created['game_id'], created['player_id']]
+
+        joined, mock_emit = call_handler(
+            event_handlers.handle_join_game, manager, "s2",
+            {'game_id': created['game_id'], 'username': 'Guest'})
+        player_id = mock_emit.call_args_list[0][0][1]['player_id']
+        assert joined == [created['game_id'], player_id]
+
+    def test_kick_notifies_player_room(self, manager):
+        game = Game("ABCD", "host", {'rounds': 1})
+        game.add_player("host", "Host")
+        game.add_player("p2", "Two")
+        manager.add_game(game)
+        manager.add_player_session("s1", PlayerSession("s1", "host", "ABCD"))
+
+        mock_socketio = MagicMock()
+        with patch.object(event_handlers, 'socketio', mock_socketio):
+            call_handler(event_handlers.handle_kick_player, manager, "s1",
+                         {'player_id': 'p2', 'game_id': 'ABCD'})
+
+        kicked = [c for c in mock_socketio.emit.call_args_list if c[0][0] == 'kicked_from_game']
+        assert kicked[0][1]['room'] == "p2"
+        assert "p2" not in game.players
+
+    def test_host_controls_sent_to_host_room(self):
+        game = Game("ABCD", "host", {'rounds': 2, 'results_time': 0})
+        for pid in ("host", "p2", "p3"):
+            game.add_player(pid, pid.upper())
+        game.current_round = 1
+        game.start_round(1)
+
+        mock_socketio = MagicMock()
+        with patch.object(game_flow, 'socketio', mock_socketio):
+            game_flow.end_voting_phase(game)
+
+        rooms = {c[0][0]: c[1]['room'] for c in mock_socketio.emit.call_args_list}
+        assert rooms['host_controls_next_round'] == "host"
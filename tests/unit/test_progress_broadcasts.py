@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for coalesced progress broadcasts
+"""
+
+import pytest
+
+from src.game.scheduler import VirtualScheduler
+from src.web.socket_handlers.progress_tracking import (PROGRESS_WINDOW, emit_submission_progress,
+                                                       emit_voting_progress)
+
+
+@pytest.fixture
+def virtual():
+    return VirtualScheduler()
+
+
+@pytest.fixture
+def game(make_game, virtual):
+    game = make_game("PROG", [f"p{i}" for i in range(1, 7)], round_num=1,
+                     scheduler=virtual, clock=virtual.clock)
+    game.state = "voting"
+    game.advance_phase()
+    game.track_phase("voting")
+    return game
+
+
+def vote(game, voter_id):
+    game.current.record_vote(voter_id, "x_y")
+
+
+def sent(mock_socketio, event='voting_progress'):
+    return [c[0][1] for c in mock_socketio.emit.call_args_list if c[0][0] == event]
+
+
+class TestCoalescing:
+    """Test that rapid progress changes become one broadcast per window"""
+
+    def test_first_update_is_immediate(self, game, mock_socketio):
+        emit_voting_progress(game)
+        assert [p['completed'] for p in sent(mock_socketio)] == [0]
+
+    def test_burst_is_merged_into_latest_state(self, game, virtual, mock_socketio):
+        emit_voting_progress(game)
+        for voter_id in ["p1", "p2", "p3"]:
+            vote(game, voter_id)
+            emit_voting_progress(game)
+        assert len(sent(mock_socketio)) == 1
+
+        virtual.advance(PROGRESS_WINDOW)
+        assert [p['completed'] for p in sent(mock_socketio)] == [0, 3]
+
+    def test_unchanged_state_is_not_sent(self, game, virtual, mock_socketio):
+        emit_voting_progress(game)
+        virtual.advance(PROGRESS_WINDOW * 2)
+        emit_voting_progress(game)
+        emit_voting_progress(game)
+        assert len(sent(mock_socketio)) == 1
+
+    def test_final_state_is_sent_immediately(self, game, virtual, mock_socketio):
+        emit_voting_progress(game)
+        vote(game, "p1")
+        emit_voting_progress(game)
+        for voter_id in ["p2", "p3", "p4", "p5", "p6"]:
+            vote(game, voter_id)
+        emit_voting_progress(game)
+
+        payloads = sent(mock_socketio)
+        assert [p['completed'] for p in payloads] == [0, 6]
+        # The merged update that was waiting is dropped
+        virtual.run_until_idle()
+        assert len(sent(mock_socketio)) == 2
+
+    def test_waiting_update_dropped_when_phase_ends(self, game, virtual, mock_socketio):
+        emit_voting_progress(game)
+        vote(game, "p1")
+        emit_voting_progress(game)
+        game.advance_phase()
+        virtual.run_until_idle()
+        assert len(sent(mock_socketio)) == 1
+
+    def test_new_phase_is_not_held_back(self, game, mock_socketio):
+        emit_voting_progress(game)
+        game.state = "submission"
+        game.advance_phase()
+        game.track_phase("submission")
+        emit_submission_progress(game)
+        assert len(sent(mock_socketio, 'submission_progress')) == 1
+
+    def test_single_room_updates_are_not_coalesced(self, game, mock_socketio):
+        emit_voting_progress(game)
+        emit_voting_progress(game, "p2")
+        emit_voting_progress(game, "p2")
+        rooms = [c[1]['room'] for c in mock_socketio.emit.call_args_list]
+        assert rooms == ["PROG", "p2", "p2"]
+
+    def test_cleanup_drops_waiting_update(self, game, virtual, mock_socketio):
+        emit_voting_progress(game)
+        vote(game, "p1")
+        emit_voting_progress(game)
+        assert game.progress_coalescer.pending is not None
+
+        game.cleanup()
+        virtual.advance(PROGRESS_WINDOW)
+        assert len(sent(mock_socketio)) == 1
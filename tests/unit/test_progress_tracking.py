@@ -28,17 +28,15 @@ class TestProgressTracking:
         
         # Start round
         game.current_round = 1
-        game.bribes = {1: {}}
+        round_state = game.start_round(1)
         
         # Initially no submissions
         active_players = game.get_active_player_ids()
         assert len(active_players) == 4
         
         # Player 1 submits both bribes
-        game.bribes[1]["player1"] = {
-            "player2": {"content": "bribe1", "type": "text"},
-            "player3": {"content": "bribe2", "type": "text"}
-        }
+        round_state.add_submission("player1", "player2", {"content": "bribe1", "type": "text"})
+        round_state.add_submission("player1", "player3", {"content": "bribe2", "type": "text"})
         
         # Should have 1/4 completed
         completed_count = sum(1 for player_id in active_players 
@@ -46,10 +44,8 @@ class TestProgressTracking:
         assert completed_count == 1
         
         # Player 2 submits both bribes
-        game.bribes[1]["player2"] = {
-            "player1": {"content": "bribe3", "type": "text"},
-            "player4": {"content": "bribe4", "type": "text"}
-        }
+        round_state.add_submission("player2", "player1", {"content": "bribe3", "type": "text"})
+        round_state.add_submission("player2", "player4", {"content": "bribe4", "type": "text"})
         
         # Should have 2/4 completed
         completed_count = sum(1 for player_id in active_players 
@@ -67,7 +63,7 @@ class TestProgressTracking:
         
         # Start round
         game.current_round = 1
-        game.votes = {1: {}}
+        round_state = game.start_round(1)
         
         # Initially no votes
         active_players = game.get_active_player_ids()
@@ -75,17 +71,17 @@ class TestProgressTracking:
         assert votes_submitted == 0
         
         # Player 1 votes
-        game.votes[1]["player1"] = "bribe_id_1"
+        round_state.record_vote("player1", "bribe_id_1")
         votes_submitted = len(game.votes[1])
         assert votes_submitted == 1
         
         # Player 2 votes
-        game.votes[1]["player2"] = "bribe_id_2"
+        round_state.record_vote("player2", "bribe_id_2")
         votes_submitted = len(game.votes[1])
         assert votes_submitted == 2
         
         # All players voted
-        game.votes[1]["player3"] = "bribe_id_3"
+        round_state.record_vote("player3", "bribe_id_3")
         votes_submitted = len(game.votes[1])
         assert votes_submitted == 3
         assert votes_submitted == len(active_players)
@@ -127,10 +123,11 @@ class TestProgressTracking:
         
         # Progress calculation should use active count
         game.current_round = 1
-        game.bribes = {1: {
-            "player1": {"p2": {"content": "b1", "type": "text"}, "p3": {"content": "b2", "type": "text"}},
-            "player2": {"p1": {"content": "b3", "type": "text"}, "p3": {"content": "b4", "type": "text"}}
-        }}
+        round_state = game.start_round(1)
+        round_state.add_submission("player1", "p2", {"content": "b1", "type": "text"})
+        round_state.add_submission("player1", "p3", {"content": "b2", "type": "text"})
+        round_state.add_submission("player2", "p1", {"content": "b3", "type": "text"})
+        round_state.add_submission("player2", "p3", {"content": "b4", "type": "text"})
         
         # 2 out of 3 active players completed
         completed_count = sum(1 for player_id in active_players 
@@ -138,7 +135,8 @@ class TestProgressTracking:
         assert completed_count == 2
         
         # Even if inactive player submits, they don't count
-        game.bribes[1]["player4"] = {"p1": {"content": "b5", "type": "text"}, "p2": {"content": "b6", "type": "text"}}
+        round_state.add_submission("player4", "p1", {"content": "b5", "type": "text"})
+        round_state.add_submission("player4", "p2", {"content": "b6", "type": "text"})
         completed_count = sum(1 for player_id in active_players 
                             if len(game.bribes[1].get(player_id, {})) >= 2)
         assert completed_count == 2  # Still 2, not 3
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the round retention policy
+"""
+
+import os
+
+from src.game.game import Game
+from src.game.retention import DEFAULT_HOT_ROUNDS, RetentionPolicy
+
+
+def play_rounds(game, count):
+    """Record a bribe, a vote and results for each of count rounds"""
+    for round_num in range(1, count + 1):
+        game.current_round = round_num
+        round_state = game.start_round(round_num)
+        round_state.pairings = {"p2": ["p1", "p3"]}
+        round_state.add_submission("p2", "p1", {"content": f"bribe {round_num}", "type": "text"})
+        round_state.record_vote("p1", "p2_p1", "p2", "p1", 1)
+        round_state.freeze_results({'round': round_num})
+
+
+def make_game(policy):
+    game = Game("TEST", "p1", {'rounds': 10}, retention=policy)
+    for pid in ["p1", "p2", "p3"]:
+        game.add_player(pid, pid.upper())
+    return game
+
+
+class TestCompaction:
+    """Rounds outside the hot window lose their bribe content"""
+
+    def test_keeps_last_rounds_hot(self):
+        """Only rounds older than the window are compacted"""
+        game = make_game(RetentionPolicy(hot_rounds=2))
+        play_rounds(game, 4)
+
+        compacted = [rs.round_num for rs in game.past_rounds if rs.compacted]
+        assert compacted == [1, 2]
+        assert game.bribes[3]["p2"]["p1"]["content"] == "bribe 3"
+
+    def test_compacted_round_keeps_winners(self):
+        """Votes, points and pairings survive compaction"""
+        game = make_game(RetentionPolicy(hot_rounds=1))
+        play_rounds(game, 2)
+
+        old = game.past_rounds[0]
+        assert old.compacted
+        assert old.submissions == {}
+        assert old.bribes_for("p1") == {}
+        assert old.results is None
+        assert old.vote_credit == {"p1": ("p2", "p1", 1)}
+        assert old.tally == {"p2": 1}
+        assert old.pairings == {"p2": ["p1", "p3"]}
+
+    def test_hot_rounds_has_a_floor_of_one(self):
+        """The current round is never compacted"""
+        assert RetentionPolicy(hot_rounds=0).hot_rounds == 1
+
+
+class TestSpill:
+    """Compacted rounds can be spilled to disk and loaded back lazily"""
+
+    def test_spilled_round_loads_on_lookup(self, tmp_path):
+        """Looking a spilled round up restores its bribes and results"""
+        game = make_game(RetentionPolicy(hot_rounds=1, spill_dir=str(tmp_path)))
+        play_rounds(game, 3)
+
+        old = game.past_rounds[0]
+        assert old.compacted and os.path.exists(old.segment)
+        assert old.submissions == {}
+
+        assert game.get_round_results(1) == {'round': 1}
+        loaded = game.get_round(1)
+        assert loaded is not old and not loaded.compacted
+        assert loaded.bribes_for("p1")["p2"]["content"] == "bribe 1"
+        assert loaded.vote_credit == {"p1": ("p2", "p1", 1)}
+
+    def test_lookup_leaves_round_compacted(self, tmp_path):
+        """Reading every past round keeps resident memory bounded"""
+        game = make_game(RetentionPolicy(hot_rounds=1, spill_dir=str(tmp_path)))
+        play_rounds(game, 3)
+        before = game.get_memory_usage()
+
+        assert game.bribes[1]["p2"]["p1"]["content"] == "bribe 1"
+        repr(game.bribes)
+        assert [rs.compacted for rs in game.past_rounds] == [True, True]
+        assert game.past_rounds[0].submissions == {}
+        assert game.get_memory_usage() == before
+
+    def test_cleanup_deletes_segments(self, tmp_path):
+        """Segment files do not outlive their game"""
+        game = make_game(RetentionPolicy(hot_rounds=1, spill_dir=str(tmp_path)))
+        play_rounds(game, 3)
+        assert len(os.listdir(tmp_path)) == 2
+
+        game.reset_to_lobby()
+        assert os.listdir(tmp_path) == []
+
+
+class TestConfiguration:
+    """The default policy comes from the environment"""
+
+    def test_from_env(self, monkeypatch, tmp_path):
+        monkeypatch.setenv('HOT_ROUNDS', '5')
+        monkeypatch.setenv('ROUND_SPILL_DIR', str(tmp_path))
+        policy = RetentionPolicy.from_env()
+        assert policy.hot_rounds == 5
+        assert policy.spill_dir == str(tmp_path)
+
+    def test_invalid_env_uses_default(self, monkeypatch):
+        monkeypatch.setenv('HOT_ROUNDS', 'lots')
+        monkeypatch.delenv('ROUND_SPILL_DIR', raising=False)
+        policy = RetentionPolicy.from_env()
+        assert policy.hot_rounds == DEFAULT_HOT_ROUNDS
+        assert policy.spill_dir is None
@@ -34,20 +34,21 @@ class TestReturnToLobby:
         # Simulate game completion
         game.state = "finished"
         game.current_round = 2
-        game.bribes = {1: {"host1": ["bribe1", "bribe2"]}, 2: {"p1": ["bribe3", "bribe4"]}}
-        game.votes = {1: {"p1": "host1", "p2": "host1"}, 2: {"host1": "p1"}}
+        first = game.start_round(1)
+        first.pairings = {"host1": ["p1", "p2"]}
+        first.add_submission("host1", "p1", {"content": "bribe1", "type": "text"})
+        first.add_submission("host1", "p2", {"content": "bribe2", "type": "text"})
+        game.record_vote(first, "p1", "host1_p1")
+        game.record_vote(first, "p2", "host1_p2")
+        second = game.start_round(2)
+        second.add_submission("p1", "host1", {"content": "bribe3", "type": "text"})
+        second.add_submission("p1", "p2", {"content": "bribe4", "type": "text"})
+        game.record_vote(second, "host1", "p1_host1")
         game.scores = {"host1": 2, "p1": 1, "p2": 0}
         game.current_prompt = "Some old prompt"
-        game.round_pairings = {1: {"host1": ["p1", "p2"]}}
         
-        # Now simulate return to lobby
-        game.state = "lobby"
-        game.current_round = 0
-        game.bribes = {}
-        game.votes = {}
-        game.scores = {pid: 0 for pid in game.players}
-        game.current_prompt = ""
-        game.round_pairings = {}
+        # Now return to lobby
+        game.reset_to_lobby()
         
         # Verify state reset
         assert game.state == "lobby"
@@ -86,11 +87,7 @@ class TestReturnToLobby:
         game.state = "finished"
         
         # Return to lobby - should preserve all player data
-        game.state = "lobby"
-        game.current_round = 0
-        game.bribes = {}
-        game.votes = {}
-        game.scores = {pid: 0 for pid in game.players}
+        game.reset_to_lobby()
         
         # Verify players preserved including connection states
         assert len(game.players) == 3
@@ -117,11 +114,7 @@ class TestReturnToLobby:
         game.state = "finished"
         
         # Return to lobby
-        game.state = "lobby"
-        game.current_round = 0
-        game.bribes = {}
-        game.votes = {}
-        game.scores = {pid: 0 for pid in game.players}
+        game.reset_to_lobby()
         
         # Verify settings preserved
         assert game.settings['rounds'] == 5
@@ -143,11 +136,7 @@ class TestReturnToLobby:
         game.add_player("p2", "Player2")
         
         # Return to lobby state
-        game.state = "lobby"
-        game.current_round = 0
-        game.bribes = {}
-        game.votes = {}
-        game.scores = {pid: 0 for pid in game.players}
+        game.reset_to_lobby()
         
         # Should be able to start again
         assert game.can_start_game()
@@ -176,11 +165,7 @@ class TestReturnToLobby:
         
         # Simulate return to lobby (preserves settings)
         original_settings = game1.settings.copy()
-        game1.state = "lobby"
-        game1.current_round = 0
-        game1.bribes = {}
-        game1.votes = {}
-        game1.scores = {pid: 0 for pid in game1.players}
+        game1.reset_to_lobby()
         
         # Verify settings preserved
         assert game1.settings == original_settings
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for per-round state consolidated in RoundState
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.game.game import Game
+from src.game.round_state import RoundState
+
+
+class TestRoundState:
+    """Test RoundState storage and the legacy per-round mappings on Game"""
+
+    def setup_method(self):
+        self.game = Game("TEST", "host", {'rounds': 3, 'submission_time': 0, 'voting_time': 0})
+        for pid in ["host", "p1", "p2"]:
+            self.game.add_player(pid, pid.upper())
+
+    def test_round_state_is_slotted(self):
+        """RoundState should not carry a per-instance __dict__"""
+        assert not hasattr(RoundState(1), '__dict__')
+
+    def test_start_round_archives_previous_round(self):
+        """Starting a round makes it current and keeps the old one in past_rounds"""
+        first = self.game.start_round(1)
+        first.votes["p1"] = "p2_p1"
+        second = self.game.start_round(2)
+
+        assert self.game.current is second
+        assert self.game.past_rounds == [first]
+        assert self.game.get_round(1) is first
+        assert self.game.votes[1] == {"p1": "p2_p1"}
+        assert self.game.votes[2] == {}
+
+    def test_legacy_mappings_read_round_state(self):
+        """The old dict attributes show what was written through RoundState"""
+        round_state = self.game.start_round(1)
+        round_state.add_submission("p1", "p2", {"content": "bribe", "type": "text"})
+        round_state.select_prompt("p2", "A haiku")
+
+        assert self.game.bribes[1]["p1"]["p2"]["content"] == "bribe"
+        assert self.game.player_prompts == {1: {"p2": "A haiku"}}
+        assert self.game.player_prompt_ready[1]["p2"] is True
+
+    def test_legacy_mappings_are_read_only(self):
+        """Writes must go through RoundState so the inbox, tally and meter stay in step"""
+        round_state = self.game.start_round(1)
+        round_state.add_submission("p1", "p2", {"content": "bribe", "type": "text"})
+        round_state.pairings = {"p1": ["p2"]}
+        round_state.voted_players.add("p1")
+
+        with pytest.raises(TypeError):
+            self.game.bribes[1] = {}
+        with pytest.raises(TypeError):
+            self.game.bribes[1]["p1"]["p2"] = {"content": "sneaky", "type": "text"}
+        with pytest.raises(TypeError):
+            self.game.votes[1]["p1"] = "p2_p1"
+        with pytest.raises(AttributeError):
+            self.game.round_pairings[1]["p1"].append("host")
+        with pytest.raises(AttributeError):
+            self.game.voted_players[1].add("p2")
+        with pytest.raises(AttributeError):
+            self.game.bribes = {}
+        assert round_state.submissions["p1"]["p2"]["content"] == "bribe"
+        assert round_state.votes == {}
+
+    def test_reset_to_lobby_clears_every_round(self):
+        """Restart and return-to-lobby share one reset that drops all round data"""
+        self.game.state = "scoreboard"
+        self.game.current_round = 2
+        self.game.start_round(1).prompts["p1"] = "Old prompt"
+        self.game.start_round(2).voted_players.add("p1")
+        self.game.scores = {"host": 2, "p1": 1, "p2": 0}
+
+        self.game.reset_to_lobby()
+
+        assert self.game.state == "lobby"
+        assert self.game.current_round == 0
+        assert self.game.current is None
+        assert self.game.past_rounds == []
+        assert self.game.player_prompts == {}
+        assert self.game.voted_players == {}
+        assert self.game.scores == {"host": 0, "p1": 0, "p2": 0}
+
+    def test_release_frees_round_data(self):
+        """Releasing a round empties all of its containers"""
+        round_state = RoundState(1)
+        round_state.submissions["p1"] = {"p2": {"content": "x", "type": "text"}}
+        round_state.voted_players.add("p1")
+        round_state.release()
+        assert round_state.is_empty()
+
+
+class TestBribeInbox:
+    """Test the per-round inbox of bribes indexed by target"""
+
+    def test_add_submission_writes_inbox(self):
+        """Each submission is reachable from both the submitter and the target"""
+        round_state = RoundState(1)
+        bribe = {"content": "cake", "type": "text", "is_random": False}
+        round_state.add_submission("p1", "p2", bribe)
+        round_state.add_submission("p3", "p2", {"content": "pie", "type": "text"})
+
+        assert round_state.submissions["p1"]["p2"] is bribe
+        assert round_state.bribes_for("p2")["p1"] is bribe
+        assert list(round_state.bribes_for("p2")) == ["p1", "p3"]
+        assert round_state.bribes_for("p1") == {}
+
+    def test_resubmission_replaces_inbox_entry(self):
+        """Submitting to the same target again replaces the earlier bribe"""
+        round_state = RoundState(1)
+        round_state.add_submission("p1", "p2", {"content": "first", "type": "text"})
+        round_state.add_submission("p1", "p2", {"content": "second", "type": "text"})
+        assert len(round_state.bribes_for("p2")) == 1
+        assert round_state.bribes_for("p2")["p1"]["content"] == "second"
+
+class TestFrozenResults:
+    """The round_results payload is kept for reconnecting players"""
+
+    def setup_method(self):
+        self.game = Game("TEST", "p1", {'rounds': 2, 'results_time': 0})
+        for pid in ["p1", "p2", "p3"]:
+            self.game.add_player(pid, pid.upper())
+        self.game.current_round = 1
+        self.round_state = self.game.start_round(1)
+        self.round_state.add_submission("p2", "p1", {"content": "a", "type": "text", "is_random": False})
+        self.round_state.record_vote("p1", "p2_p1", "p2", "p1", 1)
+
+    def end_voting(self, mock_socketio):
+        with patch('src.web.socket_handlers.game_flow.socketio', mock_socketio), \
+                patch('src.web.socket_handlers.game_flow.game_manager', MagicMock()):
+            from src.web.socket_handlers.game_flow import end_voting_phase
+            end_voting_phase(self.game)
+
+    def test_results_are_read_only(self):
+        """Callers cannot change the frozen payload"""
+        self.round_state.freeze_results({'round': 1, 'scoreboard': [{'handle': 1}]})
+        results = self.game.get_round_results(1)
+        assert results is self.game.get_round_results(1)
+        with pytest.raises(TypeError):
+            results['round'] = 2
+        with pytest.raises(TypeError):
+            results['scoreboard'][0]['handle'] = 2
+        assert results == {'round': 1, 'scoreboard': ({'handle': 1},)}
+        assert self.game.get_round_results(2) is None
+
+    def test_end_voting_phase_freezes_payload(self):
+        """The broadcast payload is exactly what gets replayed"""
+        mock_socketio = MagicMock()
+        self.end_voting(mock_socketio)
+        sent = mock_socketio.emit.call_args_list[0][0][1]
+        assert self.game.get_round_results(1) == sent
+
+    def test_reconnect_during_scoreboard_replays_results(self):
+        """A player reconnecting to the scoreboard gets the full results"""
+        mock_socketio = MagicMock()
+        self.end_voting(mock_socketio)
+        sent = mock_socketio.emit.call_args_list[0][0][1]
+
+        replay_socketio = MagicMock()
+        with patch('src.web.socket_handlers.game_flow.socketio', replay_socketio), \
+                patch('src.web.socket_handlers.game_flow.game_manager', MagicMock()):
+            from src.web.socket_handlers.game_flow import emit_midgame_joiner_state
+            emit_midgame_joiner_state(self.game, "p3")
+
+        assert replay_socketio.emit.call_count == 1
+        event, payload = replay_socketio.emit.call_args_list[0][0][:2]
+        assert event == 'round_results'
+        assert payload is sent
+        assert 'vote_results' in payload
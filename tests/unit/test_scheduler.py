@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the shared deadline scheduler
+"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.game.game import Game
+from src.game.scheduler import DeadlineScheduler, ScheduledCall
+from src.web.socket_handlers import game_flow
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def scheduler(clock):
+    # Never start the loop; tests drive pop_due() by hand
+    return DeadlineScheduler(clock=clock, start_task=lambda target, *args: None)
+
+
+class TestDeadlineOrdering:
+    """Test the heap of pending deadlines"""
+
+    def test_calls_come_due_in_deadline_order(self, scheduler, clock):
+        scheduler.call_later(5, print, 'late')
+        scheduler.call_later(1, print, 'early')
+        scheduler.call_later(1, print, 'early too')
+
+        assert scheduler.pop_due() == []
+        clock.now = 5
+        assert [call.args[0] for call in scheduler.pop_due()] == ['early', 'early too', 'late']
+        assert len(scheduler) == 0
+
+    def test_cancelled_calls_are_skipped(self, scheduler, clock):
+        first = scheduler.call_later(1, print, 'first')
+        scheduler.call_later(2, print, 'second')
+        first.cancel()
+
+        assert scheduler.next_deadline() == 2
+        clock.now = 2
+        assert [call.args[0] for call in scheduler.pop_due()] == ['second']
+
+    def test_negative_delay_is_due_now(self, scheduler, clock):
+        clock.now = 10
+        call = scheduler.call_later(-3, print)
+        assert call.deadline == 10
+        assert scheduler.pop_due() == [call]
+
+    def test_loop_started_once_while_busy(self, clock):
+        start_task = MagicMock()
+        scheduler = DeadlineScheduler(clock=clock, start_task=start_task)
+        for delay in range(100):
+            scheduler.call_later(delay, print)
+        start_task.assert_called_once()
+
+
+class TestSchedulerLoop:
+    """Test the background loop with real time"""
+
+    def test_runs_many_deadlines_on_one_loop(self):
+        scheduler = DeadlineScheduler(dispatch=lambda fn, *args: fn(*args))
+        fired = []
+        done = threading.Event()
+        threads_before = threading.active_count()
+
+        for i in range(200):
+            scheduler.call_later(0.01 + (i % 5) * 0.005, fired.append, i)
+        scheduler.call_later(0.05, done.set)
+        # One loop thread however many deadlines are waiting
+        assert threading.active_count() <= threads_before + 1
+
+        assert done.wait(2)
+        assert sorted(fired) == list(range(200))
+
+    def test_cancelled_call_never_runs(self):
+        scheduler = DeadlineScheduler()
+        fired = threading.Event()
+        done = threading.Event()
+        scheduler.call_later(0.02, fired.set).cancel()
+        scheduler.call_later(0.04, done.set)
+        assert done.wait(2)
+        assert not fired.is_set()
+
+    def test_failing_callback_does_not_stop_loop(self):
+        scheduler = DeadlineScheduler()
+        done = threading.Event()
+
+        def failing():
+            raise ValueError("boom")
+
+        scheduler.call_later(0.01, failing)
+        scheduler.call_later(0.03, done.set)
+        assert done.wait(2)
+
+    def test_loop_restarts_after_going_idle(self):
+        scheduler = DeadlineScheduler()
+        first, second = threading.Event(), threading.Event()
+        scheduler.call_later(0, first.set)
+        assert first.wait(2)
+        time.sleep(0.05)
+        scheduler.call_later(0, second.set)
+        assert second.wait(2)
+
+
+    def test_earlier_call_wakes_waiting_loop(self):
+        scheduler = DeadlineScheduler()
+        done = threading.Event()
+        late = scheduler.call_later(60, done.set)
+        time.sleep(0.02)
+        scheduler.call_later(0.01, done.set)
+        try:
+            assert done.wait(2)
+        finally:
+            late.cancel()
+
+    def test_loop_waits_until_the_deadline_in_one_go(self):
+        waits = []
+
+        class RecordingEvent(threading.Event):
+            def wait(self, timeout=None):
+                waits.append(timeout)
+                return super().wait(timeout)
+
+        scheduler = DeadlineScheduler(make_event=RecordingEvent)
+        done = threading.Event()
+        scheduler.call_later(0.2, done.set)
+        assert done.wait(2)
+        # No polling: one wait for the deadline, maybe a short one for clock jitter
+        assert 1 <= len(waits) <= 2
+        assert waits[0] > 0.1
+
+class TestGameFlowTimers:
+    """Test that phase timers are scheduler handles"""
+
+    def test_phase_timer_is_scheduled_call(self):
+        game = Game("TEST", "host", {'results_time': 10})
+        game.current_round = 1
+        game.start_round(1)
+        scheduler = DeadlineScheduler(start_task=lambda target, *args: None)
+        with patch.object(game_flow, 'scheduler', scheduler), \
+                patch.object(game_flow, 'socketio', MagicMock()):
+            game_flow.end_voting_phase(game)
+
+        assert isinstance(game.round_timer, ScheduledCall)
+        assert game.round_timer.callback is game_flow.run_game_command
+        assert game.round_timer.args == (game, game_flow.continue_or_end_game, game.phase_generation)
+
+        game.advance_phase()
+        assert game.round_timer is None
+        assert scheduler.next_deadline() is None
@@ -31,7 +31,7 @@ class TestVotingLogic:
         
         # Set up mock bribes for testing
         # Each player submits bribes to their targets
-        self.game.bribes[1] = {
+        self.set_bribes({
             "host1": {
                 "p1": {"content": "Host's bribe to P1", "type": "text"},
                 "p2": {"content": "Host's bribe to P2", "type": "text"}
@@ -48,7 +48,14 @@ class TestVotingLogic:
                 "host1": {"content": "P3's bribe to Host", "type": "text"},
                 "p1": {"content": "P3's bribe to P1", "type": "text"}
             }
-        }
+        })
+
+    def set_bribes(self, bribes):
+        """Start round 1 over with the given {submitter: {target: bribe}}"""
+        round_state = self.game.start_round(1)
+        for submitter_id, sent in bribes.items():
+            for target_id, bribe in sent.items():
+                round_state.add_submission(submitter_id, target_id, bribe)
 
     def test_player_cannot_vote_on_own_bribe(self):
         """Test that players don't receive their own bribes for voting"""
@@ -133,14 +140,14 @@ class TestVotingLogic:
     def test_no_bribes_case(self):
         """Test voting when player received no bribes"""
         # Create scenario where p1 received no bribes
-        self.game.bribes[1] = {
+        self.set_bribes({
             "host1": {
                 "p2": {"content": "Host's bribe to P2", "type": "text"}
             },
             "p2": {
                 "p3": {"content": "P2's bribe to P3", "type": "text"}
             }
-        }
+        })
         
         def get_bribes_for_player(player_id):
             bribes_for_player = []
@@ -162,7 +169,7 @@ class TestVotingLogic:
     def test_self_submission_completely_excluded(self):
         """Test that if player somehow submitted to themselves, it's excluded from voting"""
         # Create edge case where player submitted to themselves (shouldn't happen in normal flow)
-        self.game.bribes[1] = {
+        self.set_bribes({
             "p1": {
                 "p1": {"content": "P1's bribe to themselves", "type": "text"},  # Edge case
                 "p2": {"content": "P1's bribe to P2", "type": "text"}
@@ -170,7 +177,7 @@ class TestVotingLogic:
             "p2": {
                 "p1": {"content": "P2's bribe to P1", "type": "text"}
             }
-        }
+        })
         
         def get_bribes_for_player(player_id):
             bribes_for_player = []
@@ -199,10 +206,8 @@ class TestVotingLogic:
         self.game.players["p4"]["active_in_round"] = False
         
         # Add some bribes involving the inactive player
-        self.game.bribes[1]["p4"] = {
-            "p1": {"content": "P4's bribe to P1", "type": "text"}
-        }
-        self.game.bribes[1]["p1"]["p4"] = {"content": "P1's bribe to P4", "type": "text"}
+        self.game.current.add_submission("p4", "p1", {"content": "P4's bribe to P1", "type": "text"})
+        self.game.current.add_submission("p1", "p4", {"content": "P1's bribe to P4", "type": "text"})
         
         def get_bribes_for_player(player_id):
             bribes_for_player = []
@@ -14,6 +14,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'src'))
 
 from game.game import Game
+from tests.unit.game_mechanics import cast_votes, submit_bribes
 
 
 class TestSubmissionLogic:
@@ -30,18 +31,14 @@ class TestSubmissionLogic:
         
         # Set up round
         game.current_round = 1
-        game.bribes[1] = {}
+        round_state = game.start_round(1)
         
         # Submit bribe
         player_id = "p1"
         target_id = "p2"
         submission = {"content": "A funny meme about Player2", "type": "text"}
         
-        # Initialize player's submissions for this round
-        if player_id not in game.bribes[1]:
-            game.bribes[1][player_id] = {}
-        
-        game.bribes[1][player_id][target_id] = submission
+        round_state.add_submission(player_id, target_id, submission)
         
         # Verify storage structure
         assert game.bribes[1][player_id][target_id] == submission
@@ -56,25 +53,25 @@ class TestSubmissionLogic:
         game.add_player("p2", "Player2")
         
         game.current_round = 1
-        game.bribes[1] = {"p1": {}}
+        round_state = game.start_round(1)
         
         # Text submission
-        game.bribes[1]["p1"]["text_target"] = {
+        round_state.add_submission("p1", "text_target", {
             "content": "A witty joke about the target",
             "type": "text"
-        }
+        })
         
         # Image submission
-        game.bribes[1]["p1"]["image_target"] = {
+        round_state.add_submission("p1", "image_target", {
             "content": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQEAYABgAAD...",
             "type": "image"
-        }
+        })
         
         # Link submission
-        game.bribes[1]["p1"]["link_target"] = {
+        round_state.add_submission("p1", "link_target", {
             "content": "https://example.com/funny-gif.gif",
             "type": "link"
-        }
+        })
         
         # Verify all types are stored
         assert game.bribes[1]["p1"]["text_target"]["type"] == "text"
@@ -91,19 +88,18 @@ class TestSubmissionLogic:
         
         # Generate pairings (each player should get 2 targets)
         game.current_round = 1
-        game.round_pairings[1] = game.generate_round_pairings()
+        round_state = game.start_round(1)
+        round_state.pairings = game.generate_round_pairings()
         
         player_targets = game.round_pairings[1]["p1"]
         assert len(player_targets) == 2
         
         # Player submits to both targets
-        game.bribes[1] = {"p1": {}}
-        
         for target in player_targets:
-            game.bribes[1]["p1"][target] = {
+            round_state.add_submission("p1", target, {
                 "content": f"Bribe for {target}",
                 "type": "text"
-            }
+            })
         
         # Verify exactly 2 submissions
         assert len(game.bribes[1]["p1"]) == 2
@@ -163,10 +159,10 @@ class TestVotingLogic:
         
         # Set up bribes submitted TO player p1
         game.current_round = 1
-        game.bribes[1] = {
+        submit_bribes(game.start_round(1), {
             "p2": {"p1": {"content": "Bribe from p2 to p1", "type": "text"}},
             "p3": {"p1": {"content": "Bribe from p3 to p1", "type": "text"}}
-        }
+        })
         
         # Generate voting options for p1
         voting_options = self._get_voting_options_for_player(game, "p1")
@@ -194,10 +190,10 @@ class TestVotingLogic:
         
         # Set up bribes
         game.current_round = 1
-        game.bribes[1] = {
+        submit_bribes(game.start_round(1), {
             "p2": {"p1": {"content": "Secret bribe from p2", "type": "text"}},
             "p3": {"p1": {"content": "Secret bribe from p3", "type": "text"}}
-        }
+        })
         
         # Get voting options (this simulates what the UI would show)
         voting_options = self._get_voting_options_for_player(game, "p1")
@@ -220,17 +216,17 @@ class TestVotingLogic:
         game.add_player("p3", "Player3")
         
         game.current_round = 1
-        game.votes[1] = {}
+        round_state = game.start_round(1)
         
         # Player p1 votes
-        game.votes[1]["p1"] = "p2_p1"  # p1 votes for p2's bribe
+        game.record_vote(round_state, "p1", "p2_p1")  # p1 votes for p2's bribe
         
         # Verify single vote recorded
         assert len(game.votes[1]) == 1
         assert game.votes[1]["p1"] == "p2_p1"
         
         # If player tries to vote again, it should overwrite (not add)
-        game.votes[1]["p1"] = "p3_p1"  # p1 changes vote to p3's bribe
+        game.record_vote(round_state, "p1", "p3_p1")  # p1 changes vote to p3's bribe
         
         assert len(game.votes[1]) == 1  # Still only one vote for p1
         assert game.votes[1]["p1"] == "p3_p1"  # Vote updated
@@ -245,11 +241,11 @@ class TestVotingLogic:
         
         # Set up votes
         game.current_round = 1
-        game.votes[1] = {
+        cast_votes(game, game.start_round(1), {
             "p1": "p2_p1",  # p1 votes for p2's bribe to p1
             "p2": "p3_p2",  # p2 votes for p3's bribe to p2
             "p3": "p2_p3"   # p3 votes for p2's bribe to p3
-        }
+        })
         
         # Calculate vote results
         vote_results = self._calculate_vote_results(game)
@@ -340,7 +336,7 @@ class TestTimerAndCompletionLogic:
         timer_cancelled = False
         
         # Check if all submissions are complete
-        game.bribes[1] = {
+        submit_bribes(game.start_round(1), {
             "p1": {
                 "p2": {"content": "bribe1", "type": "text"},
                 "p3": {"content": "bribe2", "type": "text"}
@@ -353,7 +349,7 @@ class TestTimerAndCompletionLogic:
                 "p1": {"content": "bribe5", "type": "text"},
                 "p2": {"content": "bribe6", "type": "text"}
             }
-        }
+        })
         
         # All submissions complete - timer should be cancelled
         if self._all_submissions_complete(game):
@@ -373,13 +369,13 @@ class TestTimerAndCompletionLogic:
         game.state = "submission"
         
         # Only partial submissions
-        game.bribes[1] = {
+        submit_bribes(game.start_round(1), {
             "p1": {
                 "p2": {"content": "only one bribe", "type": "text"}
                 # Missing second bribe
             }
             # p2 and p3 haven't submitted anything
-        }
+        })
         
         # Simulate timer expiry
         timer_expired = True
@@ -404,7 +400,7 @@ class TestTimerAndCompletionLogic:
         game.current_round = 1
         
         # Scenario 1: Some players submit both bribes, others submit partial/none
-        game.bribes[1] = {
+        submit_bribes(game.start_round(1), {
             "p1": {  # Complete submissions
                 "p2": {"content": "p1 to p2", "type": "text"},
                 "p3": {"content": "p1 to p3", "type": "text"}
@@ -418,7 +414,7 @@ class TestTimerAndCompletionLogic:
                 "p4": {"content": "p3 to p4", "type": "text"}
             }
             # p4 hasn't submitted anything
-        }
+        })
         
         # Calculate completion percentage
         total_expected = len(game.players) * 2  # 4 players * 2 bribes each = 8
@@ -67,7 +67,7 @@ class TestUniqueBribeTargets(unittest.TestCase):
         for round_num in range(1, 4):
             self.game.current_round = round_num
             pairings = self.game.generate_round_pairings()
-            self.game.round_pairings[round_num] = pairings
+            self.game.start_round(round_num).pairings = pairings
             
             for player_id, targets in pairings.items():
                 if player_id not in all_targets:
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for playing timed games on a virtual clock
+"""
+
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.game.scheduler import VirtualScheduler
+from src.web.socket_handlers import game_flow
+
+
+@pytest.fixture
+def virtual():
+    return VirtualScheduler(start=1000.0)
+
+
+@pytest.fixture(autouse=True)
+def game_manager():
+    with patch.object(game_flow, 'game_manager', MagicMock()) as manager:
+        yield manager
+
+
+@pytest.fixture
+def timed_game(make_game):
+    def build(scheduler, rounds=3):
+        return make_game("TIMED", ["p1", "p2", "p3", "p4"], {
+            'rounds': rounds,
+            'submission_time': 600,
+            'voting_time': 600,
+            'results_time': 600,
+            'custom_prompts': False
+        }, scheduler=scheduler, clock=scheduler.clock)
+    return build
+
+
+class TestVirtualScheduler:
+    """Test jumping between deadlines"""
+
+    def test_run_next_jumps_to_deadline(self, virtual):
+        fired = []
+        virtual.call_later(3600, lambda: fired.append(virtual.clock()))
+        assert virtual.run_next()
+        assert fired == [4600.0]
+        assert not virtual.run_next()
+
+    def test_advance_runs_due_calls_in_order(self, virtual):
+        fired = []
+        virtual.call_later(5, fired.append, 'b')
+        virtual.call_later(1, fired.append, 'a')
+        virtual.call_later(50, fired.append, 'c')
+        assert virtual.advance(10) == 2
+        assert fired == ['a', 'b']
+        assert virtual.clock() == 1010.0
+
+    def test_callbacks_can_schedule_more_work(self, virtual):
+        fired = []
+
+        def tick(n):
+            fired.append(n)
+            if n < 5:
+                virtual.call_later(60, tick, n + 1)
+
+        virtual.call_later(60, tick, 1)
+        assert virtual.run_until_idle() == 5
+        assert fired == [1, 2, 3, 4, 5]
+        assert virtual.clock() == 1300.0
+
+    def test_callback_errors_propagate(self, virtual):
+        def failing():
+            raise ValueError("boom")
+
+        virtual.call_later(1, failing)
+        with pytest.raises(ValueError):
+            virtual.run_next()
+
+
+class TestSimulatedGames:
+    """Test whole timed games played in virtual time"""
+
+    def test_timed_game_plays_out_without_waiting(self, virtual, mock_socketio, timed_game):
+        game = timed_game(virtual)
+        assert game.created_at == 1000.0
+
+        started = time.monotonic()
+        game_flow.start_next_round(game)
+        virtual.run_until_idle()
+
+        assert game.state == "finished"
+        # Three rounds of three ten-minute phases
+        assert virtual.clock() >= 1000.0 + 3 * 3 * 600
+        assert time.monotonic() - started < 5
+        events = [c[0][0] for c in mock_socketio.emit.call_args_list]
+        assert events.count('round_results') == 3
+        assert events.count('game_finished') == 1
+
+    def test_last_vote_racing_the_timer_ends_voting_once(self, virtual, mock_socketio, timed_game):
+        game = timed_game(virtual, rounds=1)
+        game_flow.start_next_round(game)
+        virtual.run_next()  # Submission deadline, voting opens
+        assert game.state == "voting"
+
+        # The voting timer falls due at the same instant the last vote is handled
+        virtual.clock.now = virtual.next_deadline()
+        game_flow.end_voting_phase(game, game.phase_generation)
+        virtual.run_due()
+
+        events = [c[0][0] for c in mock_socketio.emit.call_args_list]
+        assert events.count('round_results') == 1
+        assert game.state == "scoreboard"
+
+    def test_games_can_use_the_module_scheduler(self, virtual, mock_socketio, timed_game):
+        game = timed_game(virtual)
+        game.scheduler = None
+        with patch.object(game_flow, 'scheduler', virtual):
+            assert game_flow.scheduler_for(game) is virtual
+            game_flow.start_next_round(game)
+        assert game.round_timer is not None
+        assert virtual.next_deadline() == virtual.clock() + 600